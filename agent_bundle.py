@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Compiled Agent Bundle for watsonx Orchestrate ADK
+Compiles agents/*.yaml and the @tool signatures in tools/*.py into one
+versioned, content-addressed binary file that loads with a single read,
+and falls back to the source files whenever the bundle is stale
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import marshal
+import os
+import struct
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+from tool_signatures import ToolSignature, extract_tool_signatures
+
+DEFAULT_BUNDLE = Path("build") / "agents.bundle"
+
+# Fixed-size header followed by a marshal payload. The payload starts at a
+# known offset, so the file can be read in one call or mapped with mmap.
+MAGIC = b"WXOB"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sH2x4s32sQ")   # magic, version, python magic, digest, payload size
+
+
+class BundleError(Exception):
+    """Raised when a bundle file is missing, corrupt or from another format/Python."""
+
+
+@dataclass
+class AgentSet:
+    """Everything consumers need from agents/ and tools/, parsed and resolved."""
+    agents: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    agent_paths: Dict[str, str] = field(default_factory=dict)
+    tools: Dict[str, ToolSignature] = field(default_factory=dict)
+    tool_files: Dict[str, List[str]] = field(default_factory=dict)
+    graph: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)
+    digest: str = ""
+    origin: str = "sources"   # 'bundle' or 'sources'
+
+
+def _scan(directory: str, suffixes) -> Dict[str, os.DirEntry]:
+    """Source files in ``directory`` keyed by absolute path; one directory read, no per-file resolve."""
+    base = Path(directory).resolve()
+    try:
+        with os.scandir(base) as entries:
+            return {os.path.join(base, e.name): e for e in entries if e.name.endswith(suffixes) and e.is_file()}
+    except FileNotFoundError:
+        return {}
+
+
+def _source_entries(agents_dir: str, tools_dir: str) -> Dict[str, os.DirEntry]:
+    entries = _scan(agents_dir, (".yaml", ".yml"))
+    entries.update(_scan(tools_dir, (".py",)))
+    return dict(sorted(entries.items()))
+
+
+def _manifest(entries: Dict[str, os.DirEntry]) -> Dict[str, List[int]]:
+    """``{absolute path: [size, mtime_ns]}`` — cheap to recompute with stat alone."""
+    manifest = {}
+    for key, entry in entries.items():
+        stat = entry.stat()
+        manifest[key] = [stat.st_size, stat.st_mtime_ns]
+    return manifest
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def content_digest(hashes: Dict[str, str]) -> bytes:
+    """Digest of the bundle's sources by file name and content, independent of location and mtimes."""
+    digest = hashlib.sha256(f"format-{FORMAT_VERSION}".encode("utf-8"))
+    for name, file_hash in sorted((Path(p).parent.name + "/" + Path(p).name, h) for p, h in hashes.items()):
+        digest.update(f"{name}\0{file_hash}\n".encode("utf-8"))
+    return digest.digest()
+
+
+def resolve_graph(agents: Dict[str, Dict[str, Any]], tools: Dict[str, ToolSignature]) -> Dict[str, Dict[str, List[str]]]:
+    """Each agent's collaborators and tools, with references to unknown names split out."""
+    graph = {}
+    for name, config in agents.items():
+        collaborators = list(config.get('collaborators') or [])
+        agent_tools = list(config.get('tools') or [])
+        graph[name] = {
+            "collaborators": collaborators,
+            "tools": agent_tools,
+            "missing_collaborators": [c for c in collaborators if c not in agents],
+            "missing_tools": [t for t in agent_tools if t not in tools],
+        }
+    return graph
+
+
+def load_sources(agents_dir: str = "agents", tools_dir: str = "tools") -> AgentSet:
+    """Parse the source files directly."""
+    agent_set = AgentSet()
+    for key in _source_entries(agents_dir, tools_dir):
+        path = Path(agents_dir if key.endswith((".yaml", ".yml")) else tools_dir) / os.path.basename(key)
+        if path.suffix == ".py":
+            signatures = extract_tool_signatures(path)
+            agent_set.tools.update(signatures)
+            agent_set.tool_files[str(path)] = sorted(signatures)
+            continue
+        with open(path, 'r', encoding='utf-8') as file:
+            config = yaml.safe_load(file) or {}
+        if config.get('name'):
+            agent_set.agents[config['name']] = config
+            agent_set.agent_paths[config['name']] = str(path)
+    agent_set.graph = resolve_graph(agent_set.agents, agent_set.tools)
+    return agent_set
+
+
+def _unmarshallable(value: Any, key: str = "") -> Optional[str]:
+    """Dotted key of the first value marshal cannot store (e.g. a YAML date), if any."""
+    if isinstance(value, dict):
+        for name, item in value.items():
+            found = _unmarshallable(item, f"{key}.{name}" if key else str(name))
+            if found:
+                return found
+        return None
+    if isinstance(value, (list, tuple)):
+        for index, item in enumerate(value):
+            found = _unmarshallable(item, f"{key}[{index}]")
+            if found:
+                return found
+        return None
+    if value is None or isinstance(value, (str, bytes, bool, int, float, complex)):
+        return None
+    return f"{key} ({type(value).__name__})"
+
+
+def compile_bundle(agents_dir: str = "agents", tools_dir: str = "tools",
+                   output: Path = DEFAULT_BUNDLE) -> AgentSet:
+    """
+    Parse the sources and write them to ``output`` as one bundle
+
+    Returns:
+        The compiled AgentSet, with its content digest set
+
+    Raises:
+        BundleError: If an agent holds a value marshal cannot store
+    """
+    entries = _source_entries(agents_dir, tools_dir)
+    agent_set = load_sources(agents_dir, tools_dir)
+    hashes = {key: _file_digest(Path(key)) for key in entries}
+    digest = content_digest(hashes)
+    agent_set.digest = digest.hex()
+
+    for name, config in agent_set.agents.items():
+        key = _unmarshallable(config)
+        if key:
+            raise BundleError(f"Cannot bundle {agent_set.agent_paths[name]}: unsupported value at {key}; "
+                              f"quote it in the YAML to keep it as a string")
+
+    # File paths are stored by name only and joined with the directories
+    # given at load time, so they stay valid from any working directory
+    _write_bundle(Path(output), digest, {
+        "agents_dir": str(Path(agents_dir).resolve()),
+        "tools_dir": str(Path(tools_dir).resolve()),
+        "manifest": _manifest(entries),
+        "hashes": hashes,
+        "agents": agent_set.agents,
+        "agent_files": {name: os.path.basename(path) for name, path in agent_set.agent_paths.items()},
+        "tools": {name: asdict(signature) for name, signature in agent_set.tools.items()},
+        "tool_files": {os.path.basename(path): names for path, names in agent_set.tool_files.items()},
+        "graph": agent_set.graph,
+    })
+    return agent_set
+
+
+def _write_bundle(output: Path, digest: bytes, payload: Dict[str, Any]) -> None:
+    data = marshal.dumps(payload)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, importlib.util.MAGIC_NUMBER, digest, len(data))
+    temporary = output.with_name(f"{output.name}.{os.getpid()}.tmp")
+    temporary.write_bytes(header + data)
+    os.replace(temporary, output)   # readers never see a half-written bundle
+
+
+def read_bundle(path: Path = DEFAULT_BUNDLE) -> Dict[str, Any]:
+    """Read and decode a bundle with a single read; raise BundleError if unusable."""
+    try:
+        data = Path(path).read_bytes()
+    except OSError as e:
+        raise BundleError(f"Cannot read bundle {path}: {e}")
+    if len(data) < HEADER.size:
+        raise BundleError(f"Bundle {path} is truncated")
+    magic, version, python_magic, digest, size = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise BundleError(f"{path} is not an agent bundle")
+    if version != FORMAT_VERSION:
+        raise BundleError(f"Bundle format {version} is not supported (expected {FORMAT_VERSION})")
+    if python_magic != importlib.util.MAGIC_NUMBER:
+        raise BundleError("Bundle was compiled by a different Python version")
+    if len(data) != HEADER.size + size:
+        raise BundleError(f"Bundle {path} is truncated")
+    try:
+        payload = marshal.loads(memoryview(data)[HEADER.size:])
+    except (EOFError, ValueError, TypeError) as e:
+        raise BundleError(f"Bundle {path} is corrupt: {e}")
+    payload["digest"] = digest.hex()
+    return payload
+
+
+def _current_manifest(payload: Dict[str, Any], agents_dir: str, tools_dir: str) -> Optional[Dict[str, List[int]]]:
+    """The sources' manifest if the bundle describes exactly their content, else None."""
+    if payload["agents_dir"] != str(Path(agents_dir).resolve()) or \
+            payload["tools_dir"] != str(Path(tools_dir).resolve()):
+        return None
+    current = _manifest(_source_entries(agents_dir, tools_dir))
+    if current.keys() != payload["manifest"].keys():
+        return None
+    for key, stat in current.items():
+        if stat != payload["manifest"][key] and _file_digest(Path(key)) != payload["hashes"][key]:
+            return None
+    return current
+
+
+def is_fresh(payload: Dict[str, Any], agents_dir: str = "agents", tools_dir: str = "tools") -> bool:
+    """
+    True when the bundle describes exactly the current source files
+
+    Sizes and mtimes are compared first; a file whose stat changed but
+    whose content hash did not (e.g. after a fresh checkout) still counts.
+    """
+    return _current_manifest(payload, agents_dir, tools_dir) is not None
+
+
+def _refresh_manifest(bundle: Path, payload: Dict[str, Any], manifest: Dict[str, List[int]]) -> None:
+    """Store new stats for sources whose content matched, so later loads skip hashing them."""
+    body = {key: value for key, value in payload.items() if key != "digest"}
+    body["manifest"] = manifest
+    try:
+        _write_bundle(Path(bundle), bytes.fromhex(payload["digest"]), body)
+    except OSError:
+        pass    # read-only checkout: the bundle stays valid, just slower to check
+
+
+def load_agent_set(agents_dir: str = "agents", tools_dir: str = "tools",
+                   bundle: Optional[Path] = DEFAULT_BUNDLE) -> AgentSet:
+    """
+    The agent set from the bundle when it is fresh, otherwise from the sources
+
+    Args:
+        agents_dir: Directory with agent YAML files
+        tools_dir: Directory with Python tool files
+        bundle: Bundle path, or None to always read the sources
+    """
+    if bundle is not None:
+        try:
+            payload = read_bundle(bundle)
+        except BundleError:
+            payload = None
+        manifest = _current_manifest(payload, agents_dir, tools_dir) if payload is not None else None
+        if manifest is not None:
+            if manifest != payload["manifest"]:
+                _refresh_manifest(bundle, payload, manifest)
+            return AgentSet(
+                agents=payload["agents"],
+                agent_paths={name: str(Path(agents_dir) / file) for name, file in payload["agent_files"].items()},
+                tools={name: ToolSignature(**signature) for name, signature in payload["tools"].items()},
+                tool_files={str(Path(tools_dir) / file): names for file, names in payload["tool_files"].items()},
+                graph=payload["graph"],
+                digest=payload["digest"],
+                origin="bundle",
+            )
+    return load_sources(agents_dir, tools_dir)
+
+
+def load_agents(agents_dir: str = "agents", bundle: Optional[Path] = DEFAULT_BUNDLE) -> Dict[str, Dict[str, Any]]:
+    """Agent configs by name; shortcut for consumers that only need agents/."""
+    return load_agent_set(agents_dir, bundle=bundle).agents
+
+
+def print_summary(agent_set: AgentSet, seconds: float) -> None:
+    print(f"📦 {len(agent_set.agents)} agents, {len(agent_set.tools)} tools "
+          f"(from {agent_set.origin}, {seconds * 1e3:.2f} ms)")
+    if agent_set.digest:
+        print(f"   digest: {agent_set.digest}")
+    for name, node in agent_set.graph.items():
+        for kind in ("missing_collaborators", "missing_tools"):
+            if node[kind]:
+                print(f"⚠️  {name}: unknown {kind.split('_')[1][:-1]}(s) {node[kind]}")
+
+
+def main():
+    """Main function to build or inspect the agent bundle"""
+    parser = argparse.ArgumentParser(
+        description="Compile agents/ and tools/ into one fast-loading bundle",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python agent_bundle.py build
+  python agent_bundle.py check        # exit 1 if the bundle is stale or missing
+  python agent_bundle.py show
+  python agent_bundle.py build --output /tmp/agents.bundle
+        """
+    )
+    parser.add_argument('command', choices=['build', 'check', 'show'], help='What to do')
+    parser.add_argument('--agents-dir', default='agents', help='Directory with agent YAML files')
+    parser.add_argument('--tools-dir', default='tools', help='Directory with Python tool files')
+    parser.add_argument('--output', default=str(DEFAULT_BUNDLE), help=f'Bundle path (default: {DEFAULT_BUNDLE})')
+
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.command == 'build':
+        try:
+            agent_set = compile_bundle(args.agents_dir, args.tools_dir, Path(args.output))
+        except BundleError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print_summary(agent_set, time.perf_counter() - start)
+        print(f"✅ Wrote {args.output} ({Path(args.output).stat().st_size:,} bytes)")
+        return
+
+    if args.command == 'check':
+        try:
+            fresh = is_fresh(read_bundle(Path(args.output)), args.agents_dir, args.tools_dir)
+        except BundleError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print("✅ Bundle is fresh" if fresh else "⚠️  Bundle is stale; run: python agent_bundle.py build")
+        sys.exit(0 if fresh else 1)
+
+    agent_set = load_agent_set(args.agents_dir, args.tools_dir, Path(args.output))
+    print_summary(agent_set, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
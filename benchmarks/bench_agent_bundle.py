@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark for agent_bundle.py
+
+For synthetic agent sets of growing size, compares parsing agents/*.yaml
+and tools/*.py directly against loading the compiled bundle, both with
+the freshness check consumers run (stat per source file) and as a bare
+decode of the single bundle read.
+
+Examples:
+  python benchmarks/bench_agent_bundle.py
+  python benchmarks/bench_agent_bundle.py --agents 10 500 5000 --repeat 3
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tests" / "perf"))
+
+import synthetic  # noqa: E402
+from agent_bundle import compile_bundle, load_agent_set, load_sources, read_bundle  # noqa: E402
+
+TOOL_COUNT = 50
+
+
+def median_ms(fn, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - start)
+    return statistics.median(runs) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--agents", type=int, nargs="+", default=[10, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'agents':>7}{'sources ms':>12}{'compile ms':>12}{'bundle ms':>11}{'decode ms':>11}"
+          f"{'speedup':>9}{'size KB':>9}")
+    for count in args.agents:
+        with tempfile.TemporaryDirectory() as tmp:
+            agents, tools, bundle = Path(tmp) / "agents", Path(tmp) / "tools", Path(tmp) / "agents.bundle"
+            synthetic.write_tools(tools, TOOL_COUNT)
+            synthetic.write_agents(agents, count, tool_count=TOOL_COUNT)
+
+            sources = median_ms(lambda: load_sources(str(agents), str(tools)), args.repeat)
+            compiled = median_ms(lambda: compile_bundle(str(agents), str(tools), bundle), 1)
+            loaded = median_ms(lambda: load_agent_set(str(agents), str(tools), bundle), args.repeat)
+            decoded = median_ms(lambda: read_bundle(bundle), args.repeat)
+            assert load_agent_set(str(agents), str(tools), bundle).origin == "bundle"
+
+            print(f"{count:>7}{sources:>12.2f}{compiled:>12.2f}{loaded:>11.2f}{decoded:>11.2f}"
+                  f"{sources / loaded:>8.1f}x{bundle.stat().st_size / 1024:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Call-overhead benchmark for the calculator tool precision modes
+
+Compares the precision-aware tools in tools/calculator_tool.py against a
+replica of the original float-only tools, wrapped the same way with @tool.
+
+Two numbers are reported per case:
+  * bare call  - the Python call alone, which exposes the few type checks
+                 the fast path adds on top of a single float operation
+  * invocation - JSON arguments in, JSON result out, which is how the tool
+                 runtime actually calls a Python tool
+
+The fast path and explicit float mode each add a few checks to what was a
+single float operation, so a bare call is slower than the legacy tool
+(roughly 1.2x-2x, a few hundred nanoseconds); inside an invocation the
+JSON work hides most of it. Both ratios are reported for every gated case.
+The run fails if any case's bare-call ratio exceeds --tolerance, which
+catches a fast path that falls through to calculate(). Each case is timed
+in alternating runs with its legacy twin, so load that drifts during the
+run affects both sides alike.
+
+Examples:
+  python benchmarks/bench_calculator.py
+  python benchmarks/bench_calculator.py --number 500000 --repeat 9
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import timeit
+from pathlib import Path
+from typing import List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from ibm_watsonx_orchestrate.agent_builder.tools import tool  # noqa: E402
+
+from tools import calculator_tool  # noqa: E402
+
+
+@tool
+def legacy_add(a: float, b: float) -> float:
+    """
+    Add two numbers together (original float-only implementation).
+
+    :param a: The first number to add
+    :param b: The second number to add
+    :returns: The sum of a and b
+    """
+    return a + b
+
+
+@tool
+def legacy_multiply(a: float, b: float) -> float:
+    """
+    Multiply two numbers together (original float-only implementation).
+
+    :param a: The first number to multiply
+    :param b: The second number to multiply
+    :returns: The product of a and b
+    """
+    return a * b
+
+
+@tool
+def legacy_divide(a: float, b: float) -> float:
+    """
+    Divide the first number by the second number (original float-only implementation).
+
+    :param a: The dividend (number to be divided)
+    :param b: The divisor (number to divide by)
+    :returns: The quotient of a divided by b
+    """
+    if b == 0:
+        raise ValueError("Cannot divide by zero")
+    return a / b
+
+
+CASES = [
+    # (label, tool, args)
+    ("legacy float add(5.0, 3.0)", legacy_add, (5.0, 3.0)),
+    ("auto fast path add(5.0, 3.0)", calculator_tool.add, (5.0, 3.0)),
+    ("auto fast path add(5, 3)", calculator_tool.add, (5, 3)),
+    ("auto fast path multiply(2.5, 4)", calculator_tool.multiply, (2.5, 4)),
+    ("auto fast path divide(7.5, 2)", calculator_tool.divide, (7.5, 2)),
+    ("float mode add(0.1, 0.2)", calculator_tool.add, (0.1, 0.2, "float")),
+    ("auto exact add(0.1, 0.2)", calculator_tool.add, (0.1, 0.2)),
+    ("decimal divide(1, 3)", calculator_tool.divide, (1, 3, "decimal")),
+    ("fraction divide(1, 3)", calculator_tool.divide, (1, 3, "fraction")),
+    ("bigint multiply(10**30, 3)", calculator_tool.multiply, (10**30, 3)),
+]
+
+# Fast path and float mode cases gated against the legacy tool for the same
+# operation and operands: (tool, legacy tool, operands, extra tool args)
+GATED = [
+    (calculator_tool.add, legacy_add, (5.0, 3.0), ()),
+    (calculator_tool.add, legacy_add, (5, 3), ()),
+    (calculator_tool.multiply, legacy_multiply, (2.5, 4), ()),
+    (calculator_tool.divide, legacy_divide, (7.5, 2), ()),
+    (calculator_tool.add, legacy_add, (0.1, 0.2), ("float",)),
+    (calculator_tool.divide, legacy_divide, (0.1, 0.2), ("float",)),
+]
+
+
+def bench(fn, number: int, repeat: int) -> float:
+    """Median nanoseconds per call over ``repeat`` timing runs."""
+    runs = timeit.Timer(fn).repeat(repeat=repeat, number=number)
+    return statistics.median(runs) / number * 1e9
+
+
+def paired_ratios(fn, baseline, number: int, repeat: int) -> List[float]:
+    """fn/baseline time ratios over ``repeat`` alternating timing runs."""
+    timer, base_timer = timeit.Timer(fn), timeit.Timer(baseline)
+    ratios = []
+    for _ in range(repeat):
+        base = base_timer.timeit(number)
+        ratios.append(timer.timeit(number) / base)
+    return ratios
+
+
+def invocation(tool_fn, args):
+    """Build a callable that mimics one runtime tool invocation."""
+    params = list(tool_fn.__tool_spec__.input_schema.properties)
+    payload = json.dumps(dict(zip(params, args)))
+    return lambda: json.dumps(tool_fn(**json.loads(payload)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark calculator tool precision modes")
+    parser.add_argument("--number", type=int, default=50_000, help="Calls per timing run")
+    parser.add_argument("--repeat", type=int, default=7, help="Timing runs per case (median is reported)")
+    parser.add_argument(
+        "--tolerance", type=float, default=2.5,
+        help="Fail if a bare fast-path or float-mode call costs more than this factor of a legacy one",
+    )
+    args = parser.parse_args()
+
+    legacy_label = CASES[0][0]
+    bare, invoked = {}, {}
+    print(f"{'case':<34}{'bare ns':>10}{'ratio':>8}{'invoke ns':>12}{'ratio':>8}")
+    for label, tool_fn, call_args in CASES:
+        bare[label] = bench(lambda: tool_fn(*call_args), args.number, args.repeat)
+        invoked[label] = bench(invocation(tool_fn, call_args), args.number, args.repeat)
+        print(
+            f"{label:<34}{bare[label]:>10.1f}{bare[label] / bare[legacy_label]:>7.2f}x"
+            f"{invoked[label]:>12.1f}{invoked[label] / invoked[legacy_label]:>7.2f}x"
+        )
+
+    print("\nGated cases vs legacy float tool (median of paired runs):")
+    print(f"  {'case':<32}{'bare':>8}{'invoke':>9}")
+    worst = 0.0
+    for tool_fn, legacy_fn, operands, extra in GATED:
+        call_args = operands + extra
+        bare_ratio = statistics.median(paired_ratios(
+            lambda: tool_fn(*call_args), lambda: legacy_fn(*operands), args.number, args.repeat))
+        invoke_ratio = statistics.median(paired_ratios(
+            invocation(tool_fn, call_args), invocation(legacy_fn, operands), args.number, args.repeat))
+        worst = max(worst, bare_ratio)
+        print(f"  {tool_fn.__tool_spec__.name + str(call_args):<32}{bare_ratio:>7.2f}x{invoke_ratio:>8.2f}x")
+
+    if worst > args.tolerance:
+        print(f"\n❌ A bare call costs {worst:.2f}x the legacy float tool (limit {args.tolerance}x)")
+        sys.exit(1)
+    print(f"\n✅ Bare calls cost at most {worst:.2f}x the legacy float tool (limit {args.tolerance}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for context_store.py
+
+Replays long synthetic sessions through the orchestrator and the
+collaborator it would route to, and compares the prompt each model call
+receives with unbounded history against the bounded store configured from
+agents/*.yaml. Prefill latency is estimated from --prefill-tps because no
+model is called; the store's own overhead is measured.
+
+Examples:
+  python benchmarks/bench_context_store.py
+  python benchmarks/bench_context_store.py --turns 50 200 1000 --budget 3000
+  python benchmarks/bench_context_store.py --prefill-tps 1500
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from context_store import ContextPolicy, ConversationStore, load_policies  # noqa: E402
+from prompt_footprint import estimate_tokens  # noqa: E402
+
+WORDS = ("please the of number result value agent orchestrate session history token budget "
+         "watsonx model prompt answer question context latency").split()
+
+
+def synthetic_session(turns: int, seed: int = 0):
+    """Yield (user_message, collaborator) pairs in the orchestrator's routing mix."""
+    rng = random.Random(seed)
+    for _ in range(turns):
+        kind = rng.random()
+        if kind < 0.2:
+            yield "hello there", "greeting_agent"
+        elif kind < 0.6:
+            yield f"what is {rng.randint(1, 999)} plus {rng.randint(1, 999)}", "calculator_agent"
+        else:
+            yield " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 80))), "echo_agent"
+
+
+def instruction_tokens():
+    tokens = {}
+    for path in sorted((ROOT / "agents").glob("*.yaml")):
+        config = yaml.safe_load(path.read_text(encoding="utf-8"))
+        tokens[config["name"]] = estimate_tokens(config.get("instructions") or "")
+    return tokens
+
+
+def replay(store: ConversationStore, turns: int, instructions):
+    """Return per-turn prompt tokens (orchestrator + collaborator) and store seconds."""
+    prompts, store_seconds = [], 0.0
+    for message, collaborator in synthetic_session(turns):
+        start = time.perf_counter()
+        store.append("s", "user", message)
+        orchestrator = store.context_for("s", "orchestrator_agent")
+        delegated = store.context_for("s", collaborator)
+        store_seconds += time.perf_counter() - start
+
+        prompt = instructions["orchestrator_agent"] + sum(estimate_tokens(m["content"]) for m in orchestrator)
+        prompt += instructions[collaborator] + sum(estimate_tokens(m["content"]) for m in delegated)
+        prompts.append(prompt)
+
+        start = time.perf_counter()
+        store.append("s", "assistant", f"The {collaborator} answered: {message}", collaborator)
+        store_seconds += time.perf_counter() - start
+    return prompts, store_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, nargs="+", default=[20, 100, 500])
+    parser.add_argument("--budget", type=int, default=4000, help="Session token budget for the bounded store")
+    parser.add_argument("--prefill-tps", type=float, default=2000.0,
+                        help="Assumed prefill throughput (tokens/s) used to estimate latency")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    instructions = instruction_tokens()
+    policies = load_policies(str(ROOT / "agents"))
+    unbounded_policies = {name: ContextPolicy() for name in policies}
+
+    print(f"{'turns':>6}{'store':>11}{'last prompt':>13}{'mean prompt':>13}{'total prefill':>15}"
+          f"{'est. prefill s':>16}{'store µs/turn':>15}")
+    for turns in args.turns:
+        for label, make in (
+            ("unbounded", lambda: ConversationStore(token_budget=10**12, policies=unbounded_policies)),
+            ("bounded", lambda: ConversationStore(token_budget=args.budget, policies=policies)),
+        ):
+            timings = []
+            for _ in range(args.repeat):
+                prompts, seconds = replay(make(), turns, instructions)
+                timings.append(seconds)
+            total = sum(prompts)
+            print(f"{turns:>6}{label:>11}{prompts[-1]:>13,}{statistics.mean(prompts):>13,.0f}{total:>15,}"
+                  f"{total / args.prefill_tps:>16.1f}{statistics.median(timings) / turns * 1e6:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Throughput and peak-RSS benchmark for tools/dataset_tool.py
+
+Generates synthetic float64, float32 and CSV files of the requested size,
+then aggregates each one in a fresh child process so that the reported
+peak RSS belongs to that run alone.
+
+Examples:
+  python benchmarks/bench_dataset.py                  # 256 MB per format
+  python benchmarks/bench_dataset.py --size-mb 4096   # multi-GB run
+  python benchmarks/bench_dataset.py --keep --dir /data/bench
+"""
+
+import argparse
+import array
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+FORMATS = ("f64", "f32", "csv")
+WRITE_BATCH = 1 << 18
+
+
+def generate(path: Path, fmt: str, size_bytes: int) -> None:
+    """Write roughly ``size_bytes`` of random values without holding them in memory."""
+    rng = random.Random(42)
+    written = 0
+    mode = "w" if fmt == "csv" else "wb"
+    with open(path, mode) as fp:
+        if fmt == "csv":
+            fp.write("id,value\n")
+        while written < size_bytes:
+            batch = [rng.gauss(1e6, 1e3) for _ in range(WRITE_BATCH)]
+            if fmt == "csv":
+                text = "".join(f"{i},{v!r}\n" for i, v in enumerate(batch))
+                fp.write(text)
+                written += len(text)
+            else:
+                arr = array.array("d" if fmt == "f64" else "f", batch)
+                arr.tofile(fp)
+                written += len(arr) * arr.itemsize
+
+
+def measure(path: str, fmt: str) -> dict:
+    """Aggregate one file and report timing; run inside the child process."""
+    from tools.dataset_tool import compute_stats
+
+    start = time.perf_counter()
+    stats = compute_stats(path, "value" if fmt == "csv" else "", fmt)
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return {
+        "format": fmt,
+        "bytes": os.path.getsize(path),
+        "values": stats.count,
+        "seconds": elapsed,
+        "peak_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dataset aggregation tools")
+    parser.add_argument("--size-mb", type=int, default=256, help="Approximate size of each generated file")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=list(FORMATS))
+    parser.add_argument("--dir", help="Directory for generated files (default: a temp dir)")
+    parser.add_argument("--keep", action="store_true", help="Keep generated files after the run")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--measure", nargs=2, metavar=("FMT", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure[1], args.measure[0])))
+        return
+
+    workdir = Path(args.dir or tempfile.mkdtemp(prefix="bench_dataset_"))
+    workdir.mkdir(parents=True, exist_ok=True)
+    results = []
+    try:
+        for fmt in args.formats:
+            path = workdir / f"data.{fmt}"
+            if not path.exists():
+                print(f"Generating {args.size_mb} MB {fmt} file...", file=sys.stderr)
+                generate(path, fmt, args.size_mb * 1024 * 1024)
+            out = subprocess.run(
+                [sys.executable, __file__, "--measure", fmt, str(path)],
+                capture_output=True, text=True, check=True, env={**os.environ, "DATASET_DIR": str(workdir)},
+            )
+            results.append(json.loads(out.stdout))
+    finally:
+        if not args.keep:
+            for fmt in args.formats:
+                (workdir / f"data.{fmt}").unlink(missing_ok=True)
+            if not args.dir:
+                workdir.rmdir()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'format':<8}{'size MB':>10}{'values':>14}{'seconds':>10}{'MB/s':>10}{'peak RSS MB':>14}")
+    for r in results:
+        mb = r["bytes"] / 2**20
+        print(
+            f"{r['format']:<8}{mb:>10.1f}{r['values']:>14,}{r['seconds']:>10.2f}"
+            f"{mb / r['seconds']:>10.1f}{r['peak_rss_bytes'] / 2**20:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
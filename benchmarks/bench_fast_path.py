@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark for fast_path.py
+
+Measures latency percentiles and single-thread throughput of the
+deterministic fast path for every agent that declares one. With a running
+server (see readiness.py) the same messages are also sent through the
+model, so both paths can be compared; without one only the fast path is
+measured.
+
+Examples:
+  python benchmarks/bench_fast_path.py
+  python benchmarks/bench_fast_path.py --requests 100000
+  python benchmarks/bench_fast_path.py --url http://localhost:4321 --llm-requests 5
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import urllib.error
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fast_path import FastPathRouter  # noqa: E402
+from readiness import HEALTH_PATH, ChatClient, read_cli_token, wait_until_ready  # noqa: E402
+
+MESSAGES = ["hello there", "Hello!", "what is the weather", "this is only a test", "say {something}"]
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def report(label, samples):
+    total = sum(samples)
+    print(f"{label:<28}{len(samples):>9,}{statistics.median(samples) * 1e6:>12.2f}"
+          f"{percentile(samples, 0.99) * 1e6:>12.2f}{len(samples) / total:>14,.0f}")
+
+
+def bench_fast(router, agent, requests):
+    samples = []
+    clock = time.perf_counter
+    for i in range(requests):
+        message = MESSAGES[i % len(MESSAGES)]
+        start = clock()
+        router.respond(agent, message)
+        samples.append(clock() - start)
+    return samples
+
+
+def bench_llm(client, agent_id, requests):
+    samples = []
+    for i in range(requests):
+        start = time.perf_counter()
+        client.ask(agent_id, MESSAGES[i % len(MESSAGES)])
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000, help="Fast path requests per agent")
+    parser.add_argument("--url", help="Server base URL; compare against the model path when reachable")
+    parser.add_argument("--llm-requests", type=int, default=5, help="Model requests per agent")
+    args = parser.parse_args()
+
+    router = FastPathRouter.load(str(ROOT / "agents"))
+    print(f"{'path':<28}{'requests':>9}{'p50 µs':>12}{'p99 µs':>12}{'req/s':>14}")
+    for agent in router.covered():
+        report(f"{agent} (fast)", bench_fast(router, agent, args.requests))
+
+    if not args.url:
+        print("\nModel path not measured; pass --url to compare against a running server.")
+        return
+    if not wait_until_ready(args.url.rstrip("/") + HEALTH_PATH, timeout=5).ready:
+        print(f"\nModel path skipped: {args.url} is not ready.")
+        return
+    client = ChatClient(args.url, token=read_cli_token())
+    try:
+        ids = client.agent_ids()
+        for agent in router.covered():
+            if agent in ids:
+                report(f"{agent} (model)", bench_llm(client, ids[agent], args.llm_requests))
+            else:
+                print(f"{agent} (model)  not imported on the server")
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        print(f"\nModel path failed: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for prompt_footprint.py
+
+Measures token-estimation throughput on the repository's own agent
+instructions and full-report time on synthetic agent sets of growing
+size. No model tokenizer or network access is needed.
+
+Examples:
+  python benchmarks/bench_prompt_footprint.py
+  python benchmarks/bench_prompt_footprint.py --agents 10 100 1000
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tests" / "perf"))
+
+import synthetic  # noqa: E402
+from prompt_footprint import PromptAnalyzer, estimate_tokens  # noqa: E402
+
+TOOL_COUNT = 50
+
+
+def bench_estimate(repeat: int) -> None:
+    corpus = "\n".join(
+        (yaml.safe_load(p.read_text(encoding="utf-8")).get("instructions") or "")
+        for p in sorted((ROOT / "agents").glob("*.yaml"))
+    ) * 100
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tokens = estimate_tokens(corpus)
+        runs.append(time.perf_counter() - start)
+    elapsed = statistics.median(runs)
+    print(f"estimate_tokens: {len(corpus):,} chars -> {tokens:,} tokens in {elapsed * 1e3:.2f} ms "
+          f"({len(corpus) / elapsed / 1e6:.1f} MB/s)")
+
+
+def bench_report(counts, repeat: int) -> None:
+    print(f"\n{'agents':>8}{'report ms':>12}{'ms/agent':>10}")
+    for count in counts:
+        with tempfile.TemporaryDirectory() as tmp:
+            agents, tools = Path(tmp) / "agents", Path(tmp) / "tools"
+            synthetic.write_tools(tools, TOOL_COUNT)
+            synthetic.write_agents(agents, count, tool_count=TOOL_COUNT)
+            runs = []
+            for _ in range(repeat):
+                analyzer = PromptAnalyzer(str(agents), str(tools))
+                start = time.perf_counter()
+                analyzer.analyze()
+                runs.append(time.perf_counter() - start)
+            elapsed = statistics.median(runs)
+            print(f"{count:>8}{elapsed * 1e3:>12.1f}{elapsed * 1e3 / count:>10.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark offline prompt token estimation")
+    parser.add_argument("--agents", type=int, nargs="+", default=[4, 40, 400], help="Synthetic agent counts")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per case (median is reported)")
+    args = parser.parse_args()
+
+    bench_estimate(args.repeat)
+    bench_report(args.agents, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
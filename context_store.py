@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Bounded Conversation Context Store for watsonx Orchestrate agents
+Keeps each session's history within a token budget by deterministically
+truncating older turns, and hands every agent only the history its
+``context_policy`` allows
+"""
+
+import argparse
+import sys
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from agent_bundle import load_agents
+from prompt_footprint import estimate_tokens
+from validate import AgentValidator
+
+# How much history an agent receives
+CONTEXT_MODES = AgentValidator.VALID_CONTEXT_MODES
+
+DEFAULT_SESSION_BUDGET = 4000
+DEFAULT_KEEP_RECENT = 4
+DEFAULT_COMPACT_CHARS = 160
+COMPACT_MARKER = " […]"
+
+
+@dataclass
+class Turn:
+    """One message in a session."""
+    role: str                 # 'user' or 'assistant'
+    content: str
+    agent: Optional[str] = None
+    compacted: bool = False
+    tokens: int = 0
+
+    def __post_init__(self):
+        if not self.tokens:
+            self.tokens = estimate_tokens(self.content)
+
+    def to_message(self) -> Dict[str, str]:
+        return {"role": self.role, "content": self.content}
+
+
+@dataclass
+class ContextPolicy:
+    """
+    How much history one agent receives, read from its YAML
+
+    Example:
+        context_policy:
+          mode: window        # stateless | window | full
+          max_turns: 6        # window only
+          max_tokens: 1500    # optional cap on the history handed to the agent
+    """
+    mode: str = 'full'
+    max_turns: Optional[int] = None
+    max_tokens: Optional[int] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ContextPolicy":
+        policy = config.get('context_policy') or {}
+        return cls(policy.get('mode', 'full'), policy.get('max_turns'), policy.get('max_tokens'))
+
+
+def load_policies(agents_dir: str = "agents") -> Dict[str, ContextPolicy]:
+    """Read the context policy of every agent in ``agents_dir``."""
+    return {name: ContextPolicy.from_config(config) for name, config in load_agents(agents_dir).items()}
+
+
+def truncate(text: str, max_chars: int) -> str:
+    """Cut ``text`` at a word boundary no later than ``max_chars``; same input, same output."""
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    if " " in cut:
+        cut = cut[:cut.rindex(" ")]
+    return cut.rstrip() + COMPACT_MARKER
+
+
+@dataclass
+class Session:
+    turns: List[Turn] = field(default_factory=list)
+    compactions: int = 0
+    dropped: int = 0
+
+    @property
+    def tokens(self) -> int:
+        return sum(t.tokens for t in self.turns)
+
+
+class ConversationStore:
+    """Per-session conversation history with a token budget"""
+
+    def __init__(self, token_budget: int = DEFAULT_SESSION_BUDGET, keep_recent: int = DEFAULT_KEEP_RECENT,
+                 compact_chars: int = DEFAULT_COMPACT_CHARS, policies: Optional[Dict[str, ContextPolicy]] = None):
+        self.token_budget = token_budget
+        self.keep_recent = keep_recent
+        self.compact_chars = compact_chars
+        self.policies = policies or {}
+        self.sessions: Dict[str, Session] = {}
+        self._lock = threading.Lock()
+
+    def append(self, session_id: str, role: str, content: str, agent: Optional[str] = None) -> Turn:
+        """Record a turn and bring the session back within its budget."""
+        turn = Turn(role, content, agent)
+        with self._lock:
+            session = self.sessions.setdefault(session_id, Session())
+            session.turns.append(turn)
+            self._enforce_budget(session)
+        return turn
+
+    def _enforce_budget(self, session: Session) -> None:
+        """
+        Compact oldest-first, then drop oldest-first, until the budget fits
+
+        The ``keep_recent`` newest turns are never compacted and the newest
+        turn is never dropped, so the current request always arrives intact.
+        """
+        if session.tokens <= self.token_budget:
+            return
+        for turn in session.turns[:max(0, len(session.turns) - self.keep_recent)]:
+            if not turn.compacted:
+                shortened = truncate(turn.content, self.compact_chars)
+                turn.compacted = True
+                if shortened != turn.content:
+                    turn.content = shortened
+                    turn.tokens = estimate_tokens(shortened)
+                    session.compactions += 1
+                if session.tokens <= self.token_budget:
+                    return
+        while len(session.turns) > 1 and session.tokens > self.token_budget:
+            session.turns.pop(0)
+            session.dropped += 1
+
+    def history(self, session_id: str) -> List[Turn]:
+        with self._lock:
+            return list(self.sessions.get(session_id, Session()).turns)
+
+    def context_for(self, session_id: str, agent: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Messages to send to ``agent`` for the session's latest turn
+
+        Args:
+            session_id: Conversation to read
+            agent: Agent name; its policy decides how much history it gets
+
+        Returns:
+            Chat messages, oldest first, always ending with the latest turn
+        """
+        turns = self.history(session_id)
+        if not turns:
+            return []
+        policy = self.policies.get(agent, ContextPolicy())
+        if policy.mode == 'stateless':
+            turns = turns[-1:]
+        elif policy.mode == 'window' and policy.max_turns:
+            turns = turns[-policy.max_turns:]
+        if policy.max_tokens:
+            total = sum(t.tokens for t in turns)
+            while len(turns) > 1 and total > policy.max_tokens:
+                total -= turns.pop(0).tokens
+        return [t.to_message() for t in turns]
+
+    def stats(self, session_id: str) -> Dict[str, int]:
+        with self._lock:
+            session = self.sessions.get(session_id, Session())
+            return {"turns": len(session.turns), "tokens": session.tokens,
+                    "compactions": session.compactions, "dropped": session.dropped}
+
+    def clear(self, session_id: str) -> None:
+        with self._lock:
+            self.sessions.pop(session_id, None)
+
+
+def print_policies(policies: Dict[str, ContextPolicy]) -> None:
+    print(f"{'agent':<24}{'mode':<11}{'max turns':>10}{'max tokens':>12}")
+    for name, policy in policies.items():
+        turns = policy.max_turns if policy.max_turns is not None else '-'
+        tokens = policy.max_tokens if policy.max_tokens is not None else '-'
+        print(f"{name:<24}{policy.mode:<11}{turns:>10}{tokens:>12}")
+
+
+def main():
+    """Main function to show the context policies"""
+    parser = argparse.ArgumentParser(
+        description="Show how much conversation history each agent receives",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python context_store.py
+  python context_store.py --agents-dir agents
+
+Policies are set per agent with a context_policy block in its YAML.
+See benchmarks/bench_context_store.py for prompt size over long sessions.
+        """
+    )
+    parser.add_argument('--agents-dir', default='agents', help='Directory with agent YAML files')
+
+    args = parser.parse_args()
+
+    policies = load_policies(args.agents_dir)
+    if not policies:
+        print(f"❌ No agents found in {args.agents_dir}")
+        sys.exit(1)
+    print_policies(policies)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Multi-Environment Deployer for watsonx Orchestrate ADK
+Computes one import plan from agents/ and tools/ and applies it to several
+environments concurrently, each through its own isolated CLI context
+"""
+
+import argparse
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from agent_bundle import load_agent_set
+
+# Where the orchestrate CLI keeps environments and credentials, relative to HOME
+CLI_STATE_FILES = [
+    Path(".config") / "orchestrate" / "config.yaml",
+    Path(".cache") / "orchestrate" / "credentials.yaml",
+]
+
+# Same pattern scripts/utils uses to read `orchestrate ... list -v` output
+NAME_PATTERN = re.compile(r'"name":\s*"([^"]+)"')
+
+ROLLBACK_MODES = ['none', 'env', 'all']
+
+
+@dataclass
+class PlanStep:
+    """One import in the plan and what must be removed to undo it."""
+    kind: str                 # 'tool' or 'agent'
+    path: str
+    command: List[str]
+    names: List[str]          # objects this step creates
+    agent_kind: str = "native"
+
+    @property
+    def label(self) -> str:
+        return f"{self.kind} {Path(self.path).name}"
+
+    def remove_commands(self) -> List[List[str]]:
+        if self.kind == 'tool':
+            return [["tools", "remove", "-n", name] for name in self.names]
+        return [["agents", "remove", "--name", name, "--kind", self.agent_kind] for name in self.names]
+
+
+@dataclass
+class EnvResult:
+    """Outcome of applying the plan to one environment."""
+    env: str
+    ok: bool = True
+    error: str = ""
+    completed: List[PlanStep] = field(default_factory=list)
+    preexisting: Optional[set] = None
+    rolled_back: List[str] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+    seconds: float = 0.0
+
+
+def _order_agents(configs: Dict[str, Dict]) -> List[str]:
+    """Topologically order agents so collaborators are imported first."""
+    ordered, visiting, done = [], set(), set()
+
+    def visit(name: str):
+        if name in done or name not in configs:
+            return
+        if name in visiting:
+            raise ValueError(f"Collaborator cycle involving '{name}'")
+        visiting.add(name)
+        for collaborator in configs[name].get('collaborators') or []:
+            visit(collaborator)
+        visiting.discard(name)
+        done.add(name)
+        ordered.append(name)
+
+    for name in sorted(configs):
+        visit(name)
+    return ordered
+
+
+def build_plan(agents_dir: str = "agents", tools_dir: str = "tools") -> List[PlanStep]:
+    """
+    Compute the ordered import plan shared by every environment
+
+    Args:
+        agents_dir: Directory with agent YAML files
+        tools_dir: Directory with Python and OpenAPI tool files
+
+    Returns:
+        List of plan steps: all tools first, then agents in dependency order
+    """
+    steps = []
+    agent_set = load_agent_set(agents_dir, tools_dir)
+    for path, names in agent_set.tool_files.items():
+        if names:
+            steps.append(PlanStep('tool', path, ["tools", "import", "-k", "python", "-f", path], names))
+    tools_path = Path(tools_dir)
+    for path in sorted(list(tools_path.glob("*.yaml")) + list(tools_path.glob("*.yml"))):
+        steps.append(PlanStep('tool', str(path), ["tools", "import", "-k", "openapi", "-f", str(path)], []))
+
+    for name in _order_agents(agent_set.agents):
+        path = agent_set.agent_paths[name]
+        kind = str(agent_set.agents[name].get('kind', 'native')).lower()
+        steps.append(PlanStep('agent', path, ["agents", "import", "-f", path], [name], kind))
+    return steps
+
+
+class EnvironmentContext:
+    """
+    An isolated orchestrate CLI context for one environment
+
+    The CLI keeps its active environment in HOME, so every context gets a
+    private HOME seeded with the user's environments and credentials.
+    Activating one environment never changes the user's own CLI state or
+    the other environments being deployed in parallel.
+    """
+
+    def __init__(self, env: str, cli: str = "orchestrate", source_home: Optional[str] = None, timeout: float = 600):
+        self.env = env
+        self.cli = cli
+        self.source_home = Path(source_home or os.path.expanduser("~"))
+        self.timeout = timeout
+        self.home = None
+
+    def __enter__(self):
+        self.home = tempfile.mkdtemp(prefix=f"orchestrate-{self.env}-")
+        for relative in CLI_STATE_FILES:
+            source = self.source_home / relative
+            if source.exists():
+                target = Path(self.home) / relative
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, target)
+        return self
+
+    def __exit__(self, *exc):
+        shutil.rmtree(self.home, ignore_errors=True)
+
+    def run(self, args: List[str]) -> subprocess.CompletedProcess:
+        env = dict(os.environ, HOME=self.home)
+        return subprocess.run([self.cli] + args, capture_output=True, text=True, env=env, timeout=self.timeout)
+
+    def activate(self) -> subprocess.CompletedProcess:
+        args = ["env", "activate", self.env]
+        api_key = os.environ.get(api_key_variable(self.env))
+        if api_key:
+            args += ["--api-key", api_key]
+        return self.run(args)
+
+    def existing_names(self) -> Optional[set]:
+        """Names of agents and tools already in the environment, or None if unknown."""
+        names = set()
+        for resource in ("agents", "tools"):
+            result = self.run([resource, "list", "-v"])
+            if result.returncode != 0:
+                return None
+            names.update(NAME_PATTERN.findall(result.stdout))
+        return names
+
+
+def api_key_variable(env: str) -> str:
+    """Environment variable holding the API key for ``env``, e.g. WXO_API_KEY_STAGING."""
+    return "WXO_API_KEY_" + re.sub(r"[^A-Za-z0-9]", "_", env).upper()
+
+
+class Deployer:
+    """Applies one import plan to several environments concurrently"""
+
+    def __init__(self, plan: List[PlanStep], cli: str = "orchestrate", rollback: str = "env",
+                 source_home: Optional[str] = None, timeout: float = 600):
+        if rollback not in ROLLBACK_MODES:
+            raise ValueError(f"Invalid rollback mode '{rollback}'. Must be one of: {ROLLBACK_MODES}")
+        self.plan = plan
+        self.cli = cli
+        self.rollback = rollback
+        self.source_home = source_home
+        self.timeout = timeout
+        self._print_lock = threading.Lock()
+
+    def log(self, env: str, message: str) -> None:
+        with self._print_lock:
+            print(f"[{env}] {message}", flush=True)
+
+    def deploy(self, envs: List[str]) -> Dict[str, EnvResult]:
+        """
+        Apply the plan to every environment in parallel
+
+        Args:
+            envs: Environment names as known to `orchestrate env list`
+
+        Returns:
+            Dict mapping environment name to its result
+        """
+        with ExitStack() as stack, ThreadPoolExecutor(max_workers=max(1, len(envs))) as pool:
+            contexts = {
+                env: stack.enter_context(EnvironmentContext(env, self.cli, self.source_home, self.timeout))
+                for env in envs
+            }
+            futures = {env: pool.submit(self._apply, contexts[env]) for env in envs}
+            results = {env: future.result() for env, future in futures.items()}
+
+            failed = [r for r in results.values() if not r.ok]
+            if failed and self.rollback != 'none':
+                targets = list(results.values()) if self.rollback == 'all' else failed
+                list(pool.map(lambda r: self._rollback(contexts[r.env], r), targets))
+            return results
+
+    def _apply(self, context: EnvironmentContext) -> EnvResult:
+        result = EnvResult(context.env)
+        start = time.perf_counter()
+        try:
+            activated = context.activate()
+            if activated.returncode != 0:
+                raise RuntimeError(f"env activate failed: {(activated.stderr or activated.stdout).strip()}")
+
+            result.preexisting = context.existing_names()
+            if result.preexisting is None:
+                self.log(context.env, "⚠️  could not list existing resources; rollback disabled")
+
+            for index, step in enumerate(self.plan, start=1):
+                step_start = time.perf_counter()
+                completed = context.run(step.command)
+                elapsed = time.perf_counter() - step_start
+                result.timings[step.label] = elapsed
+                if completed.returncode != 0:
+                    raise RuntimeError(f"{step.label} failed: {(completed.stderr or completed.stdout).strip()}")
+                result.completed.append(step)
+                self.log(context.env, f"✓ [{index}/{len(self.plan)}] {step.label} ({elapsed:.2f}s)")
+        except (RuntimeError, OSError, subprocess.TimeoutExpired) as e:
+            result.ok = False
+            result.error = str(e)
+            self.log(context.env, f"✗ {e}")
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def _rollback(self, context: EnvironmentContext, result: EnvResult) -> None:
+        """Remove objects this run created, newest first; leave pre-existing ones alone."""
+        if result.preexisting is None:
+            return
+        for step in reversed(result.completed):
+            for name, command in zip(step.names, step.remove_commands()):
+                if name in result.preexisting:
+                    continue
+                removed = context.run(command)
+                if removed.returncode == 0:
+                    result.rolled_back.append(name)
+                    self.log(context.env, f"↩ removed {step.kind} {name}")
+                else:
+                    self.log(context.env, f"⚠️  could not remove {step.kind} {name}")
+
+    def print_results(self, results: Dict[str, EnvResult]) -> None:
+        """Print a per-environment summary"""
+        print()
+        print(f"{'environment':<20}{'status':<10}{'steps':>8}{'seconds':>10}{'rolled back':>13}")
+        for env, r in results.items():
+            status = "✅ ok" if r.ok else "❌ failed"
+            print(f"{env:<20}{status:<10}{len(r.completed):>5}/{len(self.plan):<2}{r.seconds:>10.2f}{len(r.rolled_back):>13}")
+        for env, r in results.items():
+            if r.error:
+                print(f"  • {env}: {r.error}")
+
+
+def print_plan(plan: List[PlanStep]) -> None:
+    print("📋 Import plan:")
+    for index, step in enumerate(plan, start=1):
+        names = f"  ({', '.join(step.names)})" if step.names else ""
+        print(f"  {index}. orchestrate {' '.join(step.command)}{names}")
+
+
+def main():
+    """Main function to run the deployer"""
+    parser = argparse.ArgumentParser(
+        description="Import agents and tools into several watsonx Orchestrate environments in parallel",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python deploy.py local
+  python deploy.py dev staging prod
+  python deploy.py dev staging --rollback all   # all-or-nothing promotion
+  python deploy.py --dry-run dev
+
+API keys are read from WXO_API_KEY_<ENV> (e.g. WXO_API_KEY_STAGING) when set.
+        """
+    )
+    parser.add_argument('envs', nargs='+', help='Environment names (see: orchestrate env list)')
+    parser.add_argument('--agents-dir', default='agents', help='Directory with agent YAML files')
+    parser.add_argument('--tools-dir', default='tools', help='Directory with tool files')
+    parser.add_argument('--rollback', choices=ROLLBACK_MODES, default='env',
+                        help="On failure: 'env' undoes the failed environments, 'all' undoes every "
+                             "environment, 'none' leaves everything as is (default: env)")
+    parser.add_argument('--cli', default='orchestrate', help='Path to the orchestrate executable')
+    parser.add_argument('--timeout', type=float, default=600, help='Per-command timeout in seconds')
+    parser.add_argument('--dry-run', action='store_true', help='Print the plan and exit')
+
+    args = parser.parse_args()
+
+    plan = build_plan(args.agents_dir, args.tools_dir)
+    print_plan(plan)
+    if args.dry_run:
+        return
+
+    print(f"\n🚀 Deploying to {len(args.envs)} environment(s): {', '.join(args.envs)}\n")
+    deployer = Deployer(plan, cli=args.cli, rollback=args.rollback, timeout=args.timeout)
+    results = deployer.deploy(args.envs)
+    deployer.print_results(results)
+
+    sys.exit(0 if all(r.ok for r in results.values()) else 1)
+
+
+if __name__ == "__main__":
+    main()
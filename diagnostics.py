@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Concurrent Diagnostics for watsonx Orchestrate Developer Edition
+Runs the checks from diagnostic.sh in parallel with per-probe timeouts and an
+overall deadline, and reports the results as JSON and a human summary
+"""
+
+import argparse
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+# Result statuses
+OK = "ok"
+FAIL = "fail"
+SKIPPED = "skipped"
+TIMEOUT = "timeout"
+
+CONTAINER_PATTERN = ("wxo", "orchestrate")
+LOG_TAIL_LINES = 10
+
+
+class ProbeFailed(Exception):
+    """Raised by a probe to report a failed check with a detail message."""
+
+
+@dataclass
+class Probe:
+    """One check; ``run(ctx)`` returns data on success or raises ProbeFailed."""
+    name: str
+    description: str
+    run: Callable[["ProbeContext"], Any]
+    depends_on: List[str] = field(default_factory=list)
+    timeout: Optional[float] = None
+
+
+@dataclass
+class ProbeContext:
+    """What a running probe can see: settings, its time budget and dependency data."""
+    settings: Dict[str, Any]
+    timeout: float
+    results: Dict[str, Dict[str, Any]]
+
+    def data(self, probe: str) -> Any:
+        return self.results[probe].get("data")
+
+
+def _run_command(args: List[str], timeout: float, merge_stderr: bool = False) -> str:
+    try:
+        completed = subprocess.run(args, stdout=subprocess.PIPE, text=True, timeout=timeout,
+                                   stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE)
+    except FileNotFoundError:
+        raise ProbeFailed(f"'{args[0]}' command not found")
+    except subprocess.TimeoutExpired:
+        raise ProbeFailed(f"'{' '.join(args)}' timed out after {timeout:.1f}s")
+    if completed.returncode != 0:
+        raise ProbeFailed((completed.stderr or completed.stdout).strip() or f"exit code {completed.returncode}")
+    return completed.stdout
+
+
+def probe_containers(ctx: ProbeContext) -> List[Dict[str, str]]:
+    """List running containers once; every container probe reuses this result."""
+    out = _run_command([ctx.settings["docker"], "ps", "--format", "{{json .}}"], ctx.timeout)
+    return [json.loads(line) for line in out.splitlines() if line.strip()]
+
+
+def probe_wxo_containers(ctx: ProbeContext) -> List[str]:
+    names = [c.get("Names", "") for c in ctx.data("containers")]
+    matches = [n for n in names if any(p in n for p in CONTAINER_PATTERN)]
+    if not matches:
+        raise ProbeFailed(f"No watsonx Orchestrate containers among {len(names)} running")
+    return matches
+
+
+def _container_port_probe(port: int) -> Callable[[ProbeContext], List[str]]:
+    def probe(ctx: ProbeContext) -> List[str]:
+        exposing = [c.get("Names", "") for c in ctx.data("containers") if f":{port}->" in c.get("Ports", "")]
+        if not exposing:
+            raise ProbeFailed(f"No containers exposing port {port}")
+        return exposing
+    return probe
+
+
+def _port_probe(port_setting: str) -> Callable[[ProbeContext], int]:
+    def probe(ctx: ProbeContext) -> int:
+        port = ctx.settings[port_setting]
+        try:
+            with socket.create_connection((ctx.settings["host"], port), timeout=ctx.timeout):
+                return port
+        except OSError as e:
+            raise ProbeFailed(f"Port {port} is not accepting connections: {e}")
+    return probe
+
+
+def _http_probe(port_setting: str, path: str) -> Callable[[ProbeContext], Dict[str, Any]]:
+    def probe(ctx: ProbeContext) -> Dict[str, Any]:
+        url = f"http://{ctx.settings['host']}:{ctx.settings[port_setting]}{path}"
+        try:
+            with urllib.request.urlopen(url, timeout=ctx.timeout) as response:
+                body = response.read(512).decode("utf-8", errors="replace")
+                return {"url": url, "status": response.status, "body": body}
+        except urllib.error.HTTPError as e:
+            raise ProbeFailed(f"{url} returned HTTP {e.code}")
+        except (urllib.error.URLError, OSError) as e:
+            raise ProbeFailed(f"{url} not responding: {getattr(e, 'reason', e)}")
+    return probe
+
+
+def probe_container_logs(ctx: ProbeContext) -> Dict[str, str]:
+    deadline = time.monotonic() + ctx.timeout
+    logs = {}
+    for name in ctx.data("wxo_containers"):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            logs[name] = _run_command(
+                [ctx.settings["docker"], "logs", "--tail", str(LOG_TAIL_LINES), name], remaining, merge_stderr=True
+            )
+        except ProbeFailed as e:
+            logs[name] = f"<{e}>"
+    return logs
+
+
+def default_probes() -> List[Probe]:
+    """The checks diagnostic.sh performs, expressed as a dependency graph."""
+    return [
+        Probe("containers", "Docker containers listed", probe_containers),
+        Probe("wxo_containers", "watsonx Orchestrate containers running", probe_wxo_containers, ["containers"]),
+        Probe("container_port_3000", "Container exposing port 3000", _container_port_probe(3000), ["containers"]),
+        Probe("container_port_4321", "Container exposing port 4321", _container_port_probe(4321), ["containers"]),
+        Probe("port_api", "API port accepting connections", _port_probe("api_port")),
+        Probe("port_ui", "UI port accepting connections", _port_probe("ui_port")),
+        Probe("api_health", "API health endpoint", _http_probe("api_port", "/health"), ["port_api"]),
+        Probe("api_docs", "API docs endpoint", _http_probe("api_port", "/docs"), ["port_api"]),
+        Probe("ui", "UI endpoint", _http_probe("ui_port", "/"), ["port_ui"]),
+        Probe("chat_lite", "Chat-lite endpoint", _http_probe("ui_port", "/chat-lite"), ["port_ui"]),
+        Probe("container_logs", "Recent container logs", probe_container_logs, ["wxo_containers"]),
+    ]
+
+
+class DiagnosticsEngine:
+    """Runs probes concurrently, in dependency order, within a deadline"""
+
+    def __init__(self, probes: Optional[List[Probe]] = None, settings: Optional[Dict[str, Any]] = None,
+                 probe_timeout: float = 3.0, deadline: float = 10.0):
+        self.probes = {p.name: p for p in (probes if probes is not None else default_probes())}
+        self.settings = dict({"host": "localhost", "api_port": 4321, "ui_port": 3000, "docker": "docker"},
+                             **(settings or {}))
+        self.probe_timeout = probe_timeout
+        self.deadline = deadline
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.elapsed = 0.0
+
+        for probe in self.probes.values():
+            for dependency in probe.depends_on:
+                if dependency not in self.probes:
+                    raise ValueError(f"Probe '{probe.name}' depends on unknown probe '{dependency}'")
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Run every probe and return ``{name: result}``
+
+        A probe starts as soon as all of its dependencies have finished. If
+        any dependency did not succeed, the probe is skipped rather than run,
+        so a dead server costs one failed check instead of many timeouts.
+        """
+        start = time.monotonic()
+        end = start + self.deadline
+        self.results = {}
+        done = {name: threading.Event() for name in self.probes}
+
+        def execute(probe: Probe) -> None:
+            for dependency in probe.depends_on:
+                if not done[dependency].wait(max(0.0, end - time.monotonic())):
+                    return  # deadline passed; reported as timeout below
+            blocked = [d for d in probe.depends_on if self.results[d]["status"] != OK]
+            probe_start = time.monotonic()
+            if blocked:
+                result = {"status": SKIPPED, "detail": f"dependency failed: {', '.join(blocked)}"}
+            else:
+                timeout = min(probe.timeout or self.probe_timeout, max(0.0, end - probe_start))
+                context = ProbeContext(self.settings, timeout, self.results)
+                try:
+                    result = {"status": OK, "data": probe.run(context)}
+                except ProbeFailed as e:
+                    result = {"status": FAIL, "detail": str(e)}
+                except Exception as e:
+                    result = {"status": FAIL, "detail": f"Unexpected error: {e}"}
+            result["seconds"] = round(time.monotonic() - probe_start, 4)
+            if time.monotonic() <= end:
+                self.results[probe.name] = result
+                done[probe.name].set()
+
+        # One thread per probe so waiting on dependencies can never starve a runnable probe
+        pool = ThreadPoolExecutor(max_workers=max(1, len(self.probes)))
+        try:
+            futures = [pool.submit(execute, probe) for probe in self.probes.values()]
+            wait(futures, timeout=max(0.0, end - time.monotonic()))
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        for name, probe in self.probes.items():
+            if name not in self.results:
+                self.results[name] = {"status": TIMEOUT, "detail": f"not finished within the {self.deadline:.1f}s deadline"}
+        self.elapsed = time.monotonic() - start
+        return self.results
+
+    @property
+    def healthy(self) -> bool:
+        return all(r["status"] == OK for r in self.results.values())
+
+    def report(self) -> Dict[str, Any]:
+        """Structured report for machines (CI, tickets)."""
+        return {
+            "healthy": self.healthy,
+            "elapsed_seconds": round(self.elapsed, 4),
+            "deadline_seconds": self.deadline,
+            "settings": self.settings,
+            "probes": {
+                name: dict(self.results[name], description=self.probes[name].description,
+                           depends_on=self.probes[name].depends_on)
+                for name in self.probes
+            },
+        }
+
+    def print_results(self) -> None:
+        """Human summary in the style of diagnostic.sh"""
+        icons = {OK: "✅", FAIL: "❌", SKIPPED: "⏭️ ", TIMEOUT: "⏱️ "}
+        print("━" * 78)
+        print("watsonx Orchestrate Developer Edition - Diagnostics")
+        print("━" * 78)
+        for name, probe in self.probes.items():
+            result = self.results[name]
+            line = f"{icons[result['status']]} {probe.description}"
+            if result.get("detail"):
+                line += f" — {result['detail']}"
+            print(line)
+            if name == "api_health" and result["status"] == OK:
+                print(f"     Response: {result['data']['body'].strip()}")
+
+        logs = self.results.get("container_logs", {})
+        if logs.get("status") == OK:
+            for container, text in logs["data"].items():
+                print(f"\n📄 Logs for {container} (last {LOG_TAIL_LINES} lines):")
+                print(text.rstrip())
+
+        counts = {s: sum(1 for r in self.results.values() if r["status"] == s) for s in (OK, FAIL, SKIPPED, TIMEOUT)}
+        print("━" * 78)
+        print(f"📊 {counts[OK]} ok, {counts[FAIL]} failed, {counts[SKIPPED]} skipped, "
+              f"{counts[TIMEOUT]} timed out in {self.elapsed:.2f}s")
+
+
+def main():
+    """Main function to run the diagnostics"""
+    parser = argparse.ArgumentParser(
+        description="Diagnose a local watsonx Orchestrate Developer Edition stack",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python diagnostics.py
+  python diagnostics.py --deadline 5 --probe-timeout 2
+  python diagnostics.py --json > diagnostics.json
+  python diagnostics.py --output diagnostics.json   # summary on screen, JSON to file
+        """
+    )
+    parser.add_argument('--host', default='localhost', help='Host running the server (default: localhost)')
+    parser.add_argument('--api-port', type=int, default=4321, help='API port (default: 4321)')
+    parser.add_argument('--ui-port', type=int, default=3000, help='Chat UI port (default: 3000)')
+    parser.add_argument('--docker', default='docker', help='Docker executable')
+    parser.add_argument('--probe-timeout', type=float, default=3.0, help='Timeout per probe in seconds')
+    parser.add_argument('--deadline', type=float, default=10.0, help='Overall deadline in seconds')
+    parser.add_argument('--json', action='store_true', help='Print only the JSON report')
+    parser.add_argument('--output', help='Also write the JSON report to this file')
+
+    args = parser.parse_args()
+
+    engine = DiagnosticsEngine(
+        settings={"host": args.host, "api_port": args.api_port, "ui_port": args.ui_port, "docker": args.docker},
+        probe_timeout=args.probe_timeout,
+        deadline=args.deadline,
+    )
+    engine.run()
+    report = engine.report()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        engine.print_results()
+
+    sys.exit(0 if engine.healthy else 1)
+
+
+if __name__ == "__main__":
+    main()
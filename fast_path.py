@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Deterministic Fast Path for template agents
+Answers agents whose YAML declares a ``fast_path`` response template or
+Python handler locally, without an LLM turn, and reports which agents
+still need the model
+"""
+
+import argparse
+import importlib
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from agent_bundle import load_agents
+from validate import AgentValidator
+
+INPUT_PLACEHOLDER = AgentValidator.FAST_PATH_PLACEHOLDER
+MATCH_OPERATORS = AgentValidator.VALID_FAST_PATH_OPERATORS
+
+
+@dataclass
+class FastPathRule:
+    """Respond with ``template`` when the message matches ``operator``/``value``."""
+    operator: str
+    value: str
+    template: str
+    _pattern: re.Pattern = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if self.operator == 'contains_word':
+            self._pattern = re.compile(rf"\b{re.escape(self.value)}\b", re.IGNORECASE)
+        elif self.operator == 'contains':
+            self._pattern = re.compile(re.escape(self.value), re.IGNORECASE)
+        else:
+            self._pattern = re.compile(self.value)
+
+    def matches(self, message: str) -> bool:
+        return self._pattern.search(message) is not None
+
+
+def render(template: str, message: str) -> str:
+    """Fill the template; ``str.replace`` so braces in the message are harmless."""
+    return template.replace(INPUT_PLACEHOLDER, message)
+
+
+def load_handler(spec: str) -> Callable[[str], str]:
+    """Resolve ``"module:function"`` to a callable taking the message."""
+    module_name, _, function_name = spec.partition(":")
+    handler = getattr(importlib.import_module(module_name), function_name)
+    if not callable(handler):
+        raise TypeError(f"Fast path handler '{spec}' is not callable")
+    return handler
+
+
+class FastPathAgent:
+    """
+    The deterministic part of one agent, built from its ``fast_path`` block
+
+    Example:
+        fast_path:
+          rules:
+            - contains_word: hello
+              respond: "**Hello! I am the Greeting Agent.**"
+          default: '**I only handle greetings. Please say "hello".**'
+
+    A ``handler: module:function`` may be given instead of rules and
+    default. A message matching no rule, with no default, gets ``None``
+    and goes to the model.
+    """
+
+    def __init__(self, name: str, block: Dict[str, Any]):
+        self.name = name
+        self.rules = [self._rule(rule) for rule in block.get('rules') or []]
+        self.default = block.get('default')
+        self.handler = load_handler(block['handler']) if block.get('handler') else None
+
+    @staticmethod
+    def _rule(rule: Dict[str, Any]) -> FastPathRule:
+        operator = next(op for op in MATCH_OPERATORS if op in rule)
+        return FastPathRule(operator, str(rule[operator]), rule['respond'])
+
+    def respond(self, message: str) -> Optional[str]:
+        if self.handler:
+            return self.handler(message)
+        for rule in self.rules:
+            if rule.matches(message):
+                return render(rule.template, message)
+        if self.default is not None:
+            return render(self.default, message)
+        return None
+
+
+class FastPathRouter:
+    """Answers every agent that has a fast path; ``None`` means use the LLM"""
+
+    def __init__(self, agents: Optional[Dict[str, FastPathAgent]] = None):
+        self.agents = agents or {}
+
+    @classmethod
+    def load(cls, agents_dir: str = "agents") -> "FastPathRouter":
+        agents = {
+            name: FastPathAgent(name, config['fast_path'])
+            for name, config in load_agents(agents_dir).items() if config.get('fast_path')
+        }
+        return cls(agents)
+
+    def respond(self, agent: str, message: str) -> Optional[str]:
+        fast = self.agents.get(agent)
+        return fast.respond(message) if fast else None
+
+    def covered(self) -> List[str]:
+        return sorted(self.agents)
+
+
+def main():
+    """Main function to answer a message through the fast path"""
+    parser = argparse.ArgumentParser(
+        description="Answer a message for a template agent without calling the model",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python fast_path.py greeting_agent "hello there"
+  python fast_path.py echo_agent "this is only a test"
+  python fast_path.py --list
+        """
+    )
+    parser.add_argument('agent', nargs='?', help='Agent name')
+    parser.add_argument('message', nargs='?', help='User message')
+    parser.add_argument('--agents-dir', default='agents', help='Directory with agent YAML files')
+    parser.add_argument('--list', action='store_true', help='List agents that have a fast path')
+
+    args = parser.parse_args()
+
+    router = FastPathRouter.load(args.agents_dir)
+    if args.list or not args.agent:
+        print("⚡ Agents with a fast path: " + (", ".join(router.covered()) or "none"))
+        return
+    if args.message is None:
+        parser.error("a message is required")
+
+    response = router.respond(args.agent, args.message)
+    if response is None:
+        print(f"⏭️  {args.agent} has no fast path for this message; it needs the model")
+        sys.exit(1)
+    print(response)
+
+
+if __name__ == "__main__":
+    main()
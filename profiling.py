@@ -0,0 +1,222 @@
+"""
+Profiling hooks shared by the Python entry points
+(validate.py and scripts/utils/list.py, clean.py, purge.py)
+
+``add_profile_arguments`` adds ``--profile`` and friends to a parser,
+``profile_session`` wraps a run, and ``phase`` times a named step. With
+``--profile`` off, ``phase`` returns a shared no-op context and neither
+cProfile nor tracemalloc is imported.
+
+Outputs in ``--profile-dir`` for a run named ``NAME``:
+  NAME-<time>.pstats          cProfile stats (python -m pstats FILE, snakeviz, ...)
+  NAME-<time>.collapsed       collapsed stacks for flamegraph.pl / speedscope
+  NAME-<time>.tracemalloc.txt top allocation sites (plus a .snapshot to reload)
+  NAME-<time>.phases.json     wall-clock seconds per phase
+"""
+
+import argparse
+import json
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROFILE_KINDS = ['cprofile', 'tracemalloc', 'phases']
+
+# Reconstructed stacks deeper or lighter than this are cut off
+MAX_STACK_DEPTH = 64
+MIN_STACK_MICROSECONDS = 1
+
+
+class _NullPhase:
+    """What ``phase`` returns when profiling is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+_active = None
+
+
+class _Phase:
+    def __init__(self, timers: Dict[str, List[float]], name: str):
+        self.timers = timers
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        entry = self.timers.setdefault(self.name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += time.perf_counter() - self.start
+        return False
+
+
+def phase(name: str):
+    """Time a step (load, parse, validate, subprocess, print) of the current profiled run."""
+    if _active is None or _active.timers is None:
+        return _NULL_PHASE
+    return _Phase(_active.timers, name)
+
+
+def _profile_kinds(value: str) -> List[str]:
+    kinds = [kind.strip() for kind in value.split(',') if kind.strip()]
+    unknown = set(kinds) - set(PROFILE_KINDS)
+    if unknown or not kinds:
+        raise argparse.ArgumentTypeError(f"must be a comma-separated subset of: {', '.join(PROFILE_KINDS)}")
+    return kinds
+
+
+def add_profile_arguments(parser) -> None:
+    """Add the shared profiling options to an argparse parser."""
+    group = parser.add_argument_group('profiling')
+    group.add_argument('--profile', action='store_true', help='Profile this run and write the results to --profile-dir')
+    group.add_argument('--profile-kinds', type=_profile_kinds, default=list(PROFILE_KINDS),
+                       help=f"Comma-separated subset of: {', '.join(PROFILE_KINDS)} (default: all)")
+    group.add_argument('--profile-dir', default='profiles', help='Directory for profile output (default: profiles)')
+    group.add_argument('--profile-top', type=int, default=25, help='Allocation sites to report (default: 25)')
+
+
+def _frame_name(func) -> str:
+    filename, line, name = func
+    if filename == '~':   # built-in
+        return name.strip('<>')
+    return f"{name} ({Path(filename).name}:{line})"
+
+
+def collapsed_stacks(stats) -> Dict[str, int]:
+    """
+    Collapsed ``a;b;c`` stacks with self time in microseconds from pstats data
+
+    cProfile records caller→callee edges, not whole stacks, so each
+    function's self time is split across its callers in proportion to the
+    cumulative time spent under each caller, recursively up to the roots.
+    """
+    raw = stats.stats
+    stacks: Dict[str, int] = {}
+
+    def walk(func, weight, suffix, seen):
+        callers = raw.get(func, (0, 0, 0, 0, {}))[4]
+        path = [_frame_name(func)] + suffix
+        if not callers or len(path) >= MAX_STACK_DEPTH or func in seen:
+            key = ";".join(path)
+            stacks[key] = stacks.get(key, 0) + int(round(weight))
+            return
+        total = sum(edge[3] for edge in callers.values())
+        for caller, edge in callers.items():
+            share = weight * (edge[3] / total if total else 1 / len(callers))
+            if share >= MIN_STACK_MICROSECONDS:
+                walk(caller, share, path, seen | {func})
+
+    for func, (_, _, self_time, _, _) in raw.items():
+        if self_time * 1e6 >= MIN_STACK_MICROSECONDS:
+            walk(func, self_time * 1e6, [], frozenset())
+    return {stack: weight for stack, weight in stacks.items() if weight > 0}
+
+
+class ProfileSession:
+    """One profiled run; writes its outputs when stopped"""
+
+    def __init__(self, name: str, kinds: List[str], directory: str = "profiles", top: int = 25):
+        unknown = set(kinds) - set(PROFILE_KINDS)
+        if unknown:
+            raise ValueError(f"Invalid profile kinds {sorted(unknown)}. Must be among: {PROFILE_KINDS}")
+        self.name = name
+        self.kinds = kinds
+        self.directory = Path(directory)
+        self.top = top
+        self.timers: Optional[Dict[str, List[float]]] = {} if 'phases' in kinds else None
+        self.profiler = None
+        self.snapshot = None
+        self.written: List[Path] = []
+
+    def start(self) -> None:
+        if 'tracemalloc' in self.kinds:
+            import tracemalloc
+            tracemalloc.start()
+        if 'cprofile' in self.kinds:
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def stop(self) -> None:
+        if self.profiler:
+            self.profiler.disable()
+        if 'tracemalloc' in self.kinds:
+            import tracemalloc
+            self.snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+    def write(self) -> List[Path]:
+        """Write every collected profile and return the paths."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stem = self.directory / f"{self.name}-{time.strftime('%Y%m%d-%H%M%S')}"
+
+        if self.profiler:
+            import pstats
+            stats = pstats.Stats(self.profiler)
+            self._write(stem.with_suffix(".pstats"), stats.dump_stats)
+            stacks = collapsed_stacks(stats)
+            self._write_text(stem.with_suffix(".collapsed"),
+                             "".join(f"{stack} {weight}\n" for stack, weight in sorted(stacks.items())))
+
+        if self.snapshot:
+            self._write(Path(f"{stem}.tracemalloc.snapshot"), self.snapshot.dump)
+            stats = self.snapshot.statistics("lineno")
+            total = sum(s.size for s in stats)
+            lines = [f"Total allocated (still live at exit): {total / 1024:.1f} KiB in {len(stats)} sites", ""]
+            lines += [str(s) for s in stats[:self.top]]
+            self._write_text(Path(f"{stem}.tracemalloc.txt"), "\n".join(lines) + "\n")
+
+        if self.timers is not None:
+            phases = {name: {"calls": calls, "seconds": round(seconds, 6)} for name, (calls, seconds) in self.timers.items()}
+            self._write_text(Path(f"{stem}.phases.json"), json.dumps(phases, indent=2) + "\n")
+        return self.written
+
+    def _write(self, path: Path, writer) -> None:
+        writer(str(path))
+        self.written.append(path)
+
+    def _write_text(self, path: Path, text: str) -> None:
+        path.write_text(text, encoding="utf-8")
+        self.written.append(path)
+
+    def print_summary(self) -> None:
+        """Phase table and output paths, on stderr so stdout stays clean."""
+        if self.timers:
+            print("\n⏱️  Phases:", file=sys.stderr)
+            for name, (calls, seconds) in sorted(self.timers.items(), key=lambda item: -item[1][1]):
+                print(f"  {name:<12}{seconds * 1e3:>10.2f} ms  ({calls} calls)", file=sys.stderr)
+        for path in self.written:
+            print(f"📄 {path}", file=sys.stderr)
+
+
+@contextmanager
+def profile_session(name: str, args):
+    """
+    Profile the enclosed run when ``args.profile`` is set
+
+    Outputs are written even if the run ends with ``sys.exit``.
+    """
+    global _active
+    if not getattr(args, 'profile', False):
+        yield None
+        return
+
+    session = ProfileSession(name, args.profile_kinds, args.profile_dir, args.profile_top)
+    _active = session
+    session.start()
+    try:
+        yield session
+    finally:
+        session.stop()
+        _active = None
+        session.write()
+        session.print_summary()
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Prompt Footprint Analyzer for watsonx Orchestrate ADK
+Estimates the prompt tokens each agent sends per LLM turn, flags redundant
+instructions, checks token budgets and can emit compacted instructions
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+from tool_signatures import load_tool_signatures
+
+# Pre-tokenizer in the spirit of the BPE tokenizers used by Llama 3 / GPT:
+# words (with an optional leading space), digit runs, punctuation, newlines.
+TOKEN_PATTERN = re.compile(r" ?[A-Za-z]+| ?\d{1,3}| ?[^\sA-Za-z\d]+|\n+|\s+")
+
+# Average characters per sub-word piece for words a BPE vocabulary does not
+# hold whole. Short words are almost always a single token.
+CHARS_PER_PIECE = 4
+WHOLE_WORD_MAX = 7
+
+QUOTED = re.compile(r'"([^"]+)"')
+WORD = re.compile(r"[a-z0-9_]+")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of ``text`` without a model tokenizer.
+
+    This is an approximation of a BPE tokenizer, good enough to compare
+    agents and track budgets offline; it is not an exact model count.
+    """
+    if not text:
+        return 0
+    count = 0
+    for piece in TOKEN_PATTERN.findall(text):
+        word = piece.lstrip(" ")
+        if word.isalpha() and len(word) > WHOLE_WORD_MAX:
+            count += -(-len(word) // CHARS_PER_PIECE)
+        else:
+            count += 1
+    return count
+
+
+def _words(line: str) -> set:
+    return set(WORD.findall(line.lower()))
+
+
+def _jaccard(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _mentioned(line: str, names: List[str]) -> List[str]:
+    return [n for n in names if re.search(rf"(?<![\w-]){re.escape(n)}(?![\w-])", line)]
+
+
+class _BlockDumper(yaml.SafeDumper):
+    """Safe dumper that keeps multi-line strings as readable '|' blocks."""
+
+
+def _represent_str(dumper, value):
+    style = "|" if "\n" in value else None
+    return dumper.represent_scalar("tag:yaml.org,2002:str", value, style=style)
+
+
+_BlockDumper.add_representer(str, _represent_str)
+
+
+class PromptAnalyzer:
+    """Estimates and audits the per-turn prompt footprint of agent YAMLs"""
+
+    # Default per-agent token budget for instructions + tools + collaborators
+    DEFAULT_BUDGET = 2000
+
+    # Lines at least this similar (word Jaccard) count as duplicates
+    DUPLICATE_THRESHOLD = 0.8
+
+    def __init__(self, agents_dir: str = "agents", tools_dir: str = "tools",
+                 budget: int = DEFAULT_BUDGET, budgets: Optional[Dict[str, int]] = None):
+        self.agents_dir = Path(agents_dir)
+        self.tools_dir = Path(tools_dir)
+        self.budget = budget
+        self.budgets = budgets or {}
+        self.errors = []
+        self.warnings = []
+        self.reports = []
+
+    def load_agents(self) -> Dict[str, Dict]:
+        agents = {}
+        for path in sorted(self.agents_dir.glob("*.y*ml")):
+            with open(path, 'r', encoding='utf-8') as file:
+                config = yaml.safe_load(file) or {}
+            if config.get("name"):
+                agents[config["name"]] = config
+        return agents
+
+    def analyze(self) -> List[Dict]:
+        """
+        Build a footprint report for every agent
+
+        Returns:
+            List of per-agent report dictionaries
+        """
+        self.errors = []
+        self.warnings = []
+        self.reports = []
+
+        agents = self.load_agents()
+        tools = load_tool_signatures(self.tools_dir) if self.tools_dir.exists() else {}
+
+        for name, config in agents.items():
+            self.reports.append(self._analyze_agent(name, config, agents, tools))
+        return self.reports
+
+    def _analyze_agent(self, name: str, config: Dict, agents: Dict, tools: Dict) -> Dict:
+        instructions = config.get("instructions") or ""
+        description = config.get("description") or ""
+
+        tool_tokens = 0
+        for tool_name in config.get("tools") or []:
+            if tool_name not in tools:
+                self.warnings.append(f"{name}: tool '{tool_name}' not found in {self.tools_dir}/")
+                continue
+            tool_tokens += estimate_tokens(tools[tool_name].render())
+
+        collaborator_tokens = 0
+        for collaborator in config.get("collaborators") or []:
+            if collaborator not in agents:
+                self.warnings.append(f"{name}: collaborator '{collaborator}' not found in {self.agents_dir}/")
+                continue
+            entry = json.dumps(
+                {"name": collaborator, "description": agents[collaborator].get("description", "")},
+                separators=(",", ":"),
+            )
+            collaborator_tokens += estimate_tokens(entry)
+
+        report = {
+            "agent": name,
+            "instructions": estimate_tokens(instructions),
+            "description": estimate_tokens(description),
+            "tools": tool_tokens,
+            "collaborators": collaborator_tokens,
+        }
+        report["total"] = report["instructions"] + report["tools"] + report["collaborators"]
+        report["budget"] = self.budgets.get(name, self.budget)
+        report["redundancy"] = self.find_redundancy(
+            instructions, list(config.get("tools") or []) + list(config.get("collaborators") or [])
+        )
+
+        if report["total"] > report["budget"]:
+            self.errors.append(f"{name}: {report['total']} tokens exceeds budget of {report['budget']}")
+        for finding in report["redundancy"]:
+            self.warnings.append(f"{name}: {finding}")
+        return report
+
+    def find_redundancy(self, instructions: str, names: List[str]) -> List[str]:
+        """
+        Flag near-duplicate lines and tools/collaborators mapped more than once
+
+        Args:
+            instructions: The agent's instruction text
+            names: Tool and collaborator names the agent can call
+
+        Returns:
+            List of human-readable findings
+        """
+        findings = []
+        lines = [line.strip() for line in instructions.splitlines() if line.strip()]
+
+        for i, line in enumerate(lines):
+            for earlier in lines[:i]:
+                if _jaccard(_words(line), _words(earlier)) >= self.DUPLICATE_THRESHOLD:
+                    findings.append(f"near-duplicate instruction line: '{line}'")
+                    break
+
+        for target in names:
+            count = sum(1 for line in lines if _mentioned(line, [target]))
+            if count > 1:
+                findings.append(f"'{target}' is mapped on {count} separate lines")
+        return findings
+
+    def compact_instructions(self, instructions: str, names: List[str]) -> str:
+        """
+        Produce a shorter, behaviour-preserving instruction variant
+
+        Bullet glyphs and runs of spaces are normalised, near-duplicate
+        lines are dropped, and repeated single-target mapping lines are
+        folded into the first line for that target with their quoted
+        examples kept. Markdown emphasis and the indentation of
+        continuation lines are left alone, since reply templates (and
+        fast-path rules checked against them) quote that text exactly.
+        """
+        out = []
+        first_line_for = {}
+        seen_words = []
+        heading, heading_kept, heading_folded = None, False, False
+        drop = set()
+
+        def close_heading():
+            # A heading whose list items were all folded away says nothing
+            if heading is not None and heading_folded and not heading_kept:
+                drop.add(heading)
+
+        for raw in instructions.splitlines():
+            indent = raw[:len(raw) - len(raw.lstrip())].expandtabs(4)
+            line = re.sub(r"^[•·▪]\s*|^\*\s+", "- ", raw.strip())
+            line = re.sub(r"[ \t]+", " ", line)
+            if not line:
+                close_heading()
+                heading, heading_kept, heading_folded = None, False, False
+                if out and out[-1]:
+                    out.append("")
+                continue
+
+            words = _words(line)
+            if any(_jaccard(words, w) >= self.DUPLICATE_THRESHOLD for w in seen_words):
+                heading_folded = True
+                continue
+
+            targets = _mentioned(line, names)
+            if len(targets) == 1 and targets[0] in first_line_for:
+                examples = QUOTED.findall(line)
+                if examples:
+                    index = first_line_for[targets[0]]
+                    quoted = ", ".join(f'"{e}"' for e in examples)
+                    out[index] = f"{out[index]} (e.g. {quoted})"
+                heading_folded = True
+                continue
+            if len(targets) == 1:
+                first_line_for[targets[0]] = len(out)
+
+            if line.endswith(":"):
+                close_heading()
+                heading, heading_kept, heading_folded = len(out), False, False
+            elif heading is not None:
+                heading_kept = True
+
+            seen_words.append(words)
+            out.append(indent + line)
+        close_heading()
+
+        compact = []
+        for i, line in enumerate(out):
+            if i in drop or (not line and (not compact or not compact[-1])):
+                continue
+            compact.append(line)
+        return "\n".join(compact).strip() + "\n"
+
+    def write_compacted(self, output_dir: str) -> List[Dict]:
+        """Write ``<agent>.yaml`` copies with compacted instructions to ``output_dir``."""
+        out_path = Path(output_dir)
+        out_path.mkdir(parents=True, exist_ok=True)
+        results = []
+        for name, config in self.load_agents().items():
+            instructions = config.get("instructions") or ""
+            names = list(config.get("tools") or []) + list(config.get("collaborators") or [])
+            compacted = self.compact_instructions(instructions, names)
+            if estimate_tokens(compacted) >= estimate_tokens(instructions):
+                compacted = instructions
+            variant = dict(config, instructions=compacted)
+            with open(out_path / f"{name}.yaml", 'w', encoding='utf-8') as file:
+                yaml.dump(variant, file, Dumper=_BlockDumper, sort_keys=False, allow_unicode=True, width=1000)
+            results.append({
+                "agent": name,
+                "before": estimate_tokens(instructions),
+                "after": estimate_tokens(compacted),
+            })
+        return results
+
+    def print_results(self) -> None:
+        """Print the per-agent report followed by findings"""
+        header = f"{'agent':<22}{'instr':>7}{'tools':>7}{'collab':>8}{'total':>7}{'budget':>8}"
+        print(header)
+        print("-" * len(header))
+        for r in self.reports:
+            status = "❌" if r["total"] > r["budget"] else "✅"
+            print(
+                f"{r['agent']:<22}{r['instructions']:>7}{r['tools']:>7}{r['collaborators']:>8}"
+                f"{r['total']:>7}{r['budget']:>8}  {status}"
+            )
+        print()
+
+        if self.errors:
+            print("❌ BUDGET ERRORS:")
+            for error in self.errors:
+                print(f"  • {error}")
+
+        if self.warnings:
+            print("⚠️  WARNINGS:")
+            for warning in self.warnings:
+                print(f"  • {warning}")
+
+        if not self.errors and not self.warnings:
+            print("✅ All agents within budget, no redundancy found.")
+        elif not self.errors:
+            print("✅ All agents within budget. Only warnings found.")
+
+
+def _parse_budget(value: str) -> Tuple[str, int]:
+    """argparse type for ``--budget-for AGENT=TOKENS``."""
+    name, _, tokens = value.partition("=")
+    if not name or not tokens.isdigit():
+        raise argparse.ArgumentTypeError(f"expected AGENT=TOKENS, got: '{value}'")
+    return name, int(tokens)
+
+
+def main():
+    """Main function to run the analyzer"""
+    parser = argparse.ArgumentParser(
+        description="Estimate per-agent prompt tokens and audit instruction redundancy",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python prompt_footprint.py
+  python prompt_footprint.py --budget 500 --budget-for orchestrator_agent=700
+  python prompt_footprint.py --compact build/compact_agents
+  python prompt_footprint.py --json
+        """
+    )
+    parser.add_argument('--agents-dir', default='agents', help='Directory with agent YAML files')
+    parser.add_argument('--tools-dir', default='tools', help='Directory with Python tool files')
+    parser.add_argument('--budget', type=int, default=PromptAnalyzer.DEFAULT_BUDGET,
+                        help='Default per-agent token budget')
+    parser.add_argument('--budget-for', type=_parse_budget, action='append', default=[], metavar='AGENT=TOKENS',
+                        help='Per-agent budget override (repeatable)')
+    parser.add_argument('--compact', metavar='DIR', help='Write compacted agent YAML variants to DIR')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    args = parser.parse_args()
+
+    analyzer = PromptAnalyzer(args.agents_dir, args.tools_dir, args.budget, dict(args.budget_for))
+    analyzer.analyze()
+
+    if args.json:
+        print(json.dumps({
+            "agents": analyzer.reports,
+            "errors": analyzer.errors,
+            "warnings": analyzer.warnings,
+        }, indent=2))
+    else:
+        analyzer.print_results()
+
+    if args.compact:
+        results = analyzer.write_compacted(args.compact)
+        if not args.json:
+            print(f"\n📝 Compacted instructions written to {args.compact}/")
+            for r in results:
+                print(f"  • {r['agent']}: {r['before']} → {r['after']} instruction tokens")
+
+    sys.exit(0 if not analyzer.errors else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Readiness Prober and Warm-up for watsonx Orchestrate Developer Edition
+Waits for the server to report healthy using exponential backoff with jitter,
+then sends one canned request per agent so the first real request does not
+pay the cold-start cost
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+import yaml
+
+from agent_bundle import load_agents
+
+DEFAULT_BASE_URL = "http://localhost:4321"
+HEALTH_PATH = "/api/v1/health"
+AGENTS_PATH = "/api/v1/orchestrate/agents"
+CHAT_PATH = "/api/v1/orchestrate/{agent_id}/chat/completions"
+DEFAULT_MESSAGE = "hello"
+
+# Where the orchestrate CLI keeps environments and credentials
+CONFIG_FILE = Path.home() / ".config" / "orchestrate" / "config.yaml"
+CREDENTIALS_FILE = Path.home() / ".cache" / "orchestrate" / "credentials.yaml"
+
+
+@dataclass
+class ReadinessResult:
+    """Outcome of waiting for the health endpoint."""
+    ready: bool
+    seconds: float
+    attempts: int
+    last_error: str = ""
+
+
+@dataclass
+class WarmupResult:
+    """Cold and warm latency of one agent's canned request."""
+    agent: str
+    message: str
+    cold_seconds: Optional[float] = None
+    warm_seconds: Optional[float] = None
+    error: str = ""
+
+    @property
+    def speedup(self) -> Optional[float]:
+        if self.cold_seconds and self.warm_seconds:
+            return self.cold_seconds / self.warm_seconds
+        return None
+
+
+@dataclass
+class StartupReport:
+    readiness: ReadinessResult
+    warmup: List[WarmupResult] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return {
+            "readiness": asdict(self.readiness),
+            "warmup": [dict(asdict(r), speedup=r.speedup) for r in self.warmup],
+        }
+
+
+def backoff_delays(initial: float = 0.25, factor: float = 2.0, max_delay: float = 5.0,
+                   jitter: float = 0.5, rng: Optional[random.Random] = None) -> Iterator[float]:
+    """
+    Yield exponentially growing delays, each randomised by ``±jitter``
+
+    The jitter keeps several waiting clients (start.sh, run.sh, CI) from
+    polling the server in lockstep while it is busy starting up.
+    """
+    rng = rng or random.Random()
+    delay = initial
+    while True:
+        yield min(max_delay, delay) * rng.uniform(1 - jitter, 1 + jitter)
+        delay *= factor
+
+
+def wait_until_ready(url: str, timeout: float = 180.0, request_timeout: float = 5.0,
+                     delays: Optional[Iterator[float]] = None,
+                     sleep: Callable[[float], None] = time.sleep) -> ReadinessResult:
+    """
+    Poll ``url`` until it answers 2xx or ``timeout`` seconds have passed
+
+    Args:
+        url: Health endpoint to poll
+        timeout: Give up after this many seconds
+        request_timeout: Timeout for each individual request
+        delays: Delays between attempts (default: backoff_delays())
+
+    Returns:
+        ReadinessResult with the time-to-ready and the number of attempts
+    """
+    delays = delays or backoff_delays()
+    start = time.monotonic()
+    attempts, last_error = 0, ""
+    while True:
+        attempts += 1
+        remaining = timeout - (time.monotonic() - start)
+        try:
+            with urllib.request.urlopen(url, timeout=max(0.1, min(request_timeout, remaining))) as response:
+                if 200 <= response.status < 300:
+                    return ReadinessResult(True, time.monotonic() - start, attempts)
+                last_error = f"HTTP {response.status}"
+        except urllib.error.HTTPError as e:
+            last_error = f"HTTP {e.code}"
+        except (urllib.error.URLError, OSError) as e:
+            last_error = str(getattr(e, "reason", e))
+
+        remaining = timeout - (time.monotonic() - start)
+        if remaining <= 0:
+            return ReadinessResult(False, time.monotonic() - start, attempts, last_error)
+        sleep(min(next(delays), remaining))
+
+
+def load_warmup_requests(agents_dir: str = "agents", config_file: Optional[str] = "warmup.yaml") -> Dict[str, str]:
+    """
+    One canned message per agent in ``agents_dir``
+
+    ``config_file`` may set ``default_message``, per-agent ``messages`` and a
+    ``skip`` list; agents without an entry get the default message.
+    """
+    config = {}
+    if config_file and Path(config_file).exists():
+        with open(config_file, 'r', encoding='utf-8') as file:
+            config = yaml.safe_load(file) or {}
+    default = config.get('default_message', DEFAULT_MESSAGE)
+    messages = config.get('messages') or {}
+    skip = set(config.get('skip') or [])
+
+    return {name: messages.get(name, default) for name in load_agents(agents_dir) if name not in skip}
+
+
+def read_cli_token(config_file: Path = CONFIG_FILE, credentials_file: Path = CREDENTIALS_FILE) -> Optional[str]:
+    """Bearer token the orchestrate CLI cached for its active environment, if any."""
+    try:
+        with open(config_file, 'r', encoding='utf-8') as file:
+            env = (yaml.safe_load(file) or {}).get('context', {}).get('active_environment') or 'local'
+        with open(credentials_file, 'r', encoding='utf-8') as file:
+            return (yaml.safe_load(file) or {}).get('auth', {}).get(env, {}).get('wxo_mcsp_token')
+    except (OSError, yaml.YAMLError, AttributeError):
+        return None
+
+
+class ChatClient:
+    """Minimal client for the local server's agent and chat endpoints"""
+
+    def __init__(self, base_url: str = DEFAULT_BASE_URL, token: Optional[str] = None, timeout: float = 120.0):
+        self.base_url = base_url.rstrip('/')
+        self.token = token
+        self.timeout = timeout
+
+    def _request(self, path: str, payload: Optional[Dict] = None):
+        data = json.dumps(payload).encode('utf-8') if payload is not None else None
+        request = urllib.request.Request(self.base_url + path, data=data, method="POST" if data else "GET")
+        request.add_header("Accept", "application/json")
+        if data:
+            request.add_header("Content-Type", "application/json")
+        if self.token:
+            request.add_header("Authorization", f"Bearer {self.token}")
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read() or b"null")
+
+    def agent_ids(self) -> Dict[str, str]:
+        """
+        Map agent name to id for every agent imported on the server
+
+        Raises:
+            ValueError: If the listing is not a list of agents with a name and id
+        """
+        agents = self._request(AGENTS_PATH) or []
+        if not isinstance(agents, list):
+            raise ValueError(f"expected a list of agents, got {type(agents).__name__}")
+        try:
+            return {agent["name"]: agent["id"] for agent in agents}
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"malformed agent entry (missing {e})") from e
+
+    def ask(self, agent_id: str, message: str):
+        payload = {"messages": [{"role": "user", "content": message}], "stream": False}
+        return self._request(CHAT_PATH.format(agent_id=agent_id), payload)
+
+
+def warm_up(client: ChatClient, requests: Dict[str, str]) -> List[WarmupResult]:
+    """
+    Send each agent its canned message twice
+
+    The first call is the cold request a user would otherwise hit; the
+    second shows what a request costs once connections and caches are primed.
+    """
+    try:
+        ids = client.agent_ids()
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        return [WarmupResult(agent, message, error=f"could not list agents: {e}") for agent, message in requests.items()]
+
+    results = []
+    for agent, message in requests.items():
+        result = WarmupResult(agent, message)
+        results.append(result)
+        if agent not in ids:
+            result.error = "not imported"
+            continue
+        try:
+            for attr in ("cold_seconds", "warm_seconds"):
+                start = time.perf_counter()
+                client.ask(ids[agent], message)
+                setattr(result, attr, time.perf_counter() - start)
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            result.error = str(getattr(e, "reason", e))
+    return results
+
+
+def print_report(report: StartupReport) -> None:
+    readiness = report.readiness
+    if readiness.ready:
+        print(f"✅ Server ready after {readiness.seconds:.2f}s ({readiness.attempts} attempts)")
+    else:
+        print(f"❌ Server not ready after {readiness.seconds:.2f}s ({readiness.attempts} attempts): "
+              f"{readiness.last_error}")
+    if not report.warmup:
+        return
+
+    print(f"\n🔥 Warm-up ({len(report.warmup)} agents)")
+    print(f"{'agent':<24}{'cold (s)':>10}{'warm (s)':>10}{'speedup':>9}")
+    for r in report.warmup:
+        if r.error:
+            print(f"{r.agent:<24}  ⚠️  {r.error}")
+        else:
+            print(f"{r.agent:<24}{r.cold_seconds:>10.3f}{r.warm_seconds:>10.3f}{r.speedup:>8.1f}x")
+
+
+def main():
+    """Main function to run the readiness prober"""
+    parser = argparse.ArgumentParser(
+        description="Wait for watsonx Orchestrate to be ready, then warm up every agent",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python readiness.py                       # wait, then warm up agents/*.yaml
+  python readiness.py --no-warmup --timeout 60
+  python readiness.py --warmup-config warmup.yaml --json
+        """
+    )
+    parser.add_argument('--url', default=DEFAULT_BASE_URL, help=f'Server base URL (default: {DEFAULT_BASE_URL})')
+    parser.add_argument('--timeout', type=float, default=180, help='Seconds to wait for readiness (default: 180)')
+    parser.add_argument('--max-delay', type=float, default=5.0, help='Longest pause between polls in seconds')
+    parser.add_argument('--no-warmup', action='store_true', help='Only wait for readiness')
+    parser.add_argument('--agents-dir', default='agents', help='Directory with agent YAML files')
+    parser.add_argument('--warmup-config', default='warmup.yaml', help='Canned warm-up messages per agent')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    args = parser.parse_args()
+
+    url = args.url.rstrip('/')
+    readiness = wait_until_ready(url + HEALTH_PATH, timeout=args.timeout,
+                                 delays=backoff_delays(max_delay=args.max_delay))
+    report = StartupReport(readiness)
+    if readiness.ready and not args.no_warmup:
+        client = ChatClient(url, token=read_cli_token())
+        report.warmup = warm_up(client, load_warmup_requests(args.agents_dir, args.warmup_config))
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print_report(report)
+
+    # Warm-up problems are reported but never block startup
+    sys.exit(0 if readiness.ready else 1)
+
+
+if __name__ == "__main__":
+    main()
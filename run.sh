@@ -58,8 +58,8 @@ check_orchestrate() {
 check_server() {
     echo -e "${YELLOW}Checking if orchestrate server is running...${NC}"
     
-    # Try to ping the server
-    if curl -s http://localhost:4321/api/v1/health > /dev/null 2>&1; then
+    # Poll the health endpoint with backoff instead of failing on the first miss
+    if python readiness.py --no-warmup --timeout "${READY_TIMEOUT:-60}"; then
         echo -e "${GREEN}✓ Server is running${NC}"
     else
         echo -e "${RED}✗ Server is not running or not ready${NC}"
@@ -170,6 +170,18 @@ list_agents() {
     check_command "Agent listing"
 }
 
+# Function to compile agents and tools into build/agents.bundle for the Python helpers
+compile_bundle() {
+    echo -e "${CYAN}Step 4a: Compiling agent bundle...${NC}"
+    python agent_bundle.py build || echo -e "${YELLOW}Warning: bundle not built, helpers will read the source files${NC}"
+}
+
+# Function to prime each agent so the first chat request is not a cold one
+warm_up_agents() {
+    echo -e "${CYAN}Step 4b: Warming up agents...${NC}"
+    python readiness.py --timeout 10 || echo -e "${YELLOW}Warning: warm-up skipped, server not ready${NC}"
+}
+
 # Function to ask about starting UI
 # Function to ask about starting UI
 ask_start_ui_old() {
@@ -265,6 +277,8 @@ main() {
     import_tools
     import_agents
     list_agents
+    compile_bundle
+    warm_up_agents
     show_info
     ask_start_ui
     
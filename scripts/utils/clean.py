@@ -1,20 +1,26 @@
 # clean.py
 
+import argparse
 import re
 import sys
 import subprocess
 from pathlib import Path
 
+# profiling.py lives at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from profiling import add_profile_arguments, phase, profile_session  # noqa: E402
+
 def extract_names_from_file(path):
     """
     Reads a file and extracts all values from the "name" key using regex.
     This approach works even if the JSON is malformed.
     """
     try:
-        with open(path, 'r', encoding='utf-8') as f:
+        with phase('load'), open(path, 'r', encoding='utf-8') as f:
             content = f.read()
         # Use regex to find all values associated with a "name" key
-        names = re.findall(r'"name":\s*"([^"]+)"', content)
+        with phase('parse'):
+            names = re.findall(r'"name":\s*"([^"]+)"', content)
         return names
     except FileNotFoundError:
         print(f"Error: File not found at {path}", file=sys.stderr)
@@ -27,15 +33,16 @@ def list_and_enumerate(names, title):
     """
     Prints a numbered list of names under a given title.
     """
-    print(f"{title}:")
-    if not names:
-        print("  <none found>")
-        return False
-    else:
-        for idx, name in enumerate(names, start=1):
-            print(f"{idx}. {name}")
-    print()  # Add a blank line for better readability
-    return True
+    with phase('print'):
+        print(f"{title}:")
+        if not names:
+            print("  <none found>")
+            return False
+        else:
+            for idx, name in enumerate(names, start=1):
+                print(f"{idx}. {name}")
+        print()  # Add a blank line for better readability
+        return True
 
 def get_user_choice(prompt, valid_choices):
     """
@@ -81,7 +88,8 @@ def remove_agent(agent_name):
         # For agents, we need to specify the kind. Assuming 'native' as default
         # You might need to adjust this based on your agent types
         cmd = ["orchestrate", "agents", "remove", "--name", agent_name, "--kind", "native"]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        with phase('subprocess'):
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
         print(f"✓ Successfully removed agent: {agent_name}")
         if result.stdout:
             print(f"Output: {result.stdout}")
@@ -101,7 +109,8 @@ def remove_tool(tool_name):
     """
     try:
         cmd = ["orchestrate", "tools", "remove", "-n", tool_name]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        with phase('subprocess'):
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
         print(f"✓ Successfully removed tool: {tool_name}")
         if result.stdout:
             print(f"Output: {result.stdout}")
@@ -116,6 +125,14 @@ def remove_tool(tool_name):
         return False
 
 def main():
+    parser = argparse.ArgumentParser(description="Interactively remove one agent or tool listed in agents.json / tools.json")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    with profile_session('clean', args):
+        run()
+
+def run():
     base = Path(__file__).parent
     agents_path = base / 'agents.json'
     tools_path = base / 'tools.json'
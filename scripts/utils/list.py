@@ -1,19 +1,25 @@
 # list.py
 
+import argparse
 import re
 import sys
 from pathlib import Path
 
+# profiling.py lives at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from profiling import add_profile_arguments, phase, profile_session  # noqa: E402
+
 def extract_names_from_file(path):
     """
     Reads a file and extracts all values from the "name" key using regex.
     This approach works even if the JSON is malformed.
     """
     try:
-        with open(path, 'r', encoding='utf-8') as f:
+        with phase('load'), open(path, 'r', encoding='utf-8') as f:
             content = f.read()
         # Use regex to find all values associated with a "name" key
-        names = re.findall(r'"name":\s*"([^"]+)"', content)
+        with phase('parse'):
+            names = re.findall(r'"name":\s*"([^"]+)"', content)
         return names
     except FileNotFoundError:
         print(f"Error: File not found at {path}", file=sys.stderr)
@@ -26,16 +32,25 @@ def list_and_enumerate(names, title):
     """
     Prints a numbered list of names under a given title.
     """
-    print(f"{title}:")
-    if not names:
-        print("  <none found>")
-    else:
-        for idx, name in enumerate(names, start=1):
-            # The item is now just the name string itself
-            print(f"{idx}. {name}")
-    print()  # Add a blank line for better readability
+    with phase('print'):
+        print(f"{title}:")
+        if not names:
+            print("  <none found>")
+        else:
+            for idx, name in enumerate(names, start=1):
+                # The item is now just the name string itself
+                print(f"{idx}. {name}")
+        print()  # Add a blank line for better readability
 
 def main():
+    parser = argparse.ArgumentParser(description="List the agents and tools in agents.json and tools.json")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    with profile_session('list', args):
+        run()
+
+def run():
     base = Path(__file__).parent
     agents_path = base / 'agents.json'
     tools_path = base / 'tools.json'
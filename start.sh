@@ -53,4 +53,13 @@ if ! command -v orchestrate &> /dev/null; then
 fi
 # Start the server
 echo -e "${GREEN}Starting server...${NC}"
-orchestrate server start --env-file=.env
\ No newline at end of file
+orchestrate server start --env-file=.env
+
+# Wait until the server answers its health check, then prime every agent
+# (set SKIP_WARMUP=1 to only wait; READY_TIMEOUT overrides the 300s limit)
+echo -e "${GREEN}Waiting for the server to become ready...${NC}"
+WARMUP_ARGS=()
+if [[ -n "${SKIP_WARMUP:-}" ]]; then
+    WARMUP_ARGS+=(--no-warmup)
+fi
+python readiness.py --timeout "${READY_TIMEOUT:-300}" "${WARMUP_ARGS[@]}"
@@ -0,0 +1,28 @@
+"""
+Command-line options for the opt-in performance suite in tests/perf.
+"""
+
+from pathlib import Path
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("perf", "performance benchmarks (tests/perf)")
+    group.addoption("--perf", action="store_true", help="Run the performance benchmarks")
+    group.addoption(
+        "--perf-baseline",
+        default=str(Path(__file__).parent / "perf" / "baselines.json"),
+        help="Baseline JSON file, keyed by machine fingerprint",
+    )
+    group.addoption("--perf-save-baseline", action="store_true",
+                    help="Store this run's results as the baseline for this machine")
+    group.addoption("--perf-threshold", type=float, default=0.15,
+                    help="Relative slowdown of the median that counts as a regression (default 0.15)")
+    group.addoption("--perf-alpha", type=float, default=0.01,
+                    help="Significance level against the baseline's run-to-run spread (default 0.01)")
+    group.addoption("--perf-noise-floor", type=float, default=0.05,
+                    help="Smallest relative run-to-run noise assumed (default 0.05)")
+    group.addoption("--perf-min-runs", type=int, default=3,
+                    help="Baseline runs needed before a benchmark can fail (default 3)")
+    group.addoption("--perf-seed", type=int, default=None,
+                    help="Seed for the benchmark order, which is shuffled on every run")
+    group.addoption("--perf-samples", type=int, default=15, help="Timing samples per benchmark")
@@ -0,0 +1,70 @@
+"""
+Minimal JSON-over-HTTP server shared by tests that need a live endpoint.
+
+Subclass ``JsonServer`` and override ``route`` (or pass a ``route``
+callable) to answer each request with a status code and a JSON payload.
+The server listens on a free local port and runs in a daemon thread while
+used as a context manager.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional, Tuple
+
+Route = Callable[[str, str, Any], Tuple[int, Any]]
+
+
+class JsonServer:
+    """Answer every request with ``route(method, path, body) -> (status, payload)``."""
+
+    def __init__(self, route: Optional[Route] = None):
+        if route is not None:
+            self.route = route
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def route(self, method: str, path: str, body: Any) -> Tuple[int, Any]:
+        return 404, {"error": f"no route for {method} {path}"}
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def dispatch(self, method):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                code, payload = server.route(method, self.path, body)
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self.dispatch("GET")
+
+            def do_POST(self):
+                self.dispatch("POST")
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
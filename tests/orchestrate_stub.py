@@ -0,0 +1,111 @@
+"""
+Local stand-ins for orchestrate environments, used by tests that drive the CLI.
+
+``StubServer`` is a ``JsonServer`` (http_stub.py) holding the agents and tools of one
+environment in memory. ``write_stub_cli`` writes an ``orchestrate``
+executable that understands the handful of commands deploy.py issues. It
+reads the active environment's URL from ``$HOME/.config/orchestrate/config.yaml``
+exactly like the real CLI, and forwards each command to that server.
+"""
+
+import json
+import stat
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict
+
+import yaml
+
+from http_stub import JsonServer
+from tool_signatures import extract_tool_signatures
+
+
+class StubServer(JsonServer):
+    """One fake environment; ``fail_on`` names make their import fail."""
+
+    def __init__(self, fail_on=(), delay: float = 0.0, agents=(), tools=()):
+        super().__init__()
+        self.fail_on = set(fail_on)
+        self.delay = delay
+        self.agents = set(agents)
+        self.tools = set(tools)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def route(self, method, path, body):
+        code, out = self.handle(body["args"])
+        return 200, {"exit": code, "stdout": out}
+
+    def handle(self, args):
+        """Apply one CLI command; return (exit_code, stdout)."""
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls.append(args)
+            resource, action = args[0], args[1]
+            if action == "list":
+                names = self.agents if resource == "agents" else self.tools
+                return 0, json.dumps([{"name": n} for n in sorted(names)])
+            if action == "import":
+                path = Path(args[args.index("-f") + 1])
+                if resource == "tools":
+                    names = set(extract_tool_signatures(path))
+                else:
+                    names = {yaml.safe_load(path.read_text(encoding="utf-8"))["name"]}
+                if names & self.fail_on:
+                    return 1, f"import of {sorted(names)} rejected"
+                (self.tools if resource == "tools" else self.agents).update(names)
+                return 0, ""
+            if action == "remove":
+                name = args[args.index("--name" if "--name" in args else "-n") + 1]
+                (self.tools if resource == "tools" else self.agents).discard(name)
+                return 0, ""
+        return 2, f"unsupported command: {args}"
+
+
+CLI_SOURCE = '''#!{python}
+import json, os, sys, urllib.request
+import yaml
+
+path = os.path.join(os.environ["HOME"], ".config", "orchestrate", "config.yaml")
+with open(path) as fp:
+    config = yaml.safe_load(fp)
+args = sys.argv[1:]
+if args[:2] == ["env", "activate"]:
+    if args[2] not in config["environments"]:
+        sys.exit(f"unknown environment {{args[2]}}")
+    config["context"]["active_environment"] = args[2]
+    with open(path, "w") as fp:
+        yaml.safe_dump(config, fp)
+    sys.exit(0)
+env = config["context"]["active_environment"]
+url = config["environments"][env]["wxo_url"]
+request = urllib.request.Request(url, data=json.dumps({{"args": args}}).encode(), method="POST")
+result = json.load(urllib.request.urlopen(request))
+sys.stdout.write(result["stdout"])
+if result["exit"]:
+    sys.stderr.write(result["stdout"])
+sys.exit(result["exit"])
+'''
+
+
+def write_stub_cli(bin_dir: Path) -> Path:
+    """Write the fake ``orchestrate`` executable into ``bin_dir``."""
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    path = bin_dir / "orchestrate"
+    path.write_text(CLI_SOURCE.format(python=sys.executable), encoding="utf-8")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return path
+
+
+def write_cli_home(home: Path, servers: Dict[str, StubServer]) -> Path:
+    """Write an orchestrate config.yaml under ``home`` that lists ``servers``."""
+    config_dir = home / ".config" / "orchestrate"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    config = {
+        "context": {"active_environment": None},
+        "environments": {name: {"wxo_url": server.url} for name, server in servers.items()},
+    }
+    (config_dir / "config.yaml").write_text(yaml.safe_dump(config), encoding="utf-8")
+    return home
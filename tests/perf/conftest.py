@@ -0,0 +1,103 @@
+"""
+The ``perf`` fixture: measure a callable and gate it against the baseline.
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from harness import BaselineStore, compare, machine_fingerprint, machine_info, measure, reference_workload, summarize
+
+_RESULTS = pytest.StashKey[dict]()
+_SEED = pytest.StashKey[int]()
+PERF_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """
+    Shuffle the benchmarks, so across saved and compared runs each one is
+    measured at a different point of the session instead of always next to
+    the same neighbours.
+    """
+    if not config.getoption("--perf"):
+        return
+    seed = config.getoption("--perf-seed")
+    seed = random.randrange(2 ** 32) if seed is None else seed
+    config.stash[_SEED] = seed
+    slots = [i for i, item in enumerate(items) if item.path == PERF_DIR / "test_perf_benchmarks.py"]
+    shuffled = [items[i] for i in slots]
+    random.Random(seed).shuffle(shuffled)
+    for i, item in zip(slots, shuffled):
+        items[i] = item
+
+
+@pytest.fixture(scope="session")
+def perf_store(request):
+    """Baseline store for the session; saved at the end with --perf-save-baseline."""
+    store = BaselineStore(request.config.getoption("--perf-baseline"))
+    yield store
+    if request.config.getoption("--perf-save-baseline") and request.config.stash.get(_RESULTS, None):
+        store.save()
+
+
+@pytest.fixture
+def perf(request, perf_store):
+    """
+    Return ``check(fn)``, which times ``fn`` and asserts no regression.
+
+    Skipped unless pytest runs with ``--perf``. With ``--perf-save-baseline``
+    the result is added to this machine's baseline as one more run instead
+    of being compared.
+    """
+    config = request.config
+    if not config.getoption("--perf"):
+        pytest.skip("performance benchmarks run only with --perf")
+
+    info = machine_info()
+    fingerprint = machine_fingerprint(info)
+    name = request.node.nodeid.split("::", 1)[-1]
+
+    def check(fn):
+        timings = measure(fn, config.getoption("--perf-samples"), reference=reference_workload)
+        current = summarize(timings["samples"], timings["reference"])
+        row = {"median": current["median"], "ratio": None, "p_value": None, "runs": 0}
+        config.stash.setdefault(_RESULTS, {})[name] = row
+
+        if config.getoption("--perf-save-baseline"):
+            row["runs"] = len(perf_store.add_run(fingerprint, info, name, current)["runs"])
+            return current
+
+        baseline = perf_store.get(fingerprint, name)
+        if baseline is None:
+            return current
+        result = compare(current, baseline, config.getoption("--perf-threshold"), config.getoption("--perf-alpha"),
+                         config.getoption("--perf-noise-floor"), config.getoption("--perf-min-runs"))
+        row.update(ratio=result["ratio"], p_value=result["p_value"], runs=result["runs"])
+        assert not result["regressed"], (
+            f"{name} regressed: median {current['median'] * 1e6:.2f} µs vs baseline "
+            f"{baseline['median'] * 1e6:.2f} µs ({result['ratio']:.2f}x, p={result['p_value']:.4f})"
+        )
+        return current
+
+    return check
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash.get(_RESULTS, None)
+    if not results:
+        return
+    min_runs = config.getoption("--perf-min-runs")
+    terminalreporter.section(f"perf results (machine {machine_fingerprint()}, seed {config.stash.get(_SEED, None)})")
+    for name, row in sorted(results.items()):
+        if config.getoption("--perf-save-baseline"):
+            status = f"baseline now has {row['runs']} run(s)"
+        elif row["ratio"] is None:
+            status = "no baseline"
+        else:
+            status = f"{row['ratio']:.2f}x  p={row['p_value']:.4f}"
+            if row["runs"] < min_runs:
+                status += f"  (not gated: {row['runs']}/{min_runs} baseline runs)"
+        terminalreporter.write_line(f"{name:<60}{row['median'] * 1e6:>12.2f} µs  {status}")
+    if config.getoption("--perf-save-baseline"):
+        terminalreporter.write_line(f"baseline saved to {config.getoption('--perf-baseline')}")
@@ -0,0 +1,213 @@
+"""
+Measurement, baseline storage and regression detection for tests/perf.
+
+Baselines are stored per machine fingerprint so numbers from a laptop are
+never compared with numbers from a CI runner. Each benchmark's samples are
+interleaved with a fixed reference workload, and benchmarks are compared
+both by raw median and by the median sample/reference ratio (the score),
+which cancels most machine-wide load. Samples from one run share that run's
+machine state, so they are not independent: each saved run adds one score
+and one raw median to the baseline, and the current run is tested against
+the spread of those runs. A benchmark only counts as a regression when the
+baseline has enough runs and both its score and its raw median slowed down
+by more than the relative threshold, significantly against the run-to-run
+spread, floored by the relative noise (MAD) of the current samples and a
+fixed minimum.
+"""
+
+import hashlib
+import json
+import math
+import os
+import platform
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Each timing sample should last at least this long to swamp timer noise
+MIN_SAMPLE_SECONDS = 0.01
+DEFAULT_SAMPLES = 15
+# With a reference workload, each sample alternates this many blocks of
+# benchmark and reference calls
+INTERLEAVE = 5
+# Baseline runs kept per benchmark, and needed before it can fail
+MAX_BASELINE_RUNS = 10
+MIN_BASELINE_RUNS = 3
+# Scale factor that makes the MAD a consistent estimator of a normal sigma
+MAD_TO_SIGMA = 1.4826
+
+
+def _cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as fp:
+            for line in fp:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor()
+
+
+def machine_info() -> Dict[str, str]:
+    """Hardware/runtime facts that make timings comparable (no hostname)."""
+    return {
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "cpu": _cpu_model(),
+        "cpu_count": str(os.cpu_count()),
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+    }
+
+
+def machine_fingerprint(info: Optional[Dict[str, str]] = None) -> str:
+    info = info or machine_info()
+    blob = json.dumps(info, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()[:16]
+
+
+def reference_workload() -> int:
+    """Fixed pure-Python work (loops, str and dict churn) that benchmarks are normalised by."""
+    counts = {}
+    for i in range(500):
+        key = str(i % 37)
+        counts[key] = counts.get(key, 0) + len(key)
+    return sum(counts.values())
+
+
+def _calibrate(fn: Callable[[], object]) -> int:
+    """Calls per sample so that a sample runs for at least MIN_SAMPLE_SECONDS."""
+    fn()  # warm caches and imports
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SAMPLE_SECONDS:
+            return number
+        number *= 2 if elapsed == 0 else max(2, min(10, math.ceil(MIN_SAMPLE_SECONDS / elapsed)))
+
+
+def _sample(fn: Callable[[], object], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number
+
+
+def measure(fn: Callable[[], object], samples: int = DEFAULT_SAMPLES,
+            reference: Optional[Callable[[], object]] = None) -> Dict[str, List[float]]:
+    """
+    Time ``fn`` and return ``samples`` per-call durations in seconds.
+
+    The number of calls per sample is calibrated up front so every sample
+    runs for at least MIN_SAMPLE_SECONDS. With a ``reference`` callable,
+    each sample alternates up to INTERLEAVE blocks of ``fn`` and
+    ``reference`` calls and also yields a reference sample, so load that comes and goes
+    during the run hits both alike.
+    """
+    number = _calibrate(fn)
+    results = {"samples": [], "reference": []}
+    if not reference:
+        results["samples"] = [_sample(fn, number) for _ in range(samples)]
+        return results
+
+    count = min(INTERLEAVE, number)   # slow benchmarks get fewer, longer blocks
+    block = number // count
+    reference_block = max(1, _calibrate(reference) // count)
+    for _ in range(samples):
+        blocks = [(_sample(fn, block), _sample(reference, reference_block)) for _ in range(count)]
+        results["samples"].append(sum(b[0] for b in blocks) / count)
+        results["reference"].append(sum(b[1] for b in blocks) / count)
+    return results
+
+
+def summarize(samples: List[float], reference: Optional[List[float]] = None) -> Dict[str, object]:
+    """
+    Median and MAD of the samples, plus the ``score`` that is compared
+
+    The score is the median of sample/reference ratios when reference
+    samples are given, otherwise the plain median.
+    """
+    median = statistics.median(samples)
+    mad = statistics.median(abs(s - median) for s in samples)
+    relative = [s / r for s, r in zip(samples, reference)] if reference else samples
+    score = statistics.median(relative)
+    score_mad = statistics.median(abs(s - score) for s in relative)
+    return {"samples": samples, "median": median, "mad": mad, "min": min(samples),
+            "score": score, "score_mad": score_mad}
+
+
+def _relative_sigma(values: List[float], center: float) -> float:
+    """Robust sigma of ``values`` on a log scale, i.e. relative to ``center``."""
+    return MAD_TO_SIGMA * statistics.median(abs(math.log(v / center)) for v in values)
+
+
+class BaselineStore:
+    """JSON file of benchmark summaries keyed by machine fingerprint."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.data = {}
+        if self.path.exists():
+            self.data = json.loads(self.path.read_text(encoding="utf-8"))
+
+    def get(self, fingerprint: str, name: str) -> Optional[Dict[str, object]]:
+        return self.data.get(fingerprint, {}).get("benchmarks", {}).get(name)
+
+    def add_run(self, fingerprint: str, info: Dict[str, str], name: str, summary: Dict[str, object]) -> Dict[str, object]:
+        """Append one run's score to the benchmark's baseline, keeping the last MAX_BASELINE_RUNS."""
+        entry = self.data.setdefault(fingerprint, {"machine": info, "benchmarks": {}})
+        entry["machine"] = info
+        previous = entry["benchmarks"].get(name, {})
+        runs = (previous.get("runs", []) + [summary["score"]])[-MAX_BASELINE_RUNS:]
+        medians = (previous.get("medians", []) + [summary["median"]])[-MAX_BASELINE_RUNS:]
+        entry["benchmarks"][name] = {"runs": runs, "medians": medians, "median": statistics.median(medians)}
+        return entry["benchmarks"][name]
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _shift(value: float, spread: float, runs: List[float], noise_floor: float):
+    """Ratio of ``value`` to the median run and its one-sided p-value against the noise."""
+    center = statistics.median(runs)
+    ratio = value / center
+    noise = max(
+        _relative_sigma(runs, center) if len(runs) > 1 else 0.0,
+        MAD_TO_SIGMA * spread / value,
+        math.log1p(noise_floor),
+    )
+    return ratio, 0.5 * math.erfc(math.log(ratio) / noise / math.sqrt(2))
+
+
+def compare(current: Dict[str, object], baseline: Dict[str, object], threshold: float, alpha: float,
+            noise_floor: float = 0.05, min_runs: int = MIN_BASELINE_RUNS) -> Dict[str, object]:
+    """
+    Decide whether ``current`` regressed against ``baseline``.
+
+    Returns a dict with the score ratio, the p-value and a ``regressed``
+    flag that is true only when the baseline holds at least ``min_runs``
+    runs and both the score and the raw median slowed down by more than
+    ``threshold`` (e.g. 0.15 for 15%), significantly at level ``alpha``.
+    Significance is a one-sided z-test of the log ratio against the larger
+    of the baseline's run-to-run sigma, the current samples' relative MAD
+    and ``noise_floor``. Requiring both keeps machine-wide load (raw only)
+    and a reference workload that happened to run fast (score only) from
+    failing the build.
+    """
+    runs = baseline["runs"]
+    ratio, p_value = _shift(current["score"], current["score_mad"], runs, noise_floor)
+    if baseline.get("medians"):
+        raw_ratio, raw_p_value = _shift(current["median"], current["mad"], baseline["medians"], noise_floor)
+        ratio_gate, p_value = min(ratio, raw_ratio), max(p_value, raw_p_value)
+    else:
+        ratio_gate = ratio
+    return {
+        "ratio": ratio,
+        "p_value": p_value,
+        "runs": len(runs),
+        "regressed": len(runs) >= min_runs and ratio_gate > 1 + threshold and p_value < alpha,
+    }
@@ -0,0 +1,96 @@
+"""
+Synthetic agent/tool sets of configurable size for the perf suite.
+"""
+
+import json
+from pathlib import Path
+from typing import List
+
+import yaml
+
+TOOL_TEMPLATE = '''
+@tool
+def {name}(a: float, b: float) -> float:
+    """
+    Synthetic tool number {index}.
+
+    :param a: The first operand
+    :param b: The second operand
+    :returns: The combined value
+    """
+    return a + b
+'''
+
+
+def tool_names(count: int) -> List[str]:
+    return [f"tool_{i}" for i in range(count)]
+
+
+def write_tools(directory: Path, count: int, per_file: int = 50) -> List[Path]:
+    """Write ``count`` @tool functions spread across tools_*.py files."""
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    names = tool_names(count)
+    for start in range(0, count, per_file):
+        path = directory / f"tools_{start // per_file}.py"
+        body = "".join(
+            TOOL_TEMPLATE.format(name=name, index=start + i)
+            for i, name in enumerate(names[start:start + per_file])
+        )
+        path.write_text("from ibm_watsonx_orchestrate.agent_builder.tools import tool\n" + body, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def agent_config(index: int, tools: List[str], collaborators: List[str]) -> dict:
+    return {
+        "spec_version": "v1",
+        "kind": "native",
+        "name": f"agent_{index}",
+        "description": f"Synthetic agent {index} used for performance testing.",
+        "style": "react",
+        "llm": "watsonx/meta-llama/llama-3-2-90b-vision-instruct",
+        "instructions": "\n".join(
+            [f"You are synthetic agent {index}."]
+            + [f"- When asked about {t}, call the `{t}` tool" for t in tools]
+            + [f"- Delegate {c} questions to {c}" for c in collaborators]
+        ) + "\n",
+        "collaborators": collaborators,
+        "tools": tools,
+    }
+
+
+def write_agents(directory: Path, count: int, tools_per_agent: int = 4, tool_count: int = 0,
+                 collaborators_per_agent: int = 2) -> List[Path]:
+    """
+    Write ``count`` native agent YAMLs.
+
+    Each agent references ``tools_per_agent`` tools drawn round-robin from
+    ``tool_count`` tools (defaults to ``tools_per_agent``) and delegates to
+    the agents defined just before it.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    names = tool_names(tool_count or tools_per_agent)
+    paths = []
+    for i in range(count):
+        tools = [names[(i + j) % len(names)] for j in range(tools_per_agent)] if names else []
+        collaborators = [f"agent_{k}" for k in range(max(0, i - collaborators_per_agent), i)]
+        path = directory / f"agent_{i}.yaml"
+        path.write_text(yaml.safe_dump(agent_config(i, tools, collaborators), sort_keys=False), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def write_listing_json(path: Path, count: int, prefix: str = "agent") -> Path:
+    """Write a verbose `orchestrate ... list -v` style JSON with ``count`` entries."""
+    entries = [
+        {
+            "name": f"{prefix}_{i}",
+            "id": f"{i:08x}-0000-4000-8000-000000000000",
+            "description": f"Synthetic {prefix} {i}",
+            "tools": [{"name": f"tool_{i}"}],
+        }
+        for i in range(count)
+    ]
+    path.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+    return path
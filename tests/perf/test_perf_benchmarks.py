@@ -0,0 +1,68 @@
+"""
+Performance benchmarks, run with ``pytest --perf``.
+
+Each benchmark is compared with this machine's stored baseline; record one
+first with ``pytest --perf --perf-save-baseline``.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+import yaml
+
+import synthetic
+from tools import calculator_tool
+from validate import AgentValidator
+
+ROOT = Path(__file__).resolve().parents[2]
+SCALES = [10, 200]
+
+
+def _load_script(name: str):
+    """Import scripts/utils/<name>.py, which is not a package."""
+    spec = importlib.util.spec_from_file_location(f"utils_{name}", ROOT / "scripts" / "utils" / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module", params=SCALES, ids=lambda n: f"{n}agents")
+def agent_files(request, tmp_path_factory):
+    directory = tmp_path_factory.mktemp(f"agents_{request.param}")
+    return synthetic.write_agents(directory, request.param, tools_per_agent=4, tool_count=request.param)
+
+
+@pytest.fixture(scope="module", params=SCALES, ids=lambda n: f"{n}entries")
+def listing_file(request, tmp_path_factory):
+    return synthetic.write_listing_json(tmp_path_factory.mktemp("listing") / "agents.json", request.param)
+
+
+def test_validator_throughput(perf, agent_files):
+    validator = AgentValidator()
+
+    def run():
+        for path in agent_files:
+            assert validator.validate_file(str(path))
+
+    perf(run)
+
+
+def test_agent_yaml_loading(perf, agent_files):
+    def run():
+        for path in agent_files:
+            with path.open(encoding="utf-8") as fp:
+                yaml.safe_load(fp)
+
+    perf(run)
+
+
+@pytest.mark.parametrize("script", ["list", "clean", "purge"])
+def test_name_extraction(perf, listing_file, script):
+    extract = _load_script(script).extract_names_from_file
+    perf(lambda: extract(listing_file))
+
+
+@pytest.mark.parametrize("args", [(5, 3), (5.0, 3.0), (0.1, 0.2), (10**30, 3)], ids=str)
+def test_calculator_call_overhead(perf, args):
+    perf(lambda: calculator_tool.add(*args))
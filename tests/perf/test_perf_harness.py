@@ -0,0 +1,71 @@
+"""
+Checks for the perf harness itself; these run in the normal test suite.
+"""
+
+from harness import MAX_BASELINE_RUNS, BaselineStore, compare, machine_fingerprint, measure, summarize
+import synthetic
+from validate import AgentValidator
+
+
+def baseline(runs):
+    return {"runs": runs}
+
+
+def test_compare_needs_size_and_significance_across_runs():
+    tight = baseline([1.00, 1.01, 0.99, 1.00])
+    noisy = baseline([1.0, 1.6, 0.9, 1.8, 1.1])
+    current = summarize([1.5, 1.51, 1.49])
+
+    assert compare(current, tight, threshold=0.15, alpha=0.01)["regressed"]
+    # a 1.5x run is within the run-to-run spread of a noisy machine
+    assert not compare(current, noisy, threshold=0.15, alpha=0.01)["regressed"]
+    assert not compare(summarize([1.05, 1.05, 1.05]), tight, threshold=0.15, alpha=0.01)["regressed"]
+
+
+def test_noise_floor_and_sample_mad_widen_the_test():
+    tight = baseline([1.0, 1.0, 1.0])
+    steady = summarize([1.2, 1.2, 1.2])
+    jittery = summarize([1.2, 0.8, 1.6, 1.0, 1.4])
+
+    assert compare(steady, tight, threshold=0.15, alpha=0.01, noise_floor=0.05)["regressed"]
+    assert not compare(steady, tight, threshold=0.15, alpha=0.01, noise_floor=0.2)["regressed"]
+    assert not compare(jittery, tight, threshold=0.15, alpha=0.01)["regressed"]
+
+
+def test_machine_wide_load_alone_is_not_a_regression():
+    base = {"runs": [1.0, 1.0, 1.01], "medians": [10.0, 10.1, 9.9]}
+    loaded = summarize([20.0, 20.2, 19.8], reference=[20.0, 20.2, 19.8])
+    slower = summarize([20.0, 20.2, 19.8], reference=[10.0, 10.1, 9.9])
+
+    assert not compare(loaded, base, threshold=0.15, alpha=0.01)["regressed"]
+    assert compare(slower, base, threshold=0.15, alpha=0.01)["regressed"]
+
+
+def test_too_few_baseline_runs_never_fail():
+    result = compare(summarize([3.0, 3.0]), baseline([1.0, 1.0]), threshold=0.15, alpha=0.01)
+    assert result["runs"] == 2 and result["ratio"] == 3.0 and not result["regressed"]
+
+
+def test_baseline_store_round_trip(tmp_path):
+    path = tmp_path / "baselines.json"
+    store = BaselineStore(path)
+    timings = measure(lambda: sum(range(100)), samples=3, reference=lambda: sum(range(50)))
+    summary = summarize(timings["samples"], timings["reference"])
+    assert len(timings["reference"]) == 3 and 0.5 < summary["score"] < 8
+    for _ in range(MAX_BASELINE_RUNS + 2):
+        store.add_run(machine_fingerprint(), {"cpu": "test"}, "bench", summary)
+    store.save()
+
+    reloaded = BaselineStore(path)
+    assert reloaded.get(machine_fingerprint(), "bench")["runs"] == [summary["score"]] * MAX_BASELINE_RUNS
+    assert reloaded.get(machine_fingerprint(), "bench")["median"] == summary["median"]
+    assert reloaded.get("other-machine", "bench") is None
+
+
+def test_synthetic_agents_are_valid(tmp_path):
+    synthetic.write_tools(tmp_path / "tools", 20)
+    paths = synthetic.write_agents(tmp_path / "agents", 25, tools_per_agent=3, tool_count=20)
+    validator = AgentValidator()
+    assert len(paths) == 25
+    assert all(validator.validate_file(str(p)) for p in paths)
+    assert len(list((tmp_path / "tools").glob("*.py"))) == 1
@@ -0,0 +1,118 @@
+"""
+Checks for agent_bundle.py on copies of the repository's agents and tools.
+"""
+
+import os
+import shutil
+
+import pytest
+import yaml
+
+import agent_bundle
+from agent_bundle import BundleError, compile_bundle, is_fresh, load_agent_set, load_sources, read_bundle
+
+
+@pytest.fixture
+def tree(tmp_path):
+    shutil.copytree("agents", tmp_path / "agents")
+    shutil.copytree("tools", tmp_path / "tools", ignore=shutil.ignore_patterns("__pycache__"))
+    return tmp_path
+
+
+def load(tree, bundle):
+    return load_agent_set(str(tree / "agents"), str(tree / "tools"), bundle)
+
+
+def test_bundle_round_trips_the_sources(tree):
+    bundle = tree / "agents.bundle"
+    compiled = compile_bundle(str(tree / "agents"), str(tree / "tools"), bundle)
+    loaded = load(tree, bundle)
+    sources = load_sources(str(tree / "agents"), str(tree / "tools"))
+
+    assert loaded.origin == "bundle" and loaded.digest == compiled.digest
+    assert loaded.agents == sources.agents
+    assert loaded.tools == sources.tools
+    assert loaded.graph == sources.graph
+    assert loaded.graph["orchestrator_agent"]["collaborators"] == ["greeting_agent", "calculator_agent", "echo_agent"]
+    assert loaded.graph["calculator_agent"]["missing_tools"] == []
+
+
+def test_stale_bundle_falls_back_to_sources(tree):
+    bundle = tree / "agents.bundle"
+    compile_bundle(str(tree / "agents"), str(tree / "tools"), bundle)
+
+    # Same content, new mtime: still fresh
+    echo = tree / "agents" / "echo_agent.yaml"
+    os.utime(echo, ns=(0, 0))
+    assert load(tree, bundle).origin == "bundle"
+
+    echo.write_text(echo.read_text(encoding="utf-8").replace("Echo Agent", "Parrot Agent"), encoding="utf-8")
+    reloaded = load(tree, bundle)
+    assert reloaded.origin == "sources"
+    assert "Parrot Agent" in reloaded.agents["echo_agent"]["instructions"]
+
+    compile_bundle(str(tree / "agents"), str(tree / "tools"), bundle)
+    (tree / "agents" / "extra.yaml").write_text("name: extra_agent\n", encoding="utf-8")
+    assert not is_fresh(read_bundle(bundle), str(tree / "agents"), str(tree / "tools"))
+
+
+def test_touched_sources_are_hashed_once(tree, monkeypatch):
+    bundle = tree / "agents.bundle"
+    compiled = compile_bundle(str(tree / "agents"), str(tree / "tools"), bundle)
+    os.utime(tree / "agents" / "echo_agent.yaml", ns=(0, 0))
+
+    assert load(tree, bundle).origin == "bundle"
+    refreshed = read_bundle(bundle)
+    assert refreshed["manifest"][str(tree / "agents" / "echo_agent.yaml")] == [
+        (tree / "agents" / "echo_agent.yaml").stat().st_size, 0]
+    assert refreshed["digest"] == compiled.digest
+
+    # The refreshed manifest matches the stats, so no file is hashed again
+    monkeypatch.setattr(agent_bundle, "_file_digest", lambda path: pytest.fail(f"re-hashed {path}"))
+    assert load(tree, bundle).origin == "bundle"
+
+
+def test_digest_depends_on_content_not_location(tree, tmp_path_factory):
+    other = tmp_path_factory.mktemp("other")
+    shutil.copytree(tree / "agents", other / "agents")
+    shutil.copytree(tree / "tools", other / "tools")
+    first = compile_bundle(str(tree / "agents"), str(tree / "tools"), tree / "a.bundle")
+    second = compile_bundle(str(other / "agents"), str(other / "tools"), other / "b.bundle")
+    assert first.digest == second.digest
+
+
+def test_unusable_bundles_are_rejected(tree):
+    bundle = tree / "agents.bundle"
+    compile_bundle(str(tree / "agents"), str(tree / "tools"), bundle)
+    data = bundle.read_bytes()
+
+    for broken, message in [(data[:-10], "truncated"), (b"XXXX" + data[4:], "not an agent bundle")]:
+        bundle.write_bytes(broken)
+        with pytest.raises(BundleError, match=message):
+            read_bundle(bundle)
+        assert load(tree, bundle).origin == "sources"
+
+    assert load(tree, tree / "missing.bundle").origin == "sources"
+
+
+def test_bundle_paths_are_valid_from_any_working_directory(tree, monkeypatch):
+    bundle = tree / "agents.bundle"
+    monkeypatch.chdir(tree)
+    compile_bundle("agents", "tools", bundle)
+
+    monkeypatch.chdir(tree.parent)
+    loaded = load(tree, bundle)
+    assert loaded.origin == "bundle"
+    assert loaded.agent_paths["echo_agent"] == str(tree / "agents" / "echo_agent.yaml")
+    assert all(os.path.exists(p) for p in list(loaded.agent_paths.values()) + list(loaded.tool_files))
+
+
+def test_unbundlable_values_name_the_offending_key(tree, monkeypatch):
+    # Some SDK imports register a str constructor for timestamps; restore PyYAML's default
+    monkeypatch.setitem(yaml.SafeLoader.yaml_constructors, "tag:yaml.org,2002:timestamp",
+                        yaml.constructor.SafeConstructor.construct_yaml_timestamp)
+    (tree / "agents" / "dated.yaml").write_text("name: dated_agent\nmetadata:\n  created: 2024-01-01\n", encoding="utf-8")
+    with pytest.raises(BundleError, match=r"dated\.yaml: unsupported value at metadata\.created \(date\)"):
+        compile_bundle(str(tree / "agents"), str(tree / "tools"), tree / "agents.bundle")
+    assert load(tree, tree / "agents.bundle").origin == "sources"
+
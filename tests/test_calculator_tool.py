@@ -0,0 +1,98 @@
+"""
+Checks for the precision modes in tools/calculator_tool.py.
+"""
+
+import pytest
+
+from tools import calculator_tool as calc
+
+
+def test_fast_path_matches_plain_arithmetic():
+    assert calc.add(5, 3) == 8
+    assert calc.add(5.0, 3.0) == 8.0
+    assert calc.subtract(10.0, 15.0) == -5.0
+    assert calc.multiply(4, 6) == 24
+    assert calc.divide(20.0, 4.0) == 5.0
+    assert calc.divide(1, 3) == 1 / 3
+    assert calc.multiply(2.5, 4) == 10.0
+    assert calc.add(2.5, 4) == 6.5
+    assert calc.divide(7.5, 2) == 3.75
+
+
+def test_auto_mode_removes_binary_float_artifacts():
+    assert calc.add(0.1, 0.2) == 0.3
+    assert calc.multiply(1.1, 1.1) == 1.21
+    assert calc.subtract("0.3", "0.1") == 0.2
+
+
+def test_float_mode_keeps_historical_behaviour():
+    assert calc.add(0.1, 0.2, mode="float") == 0.1 + 0.2
+
+
+def test_big_integers_are_preserved():
+    assert calc.multiply(10**30, 3) == 3 * 10**30
+    assert calc.add(2**60, 1) == 2**60 + 1
+    assert calc.add("123456789012345678901234567890", 1) == 123456789012345678901234567891
+    assert calc.divide(10**30, 10**10) == 10**20
+
+
+def test_rounded_results_are_not_reported_as_exact_integers():
+    assert calc.divide(10**30, 7) == 10**30 / 7
+    assert calc.divide(10**30, 7, mode="decimal") == "1.428571428571428571428571429E+29"
+    assert calc.multiply("123456789012345.5", "123456789012345.5", mode="decimal") == "1.524157875323879257735141137E+28"
+
+
+def test_non_finite_and_out_of_range_values():
+    assert calc.add(float("inf"), 1.0) == float("inf")
+    assert calc.subtract(1.0, float("inf"), mode="decimal") == float("-inf")
+    assert calc.add(float("nan"), 1.0) != calc.add(float("nan"), 1.0)
+    assert calc.multiply(1e200, 1e200, mode="fraction") == 10**400
+    assert calc.divide(1e308, 3e-308, mode="fraction").startswith("1" + "0" * 10)
+    assert calc.divide(1e308, 3e-308) == float("inf")
+
+
+def test_exact_modes_return_lossless_strings():
+    assert calc.divide(1, 3, mode="decimal") == "0." + "3" * 28
+    assert calc.divide(1, 3, mode="decimal", precision=5) == 0.33333
+    assert calc.divide(1, 3, mode="fraction") == "1/3"
+    assert calc.multiply(0.5, 4, mode="fraction") == 2
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="Cannot divide by zero"):
+        calc.divide(1.0, 0.0)
+    with pytest.raises(ValueError, match="Cannot divide by zero"):
+        calc.divide(0.5, 0, mode="decimal")
+    with pytest.raises(ValueError, match="Invalid mode"):
+        calc.add(1, 2, mode="binary")
+    with pytest.raises(ValueError, match="Invalid number"):
+        calc.add("one", 2)
+
+
+def test_environment_defaults_are_checked(monkeypatch):
+    monkeypatch.setenv("CALCULATOR_PRECISION_MODE", " Decimal ")
+    monkeypatch.setenv("CALCULATOR_DECIMAL_PRECISION", "40")
+    assert calc._setting_mode("CALCULATOR_PRECISION_MODE", "auto") == "decimal"
+    assert calc._setting_precision("CALCULATOR_DECIMAL_PRECISION", 28) == 40
+
+    monkeypatch.setenv("CALCULATOR_PRECISION_MODE", "")
+    monkeypatch.delenv("CALCULATOR_DECIMAL_PRECISION")
+    assert calc._setting_mode("CALCULATOR_PRECISION_MODE", "auto") == "auto"
+    assert calc._setting_precision("CALCULATOR_DECIMAL_PRECISION", 28) == 28
+
+    monkeypatch.setenv("CALCULATOR_PRECISION_MODE", "binary")
+    with pytest.raises(ValueError, match="CALCULATOR_PRECISION_MODE must be one of .* got 'binary'"):
+        calc._setting_mode("CALCULATOR_PRECISION_MODE", "auto")
+    for value in ("high", "2.5", "0"):
+        monkeypatch.setenv("CALCULATOR_DECIMAL_PRECISION", value)
+        with pytest.raises(ValueError, match=f"must be a positive integer, got '{value}'"):
+            calc._setting_precision("CALCULATOR_DECIMAL_PRECISION", 28)
+
+
+def test_float_mode_direct_path_matches_calculate():
+    for a, b in [(0.1, 0.2), (7, 2), (10**30, 3), (1.5, -0.25)]:
+        for op in ("add", "subtract", "multiply", "divide"):
+            assert getattr(calc, op)(a, b, mode="float") == calc.calculate(op, a, b, "float")
+    assert calc.add("0.1", 2, mode="float") == 2.1
+    with pytest.raises(ValueError, match="Cannot divide by zero"):
+        calc.divide(1.0, 0, mode="float")
@@ -0,0 +1,80 @@
+"""
+Checks for context_store.py and the context_policy blocks in agents/.
+"""
+
+import yaml
+
+from context_store import COMPACT_MARKER, ContextPolicy, ConversationStore, load_policies, truncate
+from validate import AgentValidator
+
+
+def fill(store, turns, words=40):
+    for i in range(turns):
+        store.append("s", "user", f"question {i} " + "word " * words)
+        store.append("s", "assistant", f"answer {i} " + "word " * words)
+
+
+def test_truncate_is_deterministic_and_word_aligned():
+    text = "alpha beta gamma delta epsilon"
+    assert truncate(text, 100) == text
+    assert truncate(text, 13) == "alpha beta" + COMPACT_MARKER
+    assert truncate(text, 13) == truncate(text, 13)
+
+
+def test_session_stays_within_budget_and_keeps_latest_turn_intact():
+    store = ConversationStore(token_budget=500, keep_recent=2, compact_chars=30)
+    fill(store, 50)
+    store.append("s", "user", "the latest question " + "word " * 40)
+
+    stats = store.stats("s")
+    assert stats["tokens"] <= 500
+    assert stats["compactions"] > 0
+    turns = store.history("s")
+    assert turns[-1].content.startswith("the latest question") and not turns[-1].compacted
+    assert not any(t.compacted for t in turns[-2:])
+
+
+def test_compaction_happens_before_dropping():
+    store = ConversationStore(token_budget=300, keep_recent=2, compact_chars=20)
+    fill(store, 4)
+    stats = store.stats("s")
+    assert stats["dropped"] == 0 and stats["compactions"] > 0
+
+
+def test_policies_decide_history_per_agent():
+    store = ConversationStore(policies={
+        "echo_agent": ContextPolicy("stateless"),
+        "calculator_agent": ContextPolicy("window", max_turns=3),
+        "capped": ContextPolicy("full", max_tokens=60),
+    })
+    fill(store, 5, words=10)
+    store.append("s", "user", "what is 2 plus 2")
+
+    assert store.context_for("s", "echo_agent") == [{"role": "user", "content": "what is 2 plus 2"}]
+    assert len(store.context_for("s", "calculator_agent")) == 3
+    assert len(store.context_for("s", "unknown_agent")) == 11
+    capped = store.context_for("s", "capped")
+    assert 1 <= len(capped) < 11 and capped[-1]["content"] == "what is 2 plus 2"
+
+
+def test_repository_agents_declare_their_policies():
+    policies = load_policies("agents")
+    assert policies["echo_agent"].mode == "stateless"
+    assert policies["greeting_agent"].mode == "stateless"
+    assert policies["calculator_agent"].mode == "window"
+
+
+def test_validator_checks_context_policy(tmp_path):
+    with open("agents/echo_agent.yaml", encoding="utf-8") as fp:
+        config = yaml.safe_load(fp)
+    validator = AgentValidator()
+    for policy, error in [
+        ({"mode": "everything"}, "Invalid context_policy mode"),
+        ({"mode": "window"}, "requires 'max_turns'"),
+        ({"mode": "full", "max_tokens": 0}, "'max_tokens' must be a positive integer"),
+    ]:
+        config["context_policy"] = policy
+        path = tmp_path / "agent.yaml"
+        path.write_text(yaml.safe_dump(config), encoding="utf-8")
+        assert not validator.validate_file(str(path))
+        assert any(error in e for e in validator.errors), validator.errors
@@ -0,0 +1,96 @@
+"""
+Checks for the streaming dataset tools in tools/dataset_tool.py.
+
+Results are compared against the standard library on small synthetic
+files, which is enough to catch mistakes in the chunk-merge arithmetic.
+"""
+
+import array
+import math
+import random
+import statistics
+
+import pytest
+
+from tools import dataset_tool
+
+
+@pytest.fixture(autouse=True)
+def dataset_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset_tool, "DATASET_DIR", str(tmp_path))
+    return tmp_path
+
+
+def write_floats(path, typecode, values):
+    with path.open("wb") as fp:
+        array.array(typecode, values).tofile(fp)
+
+
+@pytest.fixture
+def values():
+    rng = random.Random(7)
+    # Large offset + small spread is the classic case naive variance gets wrong
+    return [rng.gauss(1e9, 0.5) for _ in range(3 * dataset_tool.CHUNK_VALUES + 123)]
+
+
+def test_binary_f64_matches_statistics(tmp_path, values):
+    path = tmp_path / "data.f64"
+    write_floats(path, "d", values)
+
+    summary = dataset_tool.dataset_summary(str(path))
+    assert summary["count"] == len(values)
+    assert summary["sum"] == math.fsum(values)
+    assert summary["mean"] == pytest.approx(statistics.fmean(values), rel=1e-15)
+    assert summary["variance"] == pytest.approx(statistics.variance(values), rel=1e-9)
+    assert summary["min"] == min(values)
+    assert summary["max"] == max(values)
+
+
+def test_binary_f32(tmp_path):
+    path = tmp_path / "data.bin"
+    write_floats(path, "f", [1.5, -2.0, 4.0])
+
+    assert dataset_tool.dataset_sum(str(path), fmt="f32") == 3.5
+    assert dataset_tool.dataset_min(str(path), fmt="f32") == -2.0
+
+
+def test_csv_by_header_name_skips_bad_cells(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("id,value\n1,10\n2,\n3,abc\n4,30\n", encoding="utf-8")
+
+    assert dataset_tool.dataset_mean(str(path), column="value") == 20.0
+    assert dataset_tool.dataset_max(str(path), column="1") == 30.0
+    assert dataset_tool.dataset_variance(str(path), column="value", sample=False) == 100.0
+
+
+def test_errors(tmp_path):
+    with pytest.raises(ValueError, match="File not found"):
+        dataset_tool.dataset_sum(str(tmp_path / "missing.csv"))
+
+    path = tmp_path / "data.txt"
+    path.write_text("1\n2\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="Cannot infer format"):
+        dataset_tool.dataset_sum(str(path))
+
+    path = tmp_path / "data.csv"
+    path.write_text("a\nb\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="No numeric values"):
+        dataset_tool.dataset_sum(str(path))
+
+
+def test_paths_are_confined_to_the_dataset_dir(tmp_path):
+    (tmp_path / "data.csv").write_text("1\n2\n", encoding="utf-8")
+    assert dataset_tool.dataset_sum("data.csv") == 3.0
+    assert dataset_tool.dataset_sum(str(tmp_path / "data.csv")) == 3.0
+
+    outside = tmp_path.parent / f"{tmp_path.name}-outside.csv"
+    outside.write_text("1\n", encoding="utf-8")
+    try:
+        for path in (str(outside), f"../{outside.name}"):
+            with pytest.raises(ValueError, match="outside the dataset directory"):
+                dataset_tool.dataset_sum(path)
+        (tmp_path / "link.csv").symlink_to(outside)
+        with pytest.raises(ValueError, match="outside the dataset directory"):
+            dataset_tool.dataset_sum("link.csv")
+    finally:
+        outside.unlink()
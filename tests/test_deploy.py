@@ -0,0 +1,85 @@
+"""
+Checks for deploy.py against several local stub environments.
+"""
+
+import time
+from contextlib import ExitStack
+
+import pytest
+
+from deploy import Deployer, build_plan
+from orchestrate_stub import StubServer, write_cli_home, write_stub_cli
+
+ALL_AGENTS = {"greeting_agent", "calculator_agent", "echo_agent", "orchestrator_agent"}
+
+
+@pytest.fixture
+def cli(tmp_path):
+    return str(write_stub_cli(tmp_path / "bin"))
+
+
+def deploy(tmp_path, cli, servers, rollback="env"):
+    home = write_cli_home(tmp_path / "home", servers)
+    deployer = Deployer(build_plan(), cli=cli, rollback=rollback, source_home=str(home))
+    return deployer.deploy(list(servers))
+
+
+def test_plan_imports_tools_then_collaborators_before_orchestrator():
+    plan = build_plan()
+    kinds = [step.kind for step in plan]
+    assert kinds == sorted(kinds, key=lambda k: k != "tool")
+    agents = [step.names[0] for step in plan if step.kind == "agent"]
+    assert set(agents) == ALL_AGENTS
+    assert agents[-1] == "orchestrator_agent"
+    assert {"add", "subtract", "multiply", "divide"} <= {n for step in plan for n in step.names}
+
+
+def test_deploys_to_all_environments_in_parallel(tmp_path, cli):
+    with ExitStack() as stack:
+        servers = {name: stack.enter_context(StubServer(delay=0.05)) for name in ("dev", "staging", "prod")}
+        start = time.perf_counter()
+        results = deploy(tmp_path, cli, servers)
+        elapsed = time.perf_counter() - start
+
+    assert all(r.ok for r in results.values())
+    for server in servers.values():
+        assert server.agents == ALL_AGENTS
+        assert "add" in server.tools
+    # Serial execution would need at least the sum of every environment's time
+    assert elapsed < sum(r.seconds for r in results.values())
+
+
+def test_failed_environment_is_rolled_back_alone(tmp_path, cli):
+    with ExitStack() as stack:
+        good = stack.enter_context(StubServer())
+        bad = stack.enter_context(StubServer(fail_on={"orchestrator_agent"}, agents={"echo_agent"}))
+        results = deploy(tmp_path, cli, {"good": good, "bad": bad})
+
+    assert results["good"].ok and good.agents == ALL_AGENTS
+    assert not results["bad"].ok
+    assert "orchestrator_agent" in results["bad"].error
+    # Everything the run created is gone; the pre-existing echo_agent stays
+    assert bad.agents == {"echo_agent"}
+    assert bad.tools == set()
+
+
+def test_rollback_all_undoes_successful_environments_too(tmp_path, cli):
+    with ExitStack() as stack:
+        good = stack.enter_context(StubServer())
+        bad = stack.enter_context(StubServer(fail_on={"add"}))
+        results = deploy(tmp_path, cli, {"good": good, "bad": bad}, rollback="all")
+
+    assert results["good"].ok
+    assert good.agents == set() and good.tools == set()
+    assert bad.agents == set() and bad.tools == set()
+
+
+def test_unknown_environment_fails_without_touching_others(tmp_path, cli):
+    with StubServer() as server:
+        home = write_cli_home(tmp_path / "home", {"dev": server})
+        deployer = Deployer(build_plan(), cli=cli, source_home=str(home))
+        results = deployer.deploy(["dev", "missing"])
+
+    assert results["dev"].ok
+    assert not results["missing"].ok
+    assert "env activate failed" in results["missing"].error
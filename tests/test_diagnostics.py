@@ -0,0 +1,104 @@
+"""
+Checks for diagnostics.py against local HTTP servers and a fake docker.
+"""
+
+import socket
+import stat
+import sys
+import time
+
+import pytest
+
+from diagnostics import FAIL, OK, SKIPPED, TIMEOUT, DiagnosticsEngine, Probe
+from http_stub import JsonServer
+
+DOCKER_SOURCE = '''#!{python}
+import json, sys
+with open({calls!r}, "a") as fp:
+    fp.write(" ".join(sys.argv[1:]) + "\\n")
+if sys.argv[1] == "ps":
+    for name, ports in [("wxo-server", "0.0.0.0:4321->4321/tcp"), ("wxo-ui", "0.0.0.0:3000->3000/tcp")]:
+        print(json.dumps({{"Names": name, "Ports": ports, "Status": "Up 5 minutes"}}))
+elif sys.argv[1] == "logs":
+    print("started " + sys.argv[-1])
+'''
+
+
+@pytest.fixture
+def server():
+    with JsonServer(lambda method, path, body: (200, {"status": "ok"})) as httpd:
+        yield httpd.port
+
+
+@pytest.fixture
+def docker(tmp_path):
+    calls = tmp_path / "docker-calls.txt"
+    path = tmp_path / "docker"
+    path.write_text(DOCKER_SOURCE.format(python=sys.executable, calls=str(calls)), encoding="utf-8")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return str(path), calls
+
+
+def closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_healthy_stack_reuses_one_container_listing(server, docker):
+    docker_path, calls = docker
+    engine = DiagnosticsEngine(settings={"host": "127.0.0.1", "api_port": server, "ui_port": server,
+                                         "docker": docker_path})
+    results = engine.run()
+
+    assert engine.healthy, {n: r for n, r in results.items() if r["status"] != OK}
+    assert results["wxo_containers"]["data"] == ["wxo-server", "wxo-ui"]
+    assert results["container_logs"]["data"]["wxo-ui"].strip() == "started wxo-ui"
+    commands = calls.read_text().splitlines()
+    assert sum(1 for c in commands if c.startswith("ps")) == 1
+
+    report = engine.report()
+    assert report["healthy"] and report["probes"]["api_health"]["depends_on"] == ["port_api"]
+
+
+def test_dead_server_short_circuits_dependent_probes(tmp_path):
+    port = closed_port()
+    engine = DiagnosticsEngine(settings={"host": "127.0.0.1", "api_port": port, "ui_port": port,
+                                         "docker": str(tmp_path / "missing-docker")})
+    results = engine.run()
+
+    assert results["containers"]["status"] == FAIL
+    assert results["port_api"]["status"] == FAIL
+    for name in ("wxo_containers", "container_logs", "api_health", "api_docs", "ui", "chat_lite"):
+        assert results[name]["status"] == SKIPPED
+    assert not engine.healthy
+
+
+def test_probes_run_concurrently():
+    probes = [Probe(f"p{i}", "sleeps", lambda ctx: time.sleep(0.2)) for i in range(5)]
+    engine = DiagnosticsEngine(probes=probes)
+    start = time.perf_counter()
+    engine.run()
+    assert time.perf_counter() - start < 0.6
+    assert engine.healthy
+
+
+def test_overall_deadline_reports_unfinished_probes():
+    probes = [
+        Probe("quick", "quick", lambda ctx: "done"),
+        Probe("slow", "slow", lambda ctx: time.sleep(3)),
+        Probe("after_slow", "after slow", lambda ctx: "never", ["slow"]),
+    ]
+    engine = DiagnosticsEngine(probes=probes, probe_timeout=5, deadline=0.3)
+    start = time.perf_counter()
+    results = engine.run()
+
+    assert time.perf_counter() - start < 1.0
+    assert results["quick"]["status"] == OK
+    assert results["slow"]["status"] == TIMEOUT
+    assert results["after_slow"]["status"] == TIMEOUT
+
+
+def test_unknown_dependency_is_rejected():
+    with pytest.raises(ValueError, match="unknown probe"):
+        DiagnosticsEngine(probes=[Probe("a", "a", lambda ctx: None, ["missing"])])
@@ -0,0 +1,77 @@
+"""
+Checks for fast_path.py and the fast_path blocks in agents/.
+"""
+
+import yaml
+
+from fast_path import FastPathAgent, FastPathRouter
+from validate import AgentValidator
+
+
+def test_greeting_agent_answers_as_its_instructions_say():
+    router = FastPathRouter.load("agents")
+    assert router.respond("greeting_agent", "HELLO there") == "**Hello! I am the Greeting Agent.**"
+    assert router.respond("greeting_agent", "hi") == '**I only handle greetings. Please say "hello".**'
+    # "the word hello", not any substring
+    assert router.respond("greeting_agent", "othello") == '**I only handle greetings. Please say "hello".**'
+
+
+def test_echo_agent_repeats_input_verbatim():
+    router = FastPathRouter.load("agents")
+    message = "braces {stay} {input} as typed"
+    assert router.respond("echo_agent", message) == f"**The Echo Agent heard you say: {message}**"
+
+
+def test_agents_without_fast_path_go_to_the_model():
+    router = FastPathRouter.load("agents")
+    assert router.covered() == ["echo_agent", "greeting_agent"]
+    assert router.respond("calculator_agent", "1 + 1") is None
+    assert FastPathAgent("a", {"rules": [{"regex": r"^\d+$", "respond": "number"}]}).respond("abc") is None
+
+
+def test_python_handler(tmp_path, monkeypatch):
+    (tmp_path / "my_handlers.py").write_text("def shout(message):\n    return message.upper()\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    assert FastPathAgent("a", {"handler": "my_handlers:shout"}).respond("hi") == "HI"
+
+
+def validate(tmp_path, fast_path, agent="echo_agent"):
+    with open(f"agents/{agent}.yaml", encoding="utf-8") as fp:
+        config = yaml.safe_load(fp)
+    config["fast_path"] = fast_path
+    path = tmp_path / "agent.yaml"
+    path.write_text(yaml.safe_dump(config), encoding="utf-8")
+    validator = AgentValidator()
+    validator.validate_file(str(path))
+    return validator
+
+
+def test_validator_checks_templates_against_instructions(tmp_path):
+    assert not validate(tmp_path, {"default": "**The Echo Agent heard you say: {input}**"}).errors
+
+    drifted = validate(tmp_path, {"default": "The Echo Agent said: {input}"})
+    assert any("does not appear in the instructions" in e for e in drifted.errors)
+
+    placeholder = validate(tmp_path, {"default": "**The Echo Agent heard you say: {message}**"})
+    assert any("unknown placeholders" in e for e in placeholder.errors)
+
+
+def test_validator_checks_rules_and_handlers(tmp_path):
+    both = validate(tmp_path, {"handler": "fast_path:render", "default": "x"})
+    assert any("cannot be combined" in e for e in both.errors)
+
+    bad_rule = validate(tmp_path, {"rules": [{"contains": "hi", "regex": "hi", "respond": "x"}]})
+    assert any("exactly one of" in e for e in bad_rule.errors)
+
+    unmentioned = validate(tmp_path, {"rules": [{"contains_word": "bonjour",
+                                                 "respond": "**Hello! I am the Greeting Agent.**"}]},
+                           agent="greeting_agent")
+    assert not unmentioned.errors
+    assert any("never mention" in w for w in unmentioned.warnings)
+
+
+def test_missing_handler_modules_are_warnings(tmp_path):
+    for handler in ("nomodule:fn", "nopkg.sub:fn"):
+        missing = validate(tmp_path, {"handler": handler})
+        assert not missing.errors
+        assert missing.warnings == [f"fast_path handler module '{handler.split(':')[0]}' not found"]
@@ -0,0 +1,98 @@
+"""
+Checks for profiling.py and the --profile flag of validate.py.
+"""
+
+import argparse
+import json
+import pstats
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import profiling
+from profiling import ProfileSession, add_profile_arguments, collapsed_stacks, phase, profile_session
+
+
+def parse(argv):
+    parser = argparse.ArgumentParser()
+    add_profile_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def busy():
+    return sum(i * i for i in range(20000))
+
+
+def test_phase_is_a_shared_no_op_without_profile():
+    args = parse([])
+    with profile_session("off", args) as session:
+        assert session is None
+        assert phase("load") is phase("parse")
+    assert profiling._active is None
+
+
+def test_session_writes_every_output(tmp_path):
+    args = parse(["--profile", "--profile-dir", str(tmp_path)])
+    with profile_session("unit", args):
+        with phase("parse"):
+            busy()
+        with phase("parse"):
+            busy()
+
+    suffixes = sorted(p.name.split("-", 2)[-1].split(".", 1)[1] for p in tmp_path.iterdir())
+    assert suffixes == ["collapsed", "phases.json", "pstats", "tracemalloc.snapshot", "tracemalloc.txt"]
+    phases = json.loads(next(tmp_path.glob("*.phases.json")).read_text())
+    assert phases["parse"]["calls"] == 2 and phases["parse"]["seconds"] > 0
+    assert profiling._active is None
+
+
+def test_outputs_are_written_when_the_run_exits(tmp_path):
+    args = parse(["--profile", "--profile-kinds", "phases", "--profile-dir", str(tmp_path)])
+    with pytest.raises(SystemExit):
+        with profile_session("exits", args):
+            sys.exit(1)
+    assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
+
+
+def test_collapsed_stacks_are_rooted_and_weighted(tmp_path):
+    session = ProfileSession("stacks", ["cprofile"], str(tmp_path))
+    session.start()
+    busy()
+    session.stop()
+    stacks = collapsed_stacks(pstats.Stats(session.profiler))
+
+    assert stacks and all(weight > 0 for weight in stacks.values())
+    assert any(stack.split(";")[-1].startswith("<genexpr>") and "busy (" in stack for stack in stacks)
+
+
+def test_unknown_profile_kinds_are_rejected(capsys):
+    with pytest.raises(SystemExit):
+        parse(["--profile-kinds", "cprofile,perf"])
+    assert "comma-separated subset" in capsys.readouterr().err
+    with pytest.raises(ValueError):
+        ProfileSession("bad", ["perf"])
+
+
+def test_validate_profile_flag(tmp_path):
+    result = subprocess.run(
+        [sys.executable, "validate.py", "--profile", "--profile-kinds", "phases",
+         "--profile-dir", str(tmp_path), "agents/greeting_agent.yaml"],
+        capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    phases = json.loads(next(tmp_path.glob("validate-*.phases.json")).read_text())
+    assert {"load", "parse", "validate", "print"} <= set(phases)
+
+
+def test_validate_profiles_several_files_in_one_session(tmp_path):
+    files = sorted(str(p) for p in Path("agents").glob("*.yaml"))
+    result = subprocess.run(
+        [sys.executable, "validate.py", "--profile", "--profile-kinds", "phases",
+         "--profile-dir", str(tmp_path)] + files,
+        capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert result.stdout.count("🔍 Validating agent file:") == len(files)
+    assert len(list(tmp_path.glob("validate-*.phases.json"))) == 1
@@ -0,0 +1,91 @@
+"""
+Checks for prompt_footprint.py against the real agents and small fixtures.
+"""
+
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+import yaml
+
+import prompt_footprint
+from prompt_footprint import PromptAnalyzer, estimate_tokens
+from tool_signatures import load_tool_signatures
+from validate import AgentValidator
+
+
+def test_estimate_tokens_scales_with_text():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("hello") == 1
+    assert estimate_tokens("hello world") == 2
+    assert estimate_tokens("hello world " * 10) > estimate_tokens("hello world")
+
+
+def test_tool_signatures_come_from_docstrings():
+    tools = load_tool_signatures(PromptAnalyzer().tools_dir)
+    add = tools["add"]
+    assert add.description == "Add two numbers together."
+    assert add.parameters["a"] == {"type": "number", "description": "The first number to add"}
+    assert add.required == ["a", "b"]
+
+
+def test_report_covers_every_agent():
+    analyzer = PromptAnalyzer()
+    reports = {r["agent"]: r for r in analyzer.analyze()}
+
+    assert set(reports) == {"greeting_agent", "calculator_agent", "echo_agent", "orchestrator_agent"}
+    assert reports["calculator_agent"]["tools"] > 0
+    assert reports["orchestrator_agent"]["collaborators"] > 0
+    # calculator_agent lists each arithmetic tool twice in its instructions
+    assert "'add' is mapped on 2 separate lines" in reports["calculator_agent"]["redundancy"]
+
+
+def test_budget_overrides():
+    analyzer = PromptAnalyzer(budget=10_000, budgets={"calculator_agent": 10})
+    analyzer.analyze()
+    assert len(analyzer.errors) == 1
+    assert analyzer.errors[0].startswith("calculator_agent:")
+    assert analyzer.errors[0].endswith("exceeds budget of 10")
+
+
+def test_compacted_agents_still_validate(tmp_path):
+    results = PromptAnalyzer().write_compacted(str(tmp_path))
+    assert results
+    for path in sorted(tmp_path.glob("*.yaml")):
+        validator = AgentValidator()
+        assert validator.validate_file(str(path)), (path.name, validator.errors)
+        assert not validator.warnings, (path.name, validator.warnings)
+
+    greeting = yaml.safe_load(Path("agents/greeting_agent.yaml").read_text(encoding="utf-8"))["instructions"]
+    compacted = PromptAnalyzer().compact_instructions(greeting, [])
+    assert "\n  respond with exactly:\n    **Hello! I am the Greeting Agent.**\n" in compacted
+
+
+def test_malformed_budget_override_is_a_usage_error(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["prompt_footprint.py", "--budget-for", "oops"])
+    with pytest.raises(SystemExit) as exit_info:
+        prompt_footprint.main()
+    assert exit_info.value.code == 2
+    assert "expected AGENT=TOKENS, got: 'oops'" in capsys.readouterr().err
+
+
+def test_compaction_folds_repeated_mappings(tmp_path):
+    instructions = textwrap.dedent("""\
+        You are a calculator.
+        • When asked to add numbers, call the `add` tool
+
+        Handle these types of requests:
+        - "add 5 and 3" → use add tool
+    """)
+    compacted = PromptAnalyzer().compact_instructions(instructions, ["add"])
+    assert compacted == 'You are a calculator.\n- When asked to add numbers, call the `add` tool (e.g. "add 5 and 3")\n'
+
+    agents = tmp_path / "agents"
+    agents.mkdir()
+    (agents / "calc.yaml").write_text(yaml.safe_dump({"name": "calc", "instructions": instructions, "tools": ["add"]}))
+    analyzer = PromptAnalyzer(str(agents))
+    results = analyzer.write_compacted(str(tmp_path / "out"))
+    assert results[0]["after"] < results[0]["before"]
+    written = yaml.safe_load((tmp_path / "out" / "calc.yaml").read_text(encoding="utf-8"))
+    assert written["instructions"] == compacted
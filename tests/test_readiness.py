@@ -0,0 +1,95 @@
+"""
+Checks for readiness.py against a local stand-in server.
+"""
+
+import random
+import time
+
+import pytest
+
+from http_stub import JsonServer
+from readiness import ChatClient, backoff_delays, load_warmup_requests, wait_until_ready, warm_up
+
+
+class FakeServer(JsonServer):
+    """Healthy after ``unhealthy_polls`` polls; first chat per agent is slow."""
+
+    def __init__(self, unhealthy_polls=0, cold_delay=0.2, agents=("greeting_agent", "echo_agent"), listing=None):
+        super().__init__()
+        self.unhealthy_polls = unhealthy_polls
+        self.cold_delay = cold_delay
+        self.agents = {name: f"id-{name}" for name in agents}
+        self.listing = listing if listing is not None else [{"name": n, "id": i} for n, i in self.agents.items()]
+        self.polls = 0
+        self.chats = []
+
+    def route(self, method, path, body):
+        if path == "/api/v1/health":
+            self.polls += 1
+            healthy = self.polls > self.unhealthy_polls
+            return (200 if healthy else 503), {"status": "ok" if healthy else "starting"}
+        if method == "GET":
+            return 200, self.listing
+        agent_id = path.split("/")[4]
+        if agent_id not in self.chats:
+            time.sleep(self.cold_delay)
+        self.chats.append(agent_id)
+        return 200, {"choices": [{"message": {"content": "hi"}}]}
+
+
+def test_backoff_grows_is_capped_and_jittered():
+    delays = backoff_delays(initial=0.5, factor=2, max_delay=4, jitter=0.5, rng=random.Random(1))
+    values = [next(delays) for _ in range(8)]
+    bounds = [0.5, 1, 2, 4, 4, 4, 4, 4]
+    assert all(0.5 * b <= v <= 1.5 * b for v, b in zip(values, bounds))
+    assert len(set(values[4:])) == 4  # capped delays still differ
+
+
+def test_waits_until_healthy_and_records_time_to_ready():
+    with FakeServer(unhealthy_polls=3) as server:
+        result = wait_until_ready(server.url + "/api/v1/health", timeout=10,
+                                  delays=backoff_delays(initial=0.01, jitter=0))
+    assert result.ready
+    assert result.attempts == 4
+    assert result.seconds >= 0.01 + 0.02 + 0.04
+
+
+def test_gives_up_at_timeout():
+    with FakeServer(unhealthy_polls=10**6) as server:
+        start = time.perf_counter()
+        result = wait_until_ready(server.url + "/api/v1/health", timeout=0.3,
+                                  delays=backoff_delays(initial=0.05))
+    assert not result.ready
+    assert result.last_error == "HTTP 503"
+    assert time.perf_counter() - start < 1.0
+
+
+def test_warm_up_reports_cold_and_warm_latency():
+    requests = {"greeting_agent": "hello", "echo_agent": "ping", "calculator_agent": "2+3"}
+    with FakeServer(cold_delay=0.2) as server:
+        results = {r.agent: r for r in warm_up(ChatClient(server.url), requests)}
+
+    assert results["calculator_agent"].error == "not imported"
+    for name in ("greeting_agent", "echo_agent"):
+        assert results[name].cold_seconds >= 0.2
+        assert results[name].warm_seconds < results[name].cold_seconds
+    assert server.chats.count("id-echo_agent") == 2
+
+
+@pytest.mark.parametrize("listing", [{"agents": []}, [{"name": "echo_agent"}], ["echo_agent"]])
+def test_malformed_agent_listing_is_reported_not_raised(listing):
+    with FakeServer(listing=listing) as server:
+        results = warm_up(ChatClient(server.url), {"echo_agent": "ping"})
+
+    assert [r.agent for r in results] == ["echo_agent"]
+    assert results[0].error.startswith("could not list agents:")
+    assert results[0].cold_seconds is None
+
+
+def test_warmup_requests_cover_every_agent(tmp_path):
+    config = tmp_path / "warmup.yaml"
+    config.write_text("default_message: hi\nmessages:\n  echo_agent: ping\nskip: [orchestrator_agent]\n")
+    requests = load_warmup_requests("agents", str(config))
+    assert requests == {"calculator_agent": "hi", "echo_agent": "ping", "greeting_agent": "hi"}
+    assert set(load_warmup_requests("agents", None)) == {
+        "calculator_agent", "echo_agent", "greeting_agent", "orchestrator_agent"}
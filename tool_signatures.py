@@ -0,0 +1,112 @@
+"""
+Tool signatures read from ``@tool`` functions without importing them
+
+Shared by prompt_footprint.py, which prices the tool definitions sent with
+each LLM turn, and agent_bundle.py, which stores them in the compiled
+bundle. Bump agent_bundle.FORMAT_VERSION when the shape of ToolSignature
+or what extract_tool_signatures reads changes.
+"""
+
+import ast
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+# Python annotation -> JSON schema type, as the ADK renders tool inputs
+ANNOTATION_TYPES = {
+    "str": "string",
+    "int": "integer",
+    "float": "number",
+    "bool": "boolean",
+    "dict": "object",
+    "list": "array",
+}
+
+
+@dataclass
+class ToolSignature:
+    """A tool as the LLM sees it: name, description and JSON parameters."""
+    name: str
+    description: str
+    parameters: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    required: List[str] = field(default_factory=list)
+    source: str = ""
+
+    def render(self) -> str:
+        """Compact JSON rendering of the tool definition sent with each turn."""
+        return json.dumps({
+            "name": self.name,
+            "description": self.description,
+            "parameters": {
+                "type": "object",
+                "properties": self.parameters,
+                "required": self.required,
+            },
+        }, separators=(",", ":"))
+
+
+def _parse_docstring(doc: str):
+    """Split a reST-style docstring into (description, {param: text})."""
+    description, params = [], {}
+    for line in (doc or "").strip().splitlines():
+        line = line.strip()
+        match = re.match(r":param (\w+):\s*(.*)", line)
+        if match:
+            params[match.group(1)] = match.group(2)
+        elif line.startswith(":returns:") or line.startswith(":return:"):
+            continue
+        elif line and not params:
+            description.append(line)
+    return " ".join(description), params
+
+
+def _is_tool_decorator(node: ast.expr) -> bool:
+    target = node.func if isinstance(node, ast.Call) else node
+    if isinstance(target, ast.Attribute):
+        return target.attr == "tool"
+    return isinstance(target, ast.Name) and target.id == "tool"
+
+
+def extract_tool_signatures(path: Path) -> Dict[str, ToolSignature]:
+    """
+    Read ``@tool`` functions from a Python file without importing it
+
+    Args:
+        path: Path to a tools/*.py file
+
+    Returns:
+        Dict mapping tool name to its signature
+    """
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    tools = {}
+    for node in tree.body:
+        if not isinstance(node, ast.FunctionDef):
+            continue
+        if not any(_is_tool_decorator(d) for d in node.decorator_list):
+            continue
+
+        description, param_docs = _parse_docstring(ast.get_docstring(node))
+        args = node.args.args
+        defaults = [None] * (len(args) - len(node.args.defaults)) + list(node.args.defaults)
+        parameters, required = {}, []
+        for arg, default in zip(args, defaults):
+            annotation = ast.unparse(arg.annotation) if arg.annotation else "str"
+            schema = {"type": ANNOTATION_TYPES.get(annotation, "string")}
+            if arg.arg in param_docs:
+                schema["description"] = param_docs[arg.arg]
+            parameters[arg.arg] = schema
+            if default is None:
+                required.append(arg.arg)
+
+        tools[node.name] = ToolSignature(node.name, description, parameters, required, str(path))
+    return tools
+
+
+def load_tool_signatures(tools_dir: Path) -> Dict[str, ToolSignature]:
+    """Collect tool signatures from every Python file in ``tools_dir``."""
+    tools = {}
+    for path in sorted(tools_dir.glob("*.py")):
+        tools.update(extract_tool_signatures(path))
+    return tools
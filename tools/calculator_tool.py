@@ -1,47 +1,262 @@
+import math
+import os
+import operator
+from decimal import Context, Decimal, Inexact
+from fractions import Fraction
+from typing import Union
+
 from ibm_watsonx_orchestrate.agent_builder.tools import tool
 
+Number = Union[int, float, str]
+
+# Precision modes:
+#   auto     - plain float/int arithmetic when it is provably exact (small
+#              operands that are multiples of 1/256), Decimal arithmetic otherwise
+#   float    - always plain float/int arithmetic (the historical behaviour)
+#   decimal  - always Decimal arithmetic at the configured context precision
+#   fraction - always exact rational arithmetic
+# Integer results are always kept as arbitrary-size ints outside 'float' mode.
+PRECISION_MODES = ["auto", "float", "decimal", "fraction"]
+
+
+def _setting_mode(name: str, default: str) -> str:
+    """Precision mode from the environment, checked when the tools are loaded."""
+    value = (os.environ.get(name) or default).strip().lower()
+    if value not in PRECISION_MODES:
+        raise ValueError(f"{name} must be one of {PRECISION_MODES}, got '{os.environ[name]}'")
+    return value
+
+
+def _setting_precision(name: str, default: int) -> int:
+    """Decimal precision from the environment, checked when the tools are loaded."""
+    value = (os.environ.get(name) or "").strip()
+    if not value:
+        return default
+    if not value.isdigit() or int(value) < 1:
+        raise ValueError(f"{name} must be a positive integer, got '{os.environ[name]}'")
+    return int(value)
+
+
+DEFAULT_MODE = _setting_mode("CALCULATOR_PRECISION_MODE", "auto")
+DEFAULT_PRECISION = _setting_precision("CALCULATOR_DECIMAL_PRECISION", 28)
+FAST_MODES = {"", "auto"} if DEFAULT_MODE == "auto" else {"auto"}
+FLOAT_MODES = {"", "float"} if DEFAULT_MODE == "float" else {"float"}
+
+# The fast path takes operands up to FAST_LIMIT that are multiples of 1/256.
+# Such a float prints as its exact value (at most 15 significant digits), so
+# it means the same number to Decimal; sums and quotients of two of them are
+# exact or correctly rounded, and products are exact below FAST_PRODUCT_LIMIT.
+FAST_LIMIT = 2.0 ** 23
+FAST_PRODUCT_LIMIT = 2.0 ** 37
+# Both checks cost one float addition: x + _BOUND == _BOUND exactly when
+# |x| <= FAST_LIMIT, and x + _SNAP - _SNAP rounds any |x| < 2**43 to the
+# nearest multiple of 1/256
+_BOUND = 1.5 * 2.0 ** 76
+_SNAP = 1.5 * 2.0 ** 44
+
+OPERATORS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
+
+def _parse(x) -> Union[int, float, Fraction, Decimal]:
+    """Accept numeric strings so callers can pass values floats cannot hold."""
+    if not isinstance(x, str):
+        return x
+    text = x.strip().replace("_", "")
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return Fraction(text)
+    except ValueError:
+        raise ValueError(f"Invalid number: '{x}'") from None
+
+
+def _to_fraction(x) -> Union[int, Fraction]:
+    """Exact rational for x; floats are read as their shortest decimal repr."""
+    if isinstance(x, int):
+        return x
+    if isinstance(x, float):
+        return Fraction(repr(x))
+    return Fraction(x)
+
+
+def _to_decimal(x, context: Context) -> Decimal:
+    """Decimal for x; floats are read as their shortest decimal repr."""
+    if isinstance(x, float):
+        return Decimal(repr(x))
+    if isinstance(x, Fraction):
+        return context.divide(Decimal(x.numerator), Decimal(x.denominator))
+    return Decimal(x)
+
+
+def _float(result: Union[Decimal, Fraction]) -> float:
+    """float(result), with results beyond the float range as +/-inf."""
+    try:
+        return float(result)
+    except OverflowError:
+        return math.inf if result > 0 else -math.inf
+
+
+def _normalize(result: Union[Decimal, Fraction], exact: bool, rounded: bool = False) -> Number:
+    """
+    Convert a Decimal/Fraction result back to a JSON-friendly value.
+
+    Floats are returned whenever they represent the result exactly (so 0.1 + 0.2
+    comes back as 0.3), integers as ints as long as the operation was not
+    rounded, and anything else as a float in 'auto' mode or as a lossless
+    string in the explicit exact modes.
+    """
+    as_float = _float(result)
+    if isinstance(result, Fraction):
+        if result.denominator == 1:
+            return int(result)
+        if math.isfinite(as_float) and Fraction(as_float) == result:
+            return as_float
+        return str(result) if exact else as_float
+
+    if math.isfinite(as_float) and Decimal(repr(as_float)) == result:
+        return as_float
+    if not rounded and result == result.to_integral_value():
+        return int(result)
+    return str(result) if exact else as_float
+
+
+def calculate(operation: str, a: Number, b: Number, mode: str = "", precision: int = 0) -> Number:
+    """
+    Apply one of the four basic operations under the requested precision mode.
+
+    An empty mode or precision falls back to CALCULATOR_PRECISION_MODE and
+    CALCULATOR_DECIMAL_PRECISION, so a deployment can choose its default while
+    an agent's instructions can still ask for a specific mode per call.
+
+    The tools below try the auto-mode fast path, or plain arithmetic in
+    float mode, inline before calling this, which saves a call on the
+    common case. Its operand check
+    ``a + _BOUND == _BOUND and ... b + _SNAP - _SNAP == b`` (see FAST_LIMIT)
+    raises TypeError for strings and OverflowError for ints beyond the float
+    range; both then come here.
+    """
+    mode = (mode or DEFAULT_MODE).lower()
+    if mode not in PRECISION_MODES:
+        raise ValueError(f"Invalid mode '{mode}'. Must be one of: {PRECISION_MODES}")
+
+    a, b = _parse(a), _parse(b)
+    if operation == "divide" and b == 0:
+        raise ValueError("Cannot divide by zero")
+
+    # inf and nan have no exact value; they keep the float behaviour in every mode
+    if mode == "float" or any(isinstance(x, float) and not math.isfinite(x) for x in (a, b)):
+        return OPERATORS[operation](float(a) if isinstance(a, Fraction) else a,
+                                    float(b) if isinstance(b, Fraction) else b)
+
+    # Integer arithmetic is already exact at any size
+    if isinstance(a, int) and isinstance(b, int):
+        if operation != "divide":
+            return OPERATORS[operation](a, b)
+        if a % b == 0:
+            return a // b
+
+    exact = mode != "auto"
+    if mode == "fraction":
+        return _normalize(Fraction(OPERATORS[operation](Fraction(_to_fraction(a)), _to_fraction(b))), exact)
+
+    # A fresh context, so its Inexact flag reports whether this result was rounded
+    context = Context(prec=precision or DEFAULT_PRECISION)
+    result = getattr(context, operation)(_to_decimal(a, context), _to_decimal(b, context))
+    return _normalize(result, exact, rounded=bool(context.flags[Inexact]))
+
+
 @tool
-def add(a: float, b: float) -> float:
+def add(a: float, b: float, mode: str = "", precision: int = 0) -> Union[int, float, str]:
     """
     Add two numbers together.
     
     :param a: The first number to add
     :param b: The second number to add
+    :param mode: Precision mode: auto, float, decimal or fraction (empty uses the default)
+    :param precision: Significant digits for decimal mode (0 uses the default)
     :returns: The sum of a and b
     """
-    return a + b
+    if mode in FAST_MODES:
+        try:
+            if a + _BOUND == _BOUND and b + _BOUND == _BOUND and a + _SNAP - _SNAP == a and b + _SNAP - _SNAP == b:
+                return a + b
+        except (TypeError, OverflowError):
+            pass
+    elif mode in FLOAT_MODES and isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return a + b
+    return calculate("add", a, b, mode, precision)
 
 @tool
-def subtract(a: float, b: float) -> float:
+def subtract(a: float, b: float, mode: str = "", precision: int = 0) -> Union[int, float, str]:
     """
     Subtract the second number from the first number.
     
     :param a: The number to subtract from
     :param b: The number to subtract
+    :param mode: Precision mode: auto, float, decimal or fraction (empty uses the default)
+    :param precision: Significant digits for decimal mode (0 uses the default)
     :returns: The difference of a and b
     """
-    return a - b
+    if mode in FAST_MODES:
+        try:
+            if a + _BOUND == _BOUND and b + _BOUND == _BOUND and a + _SNAP - _SNAP == a and b + _SNAP - _SNAP == b:
+                return a - b
+        except (TypeError, OverflowError):
+            pass
+    elif mode in FLOAT_MODES and isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return a - b
+    return calculate("subtract", a, b, mode, precision)
 
 @tool
-def multiply(a: float, b: float) -> float:
+def multiply(a: float, b: float, mode: str = "", precision: int = 0) -> Union[int, float, str]:
     """
     Multiply two numbers together.
     
     :param a: The first number to multiply
     :param b: The second number to multiply
+    :param mode: Precision mode: auto, float, decimal or fraction (empty uses the default)
+    :param precision: Significant digits for decimal mode (0 uses the default)
     :returns: The product of a and b
     """
-    return a * b
+    if mode in FAST_MODES:
+        try:
+            if a + _BOUND == _BOUND and b + _BOUND == _BOUND and a + _SNAP - _SNAP == a and b + _SNAP - _SNAP == b:
+                result = a * b
+                if -FAST_PRODUCT_LIMIT < result < FAST_PRODUCT_LIMIT:
+                    return result
+        except (TypeError, OverflowError):
+            pass
+    elif mode in FLOAT_MODES and isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return a * b
+    return calculate("multiply", a, b, mode, precision)
 
 @tool
-def divide(a: float, b: float) -> float:
+def divide(a: float, b: float, mode: str = "", precision: int = 0) -> Union[int, float, str]:
     """
     Divide the first number by the second number.
     
     :param a: The dividend (number to be divided)
     :param b: The divisor (number to divide by)
+    :param mode: Precision mode: auto, float, decimal or fraction (empty uses the default)
+    :param precision: Significant digits for decimal mode (0 uses the default)
     :returns: The quotient of a divided by b
     """
-    if b == 0:
-        raise ValueError("Cannot divide by zero")
-    return a / b
\ No newline at end of file
+    if mode in FAST_MODES:
+        try:
+            if a + _BOUND == _BOUND and b + _BOUND == _BOUND and a + _SNAP - _SNAP == a and b + _SNAP - _SNAP == b:
+                return a / b
+        except (TypeError, OverflowError):
+            pass
+        except ZeroDivisionError:
+            raise ValueError("Cannot divide by zero") from None
+    elif mode in FLOAT_MODES and isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        if b == 0:
+            raise ValueError("Cannot divide by zero")
+        return a / b
+    return calculate("divide", a, b, mode, precision)
\ No newline at end of file
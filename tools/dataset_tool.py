@@ -0,0 +1,271 @@
+import csv
+import math
+import mmap
+import os
+from typing import Iterator, Sequence
+
+from ibm_watsonx_orchestrate.agent_builder.tools import tool
+
+# Tools only read files under this directory; relative paths are taken
+# relative to it. Defaults to the working directory the tools run in.
+DATASET_DIR = os.environ.get("DATASET_DIR", ".")
+
+# Values are folded into the running statistics this many at a time, so the
+# working set stays bounded no matter how large the input file is.
+CHUNK_VALUES = 1 << 16
+
+# Supported binary layouts: native-endian IEEE-754 float arrays.
+BINARY_FORMATS = {"f64": "d", "f32": "f"}
+EXTENSION_FORMATS = {
+    ".csv": "csv",
+    ".f64": "f64",
+    ".bin": "f64",
+    ".f32": "f32",
+}
+
+
+class RunningStats:
+    """
+    Incremental count/sum/mean/min/max/variance over a stream of chunks.
+
+    Each chunk is summarised exactly (``math.fsum``) and merged into the
+    running state with the pairwise form of Welford's update (Chan et al.),
+    while the grand total is carried with Kahan compensation so that adding
+    millions of chunk sums does not accumulate rounding error.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._sum = 0.0
+        self._compensation = 0.0
+
+    @property
+    def total(self) -> float:
+        return self._sum + self._compensation
+
+    def update(self, chunk: Sequence[float]) -> None:
+        n = len(chunk)
+        if n == 0:
+            return
+
+        chunk_sum = math.fsum(chunk)
+        chunk_mean = chunk_sum / n
+        deviations = [x - chunk_mean for x in chunk]
+        chunk_m2 = math.fsum([d * d for d in deviations])
+
+        # Kahan-Babuska (Neumaier) summation of the chunk totals
+        t = self._sum + chunk_sum
+        if abs(self._sum) >= abs(chunk_sum):
+            self._compensation += (self._sum - t) + chunk_sum
+        else:
+            self._compensation += (chunk_sum - t) + self._sum
+        self._sum = t
+
+        # Welford / Chan merge of (count, mean, M2)
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += chunk_m2 + delta * delta * self.count * n / total
+        self.count = total
+
+        self.minimum = min(self.minimum, min(chunk))
+        self.maximum = max(self.maximum, max(chunk))
+
+    def variance(self, sample: bool = True) -> float:
+        ddof = 1 if sample else 0
+        if self.count - ddof <= 0:
+            raise ValueError("Not enough values to compute a variance")
+        return self.m2 / (self.count - ddof)
+
+    def summary(self, sample: bool = True) -> dict:
+        if self.count == 0:
+            raise ValueError("No numeric values found in the dataset")
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.mean,
+            "min": self.minimum,
+            "max": self.maximum,
+            "variance": self.variance(sample) if self.count > 1 else 0.0,
+        }
+
+
+def resolve_format(path: str, fmt: str = "auto") -> str:
+    """Map an explicit format or the file extension to 'csv', 'f64' or 'f32'."""
+    fmt = (fmt or "auto").lower()
+    if fmt == "auto":
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in EXTENSION_FORMATS:
+            raise ValueError(
+                f"Cannot infer format from '{ext or path}'. "
+                f"Use one of: {['csv'] + list(BINARY_FORMATS)}"
+            )
+        return EXTENSION_FORMATS[ext]
+    if fmt != "csv" and fmt not in BINARY_FORMATS:
+        raise ValueError(f"Invalid format '{fmt}'. Must be one of: {['auto', 'csv'] + list(BINARY_FORMATS)}")
+    return fmt
+
+
+def resolve_path(path: str, base_dir: str = "") -> str:
+    """Resolve ``path`` against ``base_dir`` (default DATASET_DIR) and refuse anything outside it."""
+    base = os.path.realpath(base_dir or DATASET_DIR)
+    resolved = os.path.realpath(os.path.join(base, path))
+    if os.path.commonpath([base, resolved]) != base:
+        raise ValueError(f"Path '{path}' is outside the dataset directory {base}")
+    return resolved
+
+
+def iter_binary_chunks(path: str, fmt: str) -> Iterator[memoryview]:
+    """Memory-map a raw float array and yield zero-copy slices of it."""
+    typecode = BINARY_FORMATS[fmt]
+    itemsize = 8 if typecode == "d" else 4
+    with open(path, "rb") as fp:
+        size = os.fstat(fp.fileno()).st_size
+        if size == 0:
+            return
+        if size % itemsize:
+            raise ValueError(f"File size {size} is not a multiple of {itemsize} bytes for format '{fmt}'")
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            view = memoryview(mm).cast(typecode)
+            try:
+                for start in range(0, len(view), CHUNK_VALUES):
+                    chunk = view[start:start + CHUNK_VALUES]
+                    try:
+                        yield chunk
+                    finally:
+                        chunk.release()
+                    # Drop pages we are done with so RSS stays flat on multi-GB files
+                    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_DONTNEED"):
+                        mm.madvise(mmap.MADV_DONTNEED, start * itemsize, CHUNK_VALUES * itemsize)
+            finally:
+                view.release()
+
+
+def iter_csv_chunks(path: str, column: str = "") -> Iterator[list]:
+    """
+    Stream one CSV column as lists of floats.
+
+    ``column`` is either a header name or a zero-based index (default 0).
+    Empty and non-numeric cells, including a header row, are skipped.
+    """
+    with open(path, "r", encoding="utf-8", newline="") as fp:
+        reader = csv.reader(fp)
+        column = (column or "").strip()
+        if column and not column.isdigit():
+            header = next(reader, None) or []
+            if column not in header:
+                raise ValueError(f"Column '{column}' not found in CSV header: {header}")
+            index = header.index(column)
+        else:
+            index = int(column or 0)
+
+        chunk = []
+        for row in reader:
+            if index >= len(row):
+                continue
+            try:
+                chunk.append(float(row[index]))
+            except ValueError:
+                continue
+            if len(chunk) >= CHUNK_VALUES:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def compute_stats(path: str, column: str = "", fmt: str = "auto") -> RunningStats:
+    """Run a single pass over the dataset at ``path``."""
+    path = resolve_path(path)
+    if not os.path.isfile(path):
+        raise ValueError(f"File not found: {path}")
+
+    fmt = resolve_format(path, fmt)
+    chunks = iter_csv_chunks(path, column) if fmt == "csv" else iter_binary_chunks(path, fmt)
+
+    stats = RunningStats()
+    for chunk in chunks:
+        stats.update(chunk)
+    if stats.count == 0:
+        raise ValueError("No numeric values found in the dataset")
+    return stats
+
+
+@tool
+def dataset_sum(path: str, column: str = "", fmt: str = "auto") -> float:
+    """
+    Sum every value in a local numeric dataset file.
+
+    :param path: Path to a CSV file or a raw float64/float32 binary file
+    :param column: CSV column name or zero-based index (ignored for binary files)
+    :param fmt: One of auto, csv, f64, f32; auto uses the file extension
+    :returns: The sum of all values
+    """
+    return compute_stats(path, column, fmt).total
+
+@tool
+def dataset_mean(path: str, column: str = "", fmt: str = "auto") -> float:
+    """
+    Compute the arithmetic mean of a local numeric dataset file.
+
+    :param path: Path to a CSV file or a raw float64/float32 binary file
+    :param column: CSV column name or zero-based index (ignored for binary files)
+    :param fmt: One of auto, csv, f64, f32; auto uses the file extension
+    :returns: The mean of all values
+    """
+    return compute_stats(path, column, fmt).mean
+
+@tool
+def dataset_min(path: str, column: str = "", fmt: str = "auto") -> float:
+    """
+    Find the smallest value in a local numeric dataset file.
+
+    :param path: Path to a CSV file or a raw float64/float32 binary file
+    :param column: CSV column name or zero-based index (ignored for binary files)
+    :param fmt: One of auto, csv, f64, f32; auto uses the file extension
+    :returns: The minimum value
+    """
+    return compute_stats(path, column, fmt).minimum
+
+@tool
+def dataset_max(path: str, column: str = "", fmt: str = "auto") -> float:
+    """
+    Find the largest value in a local numeric dataset file.
+
+    :param path: Path to a CSV file or a raw float64/float32 binary file
+    :param column: CSV column name or zero-based index (ignored for binary files)
+    :param fmt: One of auto, csv, f64, f32; auto uses the file extension
+    :returns: The maximum value
+    """
+    return compute_stats(path, column, fmt).maximum
+
+@tool
+def dataset_variance(path: str, column: str = "", fmt: str = "auto", sample: bool = True) -> float:
+    """
+    Compute the variance of a local numeric dataset file.
+
+    :param path: Path to a CSV file or a raw float64/float32 binary file
+    :param column: CSV column name or zero-based index (ignored for binary files)
+    :param fmt: One of auto, csv, f64, f32; auto uses the file extension
+    :param sample: Use the sample variance (n - 1) when true, population variance (n) when false
+    :returns: The variance of all values
+    """
+    return compute_stats(path, column, fmt).variance(sample)
+
+@tool
+def dataset_summary(path: str, column: str = "", fmt: str = "auto") -> dict:
+    """
+    Compute count, sum, mean, min, max and sample variance in a single pass.
+
+    :param path: Path to a CSV file or a raw float64/float32 binary file
+    :param column: CSV column name or zero-based index (ignored for binary files)
+    :param fmt: One of auto, csv, f64, f32; auto uses the file extension
+    :returns: A dictionary with count, sum, mean, min, max and variance
+    """
+    return compute_stats(path, column, fmt).summary()
@@ -7,9 +7,13 @@ Validates agent configuration files before import
 import yaml
 import sys
 import argparse
+import importlib.util
+import re
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+from profiling import add_profile_arguments, phase, profile_session
+
 class AgentValidator:
     """Validates watsonx Orchestrate agent YAML configurations"""
     
@@ -25,6 +29,13 @@ class AgentValidator:
     # Valid auth schemes for external agents
     VALID_AUTH_SCHEMES = ['BEARER_TOKEN', 'API_KEY', 'NONE']
     
+    # Valid context_policy modes (see context_store.py)
+    VALID_CONTEXT_MODES = ['stateless', 'window', 'full']
+    
+    # Message matchers and the only template placeholder for fast_path (see fast_path.py)
+    VALID_FAST_PATH_OPERATORS = ['contains_word', 'contains', 'regex']
+    FAST_PATH_PLACEHOLDER = '{input}'
+    
     # Valid LLM formats (basic validation)
     VALID_LLM_PROVIDERS = ['watsonx', 'openai', 'anthropic']
     
@@ -56,9 +67,11 @@ class AgentValidator:
                 return False
             
             # Load YAML content
-            with open(file_path, 'r', encoding='utf-8') as file:
+            with phase('load'), open(file_path, 'r', encoding='utf-8') as file:
+                content = file.read()
+            with phase('parse'):
                 try:
-                    agent_config = yaml.safe_load(file)
+                    agent_config = yaml.safe_load(content)
                 except yaml.YAMLError as e:
                     self.errors.append(f"Invalid YAML syntax: {e}")
                     return False
@@ -70,12 +83,13 @@ class AgentValidator:
             # Validate based on agent kind
             kind = agent_config.get('kind', '').lower()
             
-            if kind == 'native':
-                self._validate_native_agent(agent_config)
-            elif kind == 'external':
-                self._validate_external_agent(agent_config)
-            else:
-                self.errors.append(f"Invalid or missing 'kind'. Must be one of: {self.VALID_KINDS}")
+            with phase('validate'):
+                if kind == 'native':
+                    self._validate_native_agent(agent_config)
+                elif kind == 'external':
+                    self._validate_external_agent(agent_config)
+                else:
+                    self.errors.append(f"Invalid or missing 'kind'. Must be one of: {self.VALID_KINDS}")
             
             return len(self.errors) == 0
             
@@ -139,6 +153,105 @@ class AgentValidator:
         context_vars = config.get('context_variables', [])
         if context_vars is not None and not isinstance(context_vars, list):
             self.errors.append("'context_variables' must be a list")
+        
+        # Validate context_policy (if present)
+        self._validate_context_policy(config.get('context_policy'))
+        
+        # Validate fast_path (if present)
+        self._validate_fast_path(config.get('fast_path'), config.get('instructions') or '')
+    
+    def _validate_context_policy(self, policy: Optional[Dict[str, Any]]) -> None:
+        """Validate how much conversation history the agent receives"""
+        if policy is None:
+            return
+        
+        if not isinstance(policy, dict):
+            self.errors.append("'context_policy' must be a dictionary")
+            return
+        
+        mode = policy.get('mode', 'full')
+        if mode not in self.VALID_CONTEXT_MODES:
+            self.errors.append(f"Invalid context_policy mode '{mode}'. Must be one of: {self.VALID_CONTEXT_MODES}")
+        
+        for field in ['max_turns', 'max_tokens']:
+            value = policy.get(field)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 1):
+                self.errors.append(f"context_policy '{field}' must be a positive integer")
+        
+        if mode == 'window' and 'max_turns' not in policy:
+            self.errors.append("context_policy mode 'window' requires 'max_turns'")
+        elif mode != 'window' and 'max_turns' in policy:
+            self.warnings.append(f"context_policy 'max_turns' is ignored in mode '{mode}'")
+    
+    def _validate_fast_path(self, fast_path: Optional[Dict[str, Any]], instructions: str) -> None:
+        """Validate the deterministic fast path and check its templates against the instructions"""
+        if fast_path is None:
+            return
+        
+        if not isinstance(fast_path, dict):
+            self.errors.append("'fast_path' must be a dictionary")
+            return
+        
+        handler = fast_path.get('handler')
+        rules = fast_path.get('rules') or []
+        if handler is not None:
+            if rules or 'default' in fast_path:
+                self.errors.append("fast_path 'handler' cannot be combined with 'rules' or 'default'")
+            if not isinstance(handler, str) or not re.fullmatch(r"[\w.]+:\w+", handler):
+                self.errors.append("fast_path 'handler' must look like 'module:function'")
+            else:
+                module = handler.split(':')[0]
+                try:
+                    # find_spec imports parent packages of a dotted name and raises if they are missing
+                    found = importlib.util.find_spec(module) is not None
+                except (ImportError, ValueError):
+                    found = False
+                if not found:
+                    self.warnings.append(f"fast_path handler module '{module}' not found")
+            return
+        
+        if not isinstance(rules, list):
+            self.errors.append("fast_path 'rules' must be a list")
+            return
+        if not rules and 'default' not in fast_path:
+            self.errors.append("fast_path needs 'rules', 'default' or 'handler'")
+        
+        templates = []
+        for i, rule in enumerate(rules):
+            operators = [op for op in self.VALID_FAST_PATH_OPERATORS if isinstance(rule, dict) and op in rule]
+            if len(operators) != 1:
+                self.errors.append(f"fast_path rule {i} needs exactly one of: {self.VALID_FAST_PATH_OPERATORS}")
+                continue
+            value = str(rule[operators[0]])
+            if operators[0] == 'regex':
+                try:
+                    re.compile(value)
+                except re.error as e:
+                    self.errors.append(f"fast_path rule {i} has an invalid regex: {e}")
+            elif value.lower() not in instructions.lower():
+                self.warnings.append(f"fast_path rule {i} matches '{value}', which the instructions never mention")
+            if not isinstance(rule.get('respond'), str):
+                self.errors.append(f"fast_path rule {i} needs a 'respond' template")
+            else:
+                templates.append(rule['respond'])
+        
+        if 'default' in fast_path:
+            if isinstance(fast_path['default'], str):
+                templates.append(fast_path['default'])
+            else:
+                self.errors.append("fast_path 'default' must be a string")
+        
+        # Every fixed part of a template must be what the instructions tell the model to say
+        normalized = ' '.join(instructions.split())
+        for template in templates:
+            placeholders = set(re.findall(r"\{[^{}]*\}", template)) - {self.FAST_PATH_PLACEHOLDER}
+            if placeholders:
+                self.errors.append(f"fast_path template uses unknown placeholders {sorted(placeholders)}; "
+                                   f"only {self.FAST_PATH_PLACEHOLDER} is supported")
+            for fragment in template.split(self.FAST_PATH_PLACEHOLDER):
+                fragment = ' '.join(fragment.split())
+                if fragment and fragment not in normalized:
+                    self.errors.append(f"fast_path template text '{fragment}' does not appear in the instructions")
     
     def _validate_external_agent(self, config: Dict[str, Any]) -> None:
         """Validate external agent configuration"""
@@ -273,12 +386,16 @@ Examples:
   python validate_agent.py agent.yaml
   python validate_agent.py my_agents/greeting_agent.yaml
   python validate_agent.py -v agent.yaml  # verbose output
+  python validate.py agents/*.yaml         # several files in one run
+  python validate.py --profile agents/*.yaml  # write profiles to ./profiles
         """
     )
     
     parser.add_argument(
-        'file_path',
-        help='Path to the agent YAML file to validate'
+        'file_paths',
+        nargs='+',
+        metavar='file_path',
+        help='Path(s) to the agent YAML file(s) to validate'
     )
     
     parser.add_argument(
@@ -287,28 +404,37 @@ Examples:
         help='Enable verbose output'
     )
     
-    args = parser.parse_args()
-    
-    # Create validator and run validation
-    validator = AgentValidator()
-    
-    if args.verbose:
-        print(f"🔍 Validating agent file: {args.file_path}")
-        print("-" * 50)
-    
-    is_valid = validator.validate_file(args.file_path)
+    add_profile_arguments(parser)
     
-    # Print results
-    validator.print_results()
+    args = parser.parse_args()
     
-    if args.verbose:
-        print("-" * 50)
-        print(f"📊 Summary: {'VALID' if is_valid else 'INVALID'}")
-        print(f"   Errors: {len(validator.errors)}")
-        print(f"   Warnings: {len(validator.warnings)}")
+    all_valid = True
+    with profile_session('validate', args):
+        for i, file_path in enumerate(args.file_paths):
+            # Create validator and run validation
+            validator = AgentValidator()
+            
+            if i:
+                print()
+            if args.verbose or len(args.file_paths) > 1:
+                print(f"🔍 Validating agent file: {file_path}")
+                print("-" * 50)
+            
+            is_valid = validator.validate_file(file_path)
+            all_valid = all_valid and is_valid
+            
+            # Print results
+            with phase('print'):
+                validator.print_results()
+                
+                if args.verbose:
+                    print("-" * 50)
+                    print(f"📊 Summary: {'VALID' if is_valid else 'INVALID'}")
+                    print(f"   Errors: {len(validator.errors)}")
+                    print(f"   Warnings: {len(validator.warnings)}")
     
     # Exit with appropriate code
-    sys.exit(0 if is_valid else 1)
+    sys.exit(0 if all_valid else 1)
 
 
 if __name__ == "__main__":